@@ -4,13 +4,17 @@ import re
 import warnings
 from typing import Dict, List, Literal, Union
 
-from parsons import Table
 from parsons.utilities import check_env
 from parsons.utilities.api_connector import APIConnector
+from parsons.utilities.paginator import PageNumberPaginator
 
 logger = logging.getLogger(__name__)
 
 API_URL = "https://actionnetwork.org/api/v2"
+# Action Network allows 4 requests per second
+API_RATE_LIMIT = 4
+# Number of pages of a list requested at the same time
+PAGE_WORKERS = 4
 
 
 class ActionNetwork(object):
@@ -27,16 +31,20 @@ class ActionNetwork(object):
             "OSDI-API-Token": self.api_token,
         }
         self.api_url = API_URL
-        self.api = APIConnector(self.api_url, headers=self.headers)
+        self.api = APIConnector(self.api_url, headers=self.headers, rate_limit=API_RATE_LIMIT)
 
-    def _get_page(self, object_name, page, per_page=25, filter=None):
-        # returns data from one page of results
+    def _per_page(self, per_page):
         if per_page > 25:
             per_page = 25
             logger.info(
                 "Action Network's API will not return more than 25 entries per page. \
             Changing per_page parameter to 25."
             )
+        return per_page
+
+    def _get_page(self, object_name, page, per_page=25, filter=None):
+        # returns data from one page of results
+        per_page = self._per_page(per_page)
         params = {"page": page, "per_page": per_page, "filter": filter}
         return self.api.get_request(url=object_name, params=params)
 
@@ -46,20 +54,20 @@ class ActionNetwork(object):
         # event_campaigns, campaigns, advocacy_campaigns, signatures, attendances, submissions,
         # donations and outreaches.
         # See Action Network API docs for more info: https://actionnetwork.org/docs/v2/
-        count = 0
-        page = 1
-        return_list = []
-        while True:
-            response = self._get_page(object_name, page, per_page, filter=filter)
-            page = page + 1
-            response_list = response["_embedded"][list(response["_embedded"])[0]]
-            if not response_list:
-                return Table(return_list)
-            return_list.extend(response_list)
-            count = count + len(response_list)
-            if limit:
-                if count >= limit:
-                    return Table(return_list[0:limit])
+        per_page = self._per_page(per_page)
+
+        paginator = PageNumberPaginator(
+            self.api,
+            object_name,
+            params={"filter": filter},
+            page_size=per_page,
+            data_key=lambda response: response["_embedded"][list(response["_embedded"])[0]],
+            # A limit of 0 means no limit
+            limit=limit or None,
+            total_pages_key="total_pages",
+            max_workers=PAGE_WORKERS,
+        )
+        return paginator.to_table()
 
     # Advocacy Campaigns
     def get_advocacy_campaigns(self, limit=None, per_page=25, page=None, filter=None):
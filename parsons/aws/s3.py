@@ -1,14 +1,22 @@
 import logging
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 
 import boto3
-from botocore.client import ClientError
+from boto3.s3.transfer import TransferConfig
+from botocore.client import ClientError, Config
 
 from parsons.utilities import files
 
 logger = logging.getLogger(__name__)
 
+# Number of files moved at the same time by the batched transfer methods
+S3_TRANSFER_WORKERS = 10
+
+# The max number of objects S3 deletes in one request
+S3_DELETE_BATCH_SIZE = 1000
+
 
 class AWSConnection(object):
     def __init__(
@@ -61,6 +69,15 @@ class S3(object):
             Controls use of the ``AWS_SESSION_TOKEN`` environment variable. Defaults
             to ``True``. Set to ``False`` in order to ignore the ``AWS_SESSION_TOKEN`` environment
             variable even if the ``aws_session_token`` argument was not passed in.
+        multipart_chunksize: int
+            The size in bytes of each part of a multipart upload, download or copy. Files
+            larger than this are transferred in parts. Defaults to 8 MB.
+        max_concurrency: int
+            The max number of parts of a single file transferred at the same time. Defaults
+            to 10.
+        max_workers: int
+            The max number of files transferred at the same time by the batched methods
+            (e.g. ``put_files``, ``get_files`` and ``transfer_bucket``).
 
     `Returns:`
         S3 class.
@@ -72,6 +89,9 @@ class S3(object):
         aws_secret_access_key=None,
         aws_session_token=None,
         use_env_token=True,
+        multipart_chunksize=None,
+        max_concurrency=None,
+        max_workers=S3_TRANSFER_WORKERS,
     ):
         self.aws = AWSConnection(
             aws_access_key_id=aws_access_key_id,
@@ -80,7 +100,23 @@ class S3(object):
             use_env_token=use_env_token,
         )
 
-        self.s3 = self.aws.session.resource("s3")
+        transfer_args = {}
+        if multipart_chunksize:
+            transfer_args["multipart_threshold"] = multipart_chunksize
+            transfer_args["multipart_chunksize"] = multipart_chunksize
+        if max_concurrency:
+            transfer_args["max_concurrency"] = max_concurrency
+
+        self.transfer_config = TransferConfig(**transfer_args)
+        """Boto3 TransferConfig used for all uploads, downloads and copies."""
+
+        self.max_workers = max_workers
+
+        # Allow enough connections for every part of every file being moved at once
+        max_pool_connections = max_workers * self.transfer_config.max_concurrency
+        self.s3 = self.aws.session.resource(
+            "s3", config=Config(max_pool_connections=max_pool_connections)
+        )
         """Boto3 API Session Resource object. Use for more advanced boto3 features."""
 
         self.client = self.s3.meta.client
@@ -289,7 +325,35 @@ class S3(object):
                 info.
         """
 
-        self.client.upload_file(local_path, bucket, key, ExtraArgs={"ACL": acl, **kwargs})
+        self.client.upload_file(
+            local_path,
+            bucket,
+            key,
+            ExtraArgs={"ACL": acl, **kwargs},
+            Config=self.transfer_config,
+        )
+
+    def put_files(self, bucket, local_paths, acl="bucket-owner-full-control", **kwargs):
+        """
+        Uploads many objects to an S3 bucket, several at a time.
+
+        `Args:`
+            bucket: str
+                The bucket name
+            local_paths: dict
+                A dictionary mapping each object key to the local path of the file to upload
+            acl: str
+                The S3 permissions on the files
+            kwargs:
+                Additional arguments for the S3 API call. See :meth:`put_file`.
+        """
+
+        self._map_files(
+            lambda key: self.put_file(bucket, key, local_paths[key], acl=acl, **kwargs),
+            local_paths,
+        )
+
+        logger.info(f"Uploaded {len(local_paths)} files to {bucket}")
 
     def remove_file(self, bucket, key):
         """
@@ -306,6 +370,40 @@ class S3(object):
 
         self.client.delete_object(Bucket=bucket, Key=key)
 
+    def remove_files(self, bucket, keys):
+        """
+        Deletes many objects from an S3 bucket, up to 1,000 per request.
+
+        `Args:`
+            bucket: str
+                The bucket name
+            keys: list
+                The object keys
+        `Returns:`
+            ``None``
+        """
+
+        keys = list(keys)
+        batches = [
+            keys[i : i + S3_DELETE_BATCH_SIZE] for i in range(0, len(keys), S3_DELETE_BATCH_SIZE)
+        ]
+
+        def remove_batch(batch):
+            resp = self.client.delete_objects(
+                Bucket=bucket,
+                Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+            )
+            errors = resp.get("Errors")
+            if errors:
+                raise RuntimeError(
+                    f"Failed to delete {len(errors)} objects from {bucket}: "
+                    f"{errors[0]['Key']} ({errors[0]['Code']}: {errors[0]['Message']})"
+                )
+
+        self._map_files(remove_batch, batches)
+
+        logger.info(f"Deleted {len(keys)} files from {bucket}")
+
     def get_file(self, bucket, key, local_path=None, **kwargs):
         """
         Download an object from S3 to a local file
@@ -332,10 +430,48 @@ class S3(object):
         if not local_path:
             local_path = files.create_temp_file_for_path(key)
 
-        self.s3.Object(bucket, key).download_file(local_path, ExtraArgs=kwargs)
+        self.client.download_file(
+            bucket, key, local_path, ExtraArgs=kwargs, Config=self.transfer_config
+        )
 
         return local_path
 
+    def get_files(self, bucket, keys, **kwargs):
+        """
+        Download many objects from S3 to local files, several at a time.
+
+        `Args:`
+            bucket: str
+                The bucket name
+            keys: list or dict
+                The object keys to download to temporary files, which will be removed
+                automatically when the script is done running. Or a dictionary mapping each
+                object key to the local path where it will be downloaded.
+            kwargs:
+                Additional arguments for the S3 API call. See :meth:`get_file`.
+
+        `Returns:`
+            dict
+                A dictionary mapping each object key to the path of its new file
+        """
+
+        local_paths = keys if isinstance(keys, dict) else dict.fromkeys(keys)
+
+        paths = self._map_files(
+            lambda key: self.get_file(bucket, key, local_path=local_paths[key], **kwargs),
+            local_paths,
+        )
+
+        logger.info(f"Downloaded {len(paths)} files from {bucket}")
+
+        return dict(zip(local_paths, paths))
+
+    def _map_files(self, func, keys):
+        # Call func on each key on a pool of threads, returning the results in order. The
+        # boto3 client (unlike the resource) is safe to share between threads.
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(func, keys))
+
     def get_url(self, bucket, key, expires_in=3600):
         """
         Generates a presigned url for an s3 object.
@@ -419,7 +555,7 @@ class S3(object):
         else:
             key_list = [origin_key]
 
-        for key in key_list:
+        def transfer_key(key):
             # If destination_key is prefix, replace
             if destination_key and destination_key.endswith("/"):
                 dest_key = key.replace(origin_key, destination_key)
@@ -433,16 +569,26 @@ class S3(object):
                 dest_key = key
 
             copy_source = {"Bucket": origin_bucket, "Key": key}
-            self.client.copy(copy_source, destination_bucket, dest_key, ExtraArgs=kwargs)
+            self.client.copy(
+                copy_source,
+                destination_bucket,
+                dest_key,
+                ExtraArgs=kwargs,
+                Config=self.transfer_config,
+            )
             if remove_original:
                 try:
-                    self.remove_file(origin_bucket, origin_key)
+                    self.remove_file(origin_bucket, key)
                 except Exception as e:
                     logger.error("Failed to delete original key: " + str(e))
 
             if public_read:
-                object_acl = self.s3.ObjectAcl(destination_bucket, destination_key)
-                object_acl.put(ACL="public-read")
+                self.client.put_object_acl(
+                    Bucket=destination_bucket, Key=dest_key, ACL="public-read"
+                )
+
+        # Keys are copied within S3, several at a time
+        self._map_files(transfer_key, key_list)
 
         logger.info(f"Finished syncing {len(key_list)} keys")
 
@@ -0,0 +1,222 @@
+import bz2
+import gzip
+import io
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+import petl
+from botocore.client import ClientError
+
+from parsons.utilities import files
+
+logger = logging.getLogger(__name__)
+
+# Size of each ranged request when streaming an S3 object
+S3_STREAM_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+class S3RangeReader(io.RawIOBase):
+    """
+    A read-only binary stream of an S3 object, downloaded in ranged requests.
+
+    The next range is requested in the background as soon as the previous one arrives, so
+    the download keeps going while the current range is being read.
+
+    `Args:`
+        client: boto3 S3 client
+            The client to use for the requests
+        bucket: str
+            The bucket name
+        key: str
+            The object key
+        chunk_size: int
+            The number of bytes requested at a time
+    """
+
+    def __init__(self, client, bucket, key, chunk_size=S3_STREAM_CHUNK_SIZE):
+        self.client = client
+        self.bucket = bucket
+        self.key = key
+        self.chunk_size = chunk_size
+
+        self._buffer = b""
+        self._position = 0
+        # Offset in the object of the end of the buffer
+        self._offset = 0
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._next_range = self._executor.submit(self._get_range, 0)
+
+    def _get_range(self, start):
+        # Returns the bytes of the range and the size of the whole object
+        try:
+            resp = self.client.get_object(
+                Bucket=self.bucket,
+                Key=self.key,
+                Range=f"bytes={start}-{start + self.chunk_size - 1}",
+            )
+        except ClientError as e:
+            # Requesting a range of an empty object fails
+            if e.response.get("Error", {}).get("Code") == "InvalidRange":
+                return b"", 0
+            raise
+
+        size = int(resp["ContentRange"].rsplit("/", 1)[1])
+        return resp["Body"].read(), size
+
+    @property
+    def exhausted(self):
+        """
+        Whether every byte of the object has been read.
+        """
+
+        return self._next_range is None and self._position >= len(self._buffer)
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        if self._position >= len(self._buffer):
+            if self._next_range is None:
+                return 0
+
+            self._buffer, size = self._next_range.result()
+            self._position = 0
+            self._offset += len(self._buffer)
+
+            self._next_range = None
+            if self._offset < size:
+                self._next_range = self._executor.submit(self._get_range, self._offset)
+
+            if not self._buffer:
+                return 0
+
+        data = self._buffer[self._position : self._position + len(b)]
+        b[: len(data)] = data
+        self._position += len(data)
+
+        return len(data)
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._next_range = None
+        self._buffer = b""
+        super().close()
+
+
+class S3Source:
+    """
+    A petl source that streams an S3 object, rather than downloading it to a file first.
+
+    Gzip and bzip2 compressed objects (by their key's extension) are decompressed on the
+    fly. Pass the source to a petl reader, e.g. ``petl.fromcsv(S3Source(...))``.
+
+    `Args:`
+        client: boto3 S3 client
+            The client to use for the requests
+        bucket: str
+            The bucket name
+        key: str
+            The object key
+        chunk_size: int
+            The number of bytes requested at a time
+        next_source: S3Source
+            (Optional) The source that will be read after this one. Its first range is
+            requested as soon as this source is opened, and dropped if this source isn't
+            read to the end.
+    """
+
+    def __init__(self, client, bucket, key, chunk_size=S3_STREAM_CHUNK_SIZE, next_source=None):
+        self.client = client
+        self.bucket = bucket
+        self.key = key
+        self.chunk_size = chunk_size
+        self.next_source = next_source
+
+        self._prefetched = None
+
+    def prefetch(self):
+        """
+        Start downloading the object, ahead of opening it.
+        """
+
+        if self._prefetched is None:
+            self._prefetched = S3RangeReader(self.client, self.bucket, self.key, self.chunk_size)
+
+    def cancel_prefetch(self):
+        """
+        Stop downloading the object, if it was prefetched and hasn't been opened.
+        """
+
+        if self._prefetched is not None:
+            self._prefetched.close()
+            self._prefetched = None
+
+    @contextmanager
+    def open(self, mode="r"):
+        if not mode.startswith("r"):
+            raise ValueError("S3Source is read-only")
+
+        raw, self._prefetched = self._prefetched, None
+        if raw is None:
+            raw = S3RangeReader(self.client, self.bucket, self.key, self.chunk_size)
+
+        logger.debug(f"Streaming s3://{self.bucket}/{self.key}")
+
+        if self.next_source:
+            self.next_source.prefetch()
+
+        stream = io.BufferedReader(raw, buffer_size=self.chunk_size)
+        if files.is_gzip_path(self.key):
+            stream = gzip.GzipFile(fileobj=stream)
+        elif self.key.endswith(".bz2"):
+            stream = bz2.BZ2File(stream)
+
+        try:
+            yield stream
+        finally:
+            # The read stopped early (e.g. after the header), so the next source may never
+            # be opened
+            if self.next_source and not raw.exhausted:
+                self.next_source.cancel_prefetch()
+
+            stream.close()
+            raw.close()
+
+
+class ChainedView(petl.Table):
+    """
+    A petl table of several tables with the same columns, read one after the other.
+
+    Unlike ``petl.cat``, which opens every table as soon as it is iterated, each table is
+    only opened once the one before it has been read, so a table of many S3 keys only
+    streams one key at a time (and prefetches the next one). The header is read from the
+    first table, and the header row of each later table is skipped.
+
+    `Args:`
+        tables: list
+            The petl tables to read
+    """
+
+    def __init__(self, tables):
+        self.tables = tables
+
+    def __iter__(self):
+        header = None
+        for table in self.tables:
+            rows = iter(table)
+            try:
+                table_header = next(rows, None)
+                if table_header is None:
+                    # An empty file, without even a header
+                    continue
+
+                if header is None:
+                    header = table_header
+                    yield header
+
+                yield from rows
+            finally:
+                # Closes the table's file if the read stopped early
+                if hasattr(rows, "close"):
+                    rows.close()
@@ -1,9 +1,17 @@
+import functools
 import logging
+from collections import defaultdict
+from itertools import islice, zip_longest
+
+import petl
 
 import parsons.databases.database.constants as consts
 
 logger = logging.getLogger(__name__)
 
+# Number of rows profiled at a time when inferring column types
+PROFILE_BATCH_SIZE = 10000
+
 
 class DatabaseCreateStatement:
     def __init__(self):
@@ -171,6 +179,154 @@ class DatabaseCreateStatement:
 
         return result
 
+    @staticmethod
+    def _distinct_values(values):
+        # Distinct values, ordered by their last occurrence. Values are keyed by their type
+        # as well so that 1, 1.0 and True are kept apart.
+        values = list(values)
+        try:
+            keys = dict.fromkeys(zip(map(type, reversed(values)), reversed(values)))
+        except TypeError:
+            # Unhashable values (e.g. lists and dicts) are checked one by one
+            return values
+
+        return [value for _, value in reversed(keys)]
+
+    def _max_width(self, values):
+        # The width of the widest value once loaded, in bytes. The widest int is always
+        # either the smallest or the largest one.
+        ints = [value for value in values if type(value) is int]
+        if len(ints) > 2:
+            values = [value for value in values if type(value) is not int]
+            values += [min(ints), max(ints)]
+
+        return max(map(len, map(str.encode, map(str, values))), default=0)
+
+    def _detect_distinct_type(self, values, cmp_type=None):
+        # Fold ``detect_data_type`` over the distinct values of a column, as ordered by
+        # ``_distinct_values``. Apart from booleans (the last boolean always resets the
+        # type) every value's contribution is independent of order, so each group of
+        # values can be settled with a single check: strings must all be valid numbers,
+        # ints only need their smallest and largest value, and any float makes a float.
+        if cmp_type == self.VARCHAR:
+            return cmp_type
+
+        by_type = defaultdict(list)
+        for value in values:
+            by_type[type(value)].append(value)
+
+        if bool in by_type:
+            return functools.reduce(lambda t, v: self.detect_data_type(v, t), values, cmp_type)
+
+        if not all(map(self.is_valid_sql_num, by_type.pop(str, []))):
+            return self.VARCHAR
+
+        ints = by_type.pop(int, [])
+        representatives = [min(ints), max(ints)] if ints else []
+        representatives += by_type.pop(float, [])[:1]
+        for others in by_type.values():
+            representatives += others
+
+        return functools.reduce(lambda t, v: self.detect_data_type(v, t), representatives, cmp_type)
+
+    def detect_column_type(self, values, cmp_type=None):
+        """Detect the type of a column from its values.
+
+        Gives the same result as calling ``detect_data_type`` on each value in turn, but
+        only checks each distinct value once, and settles whole groups of numbers at a time.
+
+        `Args`:
+            values: iterable
+                The values of the column.
+            cmp_type: str
+                The string representation of a type to compare with the column's type.
+        `Returns`:
+            str
+                The string representation of the column's type.
+        """
+        return self._detect_distinct_type(self._distinct_values(values), cmp_type)
+
+    def _profile_rows(self, rows, types, widths, null_values, batch_size):
+        # Update the column types and widths in place, one batch of rows at a time
+        rows = iter(rows)
+
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
+
+            # Short rows are padded with None, and long rows are truncated
+            columns = list(zip_longest(*batch))[: len(types)]
+            columns += [(None,) * len(batch)] * (len(types) - len(columns))
+
+            for i, column in enumerate(columns):
+                values = self._distinct_values(column)
+
+                widths[i] = max(widths[i], self._max_width(values))
+
+                if types[i] != self.VARCHAR:
+                    values = [value for value in values if value not in null_values]
+                    types[i] = self._detect_distinct_type(values, types[i])
+
+    def profile_columns(
+        self,
+        tbl,
+        null_values=(),
+        sample_size=None,
+        verify_sample=False,
+        batch_size=PROFILE_BATCH_SIZE,
+    ):
+        """Infer the type and width of each column in a table.
+
+        The table is read in batches of rows, and each column of a batch is profiled as a
+        whole; see ``detect_column_type``.
+
+        To profile a large table faster, pass a ``sample_size`` to only profile its first
+        rows. With ``verify_sample`` the rest of the table is then read as well, so the
+        result is always correct, but the slower type checks are skipped for any column that
+        the sample already showed to be a varchar.
+
+        `Args`:
+            tbl: Parsons Table
+                The table to profile.
+            null_values: tuple
+                Values that are ignored when detecting a column's type, e.g. ``("NA", "")``.
+            sample_size: int
+                (Optional) The number of rows to profile. Defaults to every row.
+            verify_sample: bool
+                Whether to check the rest of the table against the types found in the
+                sample, widening them where needed.
+            batch_size: int
+                The number of rows to profile at a time.
+        `Returns`:
+            list
+                A dict for each column, with its ``name``, ``type`` and ``width``. The type
+                is ``None`` if the column had no typed values.
+        """
+        types = [None] * len(tbl.columns)
+        widths = [0] * len(tbl.columns)
+
+        rows = iter(petl.data(tbl.table))
+        sample = rows if sample_size is None else islice(rows, sample_size)
+
+        self._profile_rows(sample, types, widths, null_values, batch_size)
+
+        if sample_size is not None and verify_sample:
+            sampled_types = list(types)
+            self._profile_rows(rows, types, widths, null_values, batch_size)
+
+            for col, sampled_type, col_type in zip(tbl.columns, sampled_types, types):
+                if sampled_type != col_type:
+                    logger.info(
+                        f"Sample of {sample_size} rows detected {col} as {sampled_type}; "
+                        f"widened to {col_type}."
+                    )
+
+        return [
+            {"name": col, "type": col_type, "width": width}
+            for col, col_type, width in zip(tbl.columns, types, widths)
+        ]
+
     def format_column(self, col, index="", replace_chars=None, col_prefix="_"):
         """Format the column to meet database contraints.
 
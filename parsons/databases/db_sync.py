@@ -1,4 +1,9 @@
 import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 
 from parsons.etl.table import Table
 
@@ -24,6 +29,26 @@ class DBSync:
         retries: int
             The number of times to retry if there is an error processing a
             chunk of data. The default value is 0.
+        keyset_pagination: bool
+            If ``True`` (the default), tables that are synced in a known order (an ``order_by``
+            column for full syncs, or the primary key for incremental syncs) are read in
+            chunks of ``WHERE column > last_value ORDER BY column LIMIT n`` rather than with
+            ``OFFSET``. This keeps the source database from rescanning every earlier row for
+            each chunk. If the column is not unique or has NULL values, full syncs fall back
+            to ``OFFSET``.
+        pipelined: bool
+            If ``True``, read from the source and write to the destination at the same time.
+            Chunks read from the source are handed to writer threads through a bounded queue,
+            so a sync takes roughly as long as the slower of the two sides rather than the sum
+            of both. Retries apply to each chunk read or written. Defaults to ``False``.
+        queue_depth: int
+            In pipelined mode, the maximum number of write chunks waiting to be written. Each
+            waiting chunk is held locally, so this bounds memory and disk use.
+            Defaults to 2.
+        writer_threads: int
+            In pipelined mode, the number of chunks to write to the destination at once.
+            With more than one writer, chunks may land out of order, so a failed incremental
+            sync can leave gaps below the destination's maximum primary key. Defaults to 1.
     `Returns:`
         A DBSync object.
     """
@@ -35,12 +60,24 @@ class DBSync:
         read_chunk_size=100_000,
         write_chunk_size=None,
         retries=0,
+        keyset_pagination=True,
+        pipelined=False,
+        queue_depth=2,
+        writer_threads=1,
     ):
         self.source_db = source_db
         self.dest_db = destination_db
         self.read_chunk_size = read_chunk_size
         self.write_chunk_size = write_chunk_size or read_chunk_size
         self.retries = retries
+        self.keyset_pagination = keyset_pagination
+        self.pipelined = pipelined
+        self.queue_depth = queue_depth
+        self.writer_threads = writer_threads
+
+        # Limits on concurrent reads and writes, set while syncing many tables at once
+        self._source_slots = nullcontext()
+        self._destination_slots = nullcontext()
 
     def table_sync_full(
         self,
@@ -74,7 +111,8 @@ class DBSync:
             **kwargs: args
                 Optional copy arguments for destination database.
         `Returns:`
-            ``None``
+            int
+                The number of rows copied
         """
 
         # Create the table objects
@@ -83,34 +121,38 @@ class DBSync:
 
         logger.info(f"Syncing full table data from {source_table} to {destination_table}")
 
-        # Drop or truncate if the destination table exists
-        if destination_tbl.exists:
-            if if_exists == "drop":
-                destination_tbl.drop()
-            elif if_exists == "truncate":
-                self._check_column_match(source_tbl, destination_tbl)
-                destination_tbl.truncate()
-            elif if_exists == "drop_if_needed":
-                try:
+        with self._source_slots, self._destination_slots:
+            # Drop or truncate if the destination table exists
+            if destination_tbl.exists:
+                if if_exists == "drop":
+                    destination_tbl.drop()
+                elif if_exists == "truncate":
                     self._check_column_match(source_tbl, destination_tbl)
                     destination_tbl.truncate()
-                except Exception:
-                    logger.info(f"needed to drop {destination_tbl}...")
-                    destination_tbl.drop()
-            else:
-                raise ValueError("Invalid if_exists argument. Must be drop or truncate.")
+                elif if_exists == "drop_if_needed":
+                    try:
+                        self._check_column_match(source_tbl, destination_tbl)
+                        destination_tbl.truncate()
+                    except Exception:
+                        logger.info(f"needed to drop {destination_tbl}...")
+                        destination_tbl.drop()
+                else:
+                    raise ValueError("Invalid if_exists argument. Must be drop or truncate.")
 
-        # Create the table, if needed.
-        if not destination_tbl.exists:
-            self.create_table(source_table, destination_table)
+            # Create the table, if needed.
+            if not destination_tbl.exists:
+                self.create_table(source_table, destination_table)
 
         copied_rows = self.copy_rows(source_table, destination_table, None, order_by, **kwargs)
 
         if verify_row_count:
-            self._row_count_verify(source_tbl, destination_tbl)
+            with self._source_slots, self._destination_slots:
+                self._row_count_verify(source_tbl, destination_tbl)
 
         logger.info(f"{source_table} synced: {copied_rows} total rows copied.")
 
+        return copied_rows
+
     def table_sync_incremental(
         self,
         source_table,
@@ -141,7 +183,8 @@ class DBSync:
             **kwargs: args
                 Optional copy arguments for destination database.
         `Returns:`
-            ``None``
+            int
+                The number of rows copied
         """
 
         # Create the table objects
@@ -150,42 +193,47 @@ class DBSync:
 
         # Check that the destination table exists. If it does not, then run a
         # full sync instead.
-        if not destination_tbl.exists:
+        with self._destination_slots:
+            destination_exists = destination_tbl.exists
+
+        if not destination_exists:
             logger.info(
                 "Destination tables %s does not exist, running a full sync",
                 destination_table,
             )
-            self.table_sync_full(
+            return self.table_sync_full(
                 source_table,
                 destination_table,
                 order_by=primary_key,
                 verify_row_count=verify_row_count,
                 **kwargs,
             )
-            return
 
-        # Check that the source table primary key is distinct
-        if distinct_check and not source_tbl.distinct_primary_key(primary_key):
-            logger.info(
-                "Checking for distinct values for column %s in table %s",
+        with self._source_slots:
+            # Check that the source table primary key is distinct
+            if distinct_check and not source_tbl.distinct_primary_key(primary_key):
+                logger.info(
+                    "Checking for distinct values for column %s in table %s",
+                    primary_key,
+                    source_table,
+                )
+                raise ValueError("{primary_key} is not distinct in source table.")
+
+            # Get the max source table and destination table primary key
+            logger.debug(
+                "Calculating the maximum value for %s for source table %s",
                 primary_key,
                 source_table,
             )
-            raise ValueError("{primary_key} is not distinct in source table.")
+            source_max_pk = source_tbl.max_primary_key(primary_key)
 
-        # Get the max source table and destination table primary key
-        logger.debug(
-            "Calculating the maximum value for %s for source table %s",
-            primary_key,
-            source_table,
-        )
-        source_max_pk = source_tbl.max_primary_key(primary_key)
         logger.debug(
             "Calculating the maximum value for %s for destination table %s",
             primary_key,
             destination_table,
         )
-        dest_max_pk = destination_tbl.max_primary_key(primary_key)
+        with self._destination_slots:
+            dest_max_pk = destination_tbl.max_primary_key(primary_key)
 
         # Check for a mismatch in row counts; if dest_max_pk is None, or destination is empty
         # and we don't have to worry about this check.
@@ -195,7 +243,7 @@ class DBSync:
         # Do not copied if row counts are equal.
         elif dest_max_pk == source_max_pk:
             logger.info("Tables are already in sync.")
-            return None
+            return 0
 
         else:
             rows_copied = self.copy_rows(
@@ -205,10 +253,149 @@ class DBSync:
             logger.info("Copied %s new rows to %s.", rows_copied, destination_table)
 
         if verify_row_count:
-            self._row_count_verify(source_tbl, destination_tbl)
+            with self._source_slots, self._destination_slots:
+                self._row_count_verify(source_tbl, destination_tbl)
 
         logger.info(f"{source_table} synced to {destination_table}.")
 
+        return rows_copied
+
+    def sync_tables(
+        self,
+        tables,
+        max_workers=4,
+        max_source_connections=None,
+        max_destination_connections=None,
+        raise_on_error=True,
+    ):
+        """
+        Sync many tables concurrently.
+
+        Each table is synced on a thread pool with ``table_sync_incremental`` if a
+        ``primary_key`` is given, and ``table_sync_full`` otherwise. Tables are started
+        largest first (by the source database's estimate of their row counts), so that
+        the longest syncs do not end up running alone at the end.
+
+        .. code-block:: python
+
+            db_sync = DBSync(Postgres(), Redshift())
+            report = db_sync.sync_tables(
+                [
+                    ("public.events", "raw.events"),
+                    {"source_table": "public.people", "destination_table": "raw.people",
+                     "primary_key": "id"},
+                ],
+                max_workers=8,
+                max_source_connections=4,
+            )
+
+        `Args:`
+            tables: list
+                The tables to sync. Each item is either a ``(source_table, destination_table)``
+                tuple, or a dict with ``source_table`` and ``destination_table`` keys and any
+                other arguments for ``table_sync_full`` or ``table_sync_incremental`` (e.g.
+                ``primary_key``, ``if_exists``, ``order_by``).
+            max_workers: int
+                The number of tables to sync at once.
+            max_source_connections: int
+                The maximum number of queries run against the source database at once.
+                Defaults to no limit beyond ``max_workers``.
+            max_destination_connections: int
+                The maximum number of queries and writes run against the destination
+                database at once. Defaults to no limit beyond ``max_workers``.
+            raise_on_error: bool
+                If ``True``, raise an error once every table has been attempted if any of
+                them failed to sync. Otherwise, failures are only recorded in the report.
+        `Returns:`
+            Parsons Table
+                One row per table with ``source_table``, ``destination_table``, ``sync_type``,
+                ``rows_copied``, ``seconds``, ``status`` and ``error`` columns.
+        """
+
+        syncs = []
+        for table in tables:
+            if isinstance(table, dict):
+                table = dict(table)
+                syncs.append((table.pop("source_table"), table.pop("destination_table"), table))
+            else:
+                source_table, destination_table = table
+                syncs.append((source_table, destination_table, {}))
+
+        def sync_table(source_table, destination_table, sync_kwargs):
+            sync_kwargs = dict(sync_kwargs)
+            primary_key = sync_kwargs.pop("primary_key", None)
+            start = time.monotonic()
+            result = {
+                "source_table": source_table,
+                "destination_table": destination_table,
+                "sync_type": "incremental" if primary_key else "full",
+                "rows_copied": None,
+                "seconds": None,
+                "status": "success",
+                "error": None,
+            }
+
+            try:
+                if primary_key:
+                    rows_copied = self.table_sync_incremental(
+                        source_table, destination_table, primary_key, **sync_kwargs
+                    )
+                else:
+                    rows_copied = self.table_sync_full(
+                        source_table, destination_table, **sync_kwargs
+                    )
+                result["rows_copied"] = rows_copied
+            except Exception as e:
+                logger.exception(f"Error syncing {source_table} to {destination_table}")
+                result["status"] = "failed"
+                result["error"] = str(e)
+
+            result["seconds"] = round(time.monotonic() - start, 3)
+            return result
+
+        self._source_slots = self._connection_slots(max_source_connections)
+        self._destination_slots = self._connection_slots(max_destination_connections)
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                estimates = list(executor.map(lambda sync: self._estimate_rows(sync[0]), syncs))
+                ranked = sorted(zip(estimates, syncs), key=lambda item: item[0], reverse=True)
+                syncs = [sync for _, sync in ranked]
+
+                futures = [executor.submit(sync_table, *sync) for sync in syncs]
+                report = Table([future.result() for future in futures])
+        finally:
+            self._source_slots = nullcontext()
+            self._destination_slots = nullcontext()
+
+        failed = report.select_rows(lambda row: row.status == "failed")
+        logger.info(f"Synced {report.num_rows - failed.num_rows} of {report.num_rows} tables.")
+
+        if failed.num_rows and raise_on_error:
+            raise RuntimeError(f"Failed to sync tables: {', '.join(failed['source_table'])}")
+
+        return report
+
+    def _estimate_rows(self, source_table_name):
+        """
+        Estimate the number of rows in a source table, for ordering syncs. Uses the
+        database's catalog statistics rather than counting the rows.
+        """
+
+        try:
+            with self._source_slots:
+                return self.source_db.table(source_table_name).estimated_num_rows or 0
+        except Exception:
+            logger.debug(f"Unable to estimate the rows in {source_table_name}")
+            return 0
+
+    @staticmethod
+    def _connection_slots(limit):
+        # A context manager that caps how many threads can use a database at once. Where a
+        # thread needs both databases, the source slot is always taken first, so that two
+        # threads can't each wait on a slot the other holds.
+        return threading.BoundedSemaphore(limit) if limit else nullcontext()
+
     def copy_rows(self, source_table_name, destination_table_name, cutoff, order_by, **kwargs):
         """
         Copy the rows from the source to the destination.
@@ -225,12 +412,21 @@ class DBSync:
             **kwargs: args
                 Optional copy arguments for destination database.
         `Returns:`
-            ``None``
+            int
+                The number of rows copied
         """
 
         # Create the table objects
         source_table = self.source_db.table(source_table_name)
 
+        with self._source_slots:
+            keyset = self._use_keyset_pagination(source_table, order_by, cutoff)
+
+        if self.pipelined:
+            return self._copy_rows_pipelined(
+                source_table, destination_table_name, cutoff, order_by, keyset, **kwargs
+            )
+
         # Initialize the Parsons table we will use to store rows before writing
         buffer = Table()
 
@@ -245,22 +441,7 @@ class DBSync:
         while True:
             try:
                 # Get the records to load into the database
-                if cutoff:
-                    # If we have a cutoff, we are loading data incrementally -- filter out
-                    # any data before our cutoff
-                    rows = source_table.get_new_rows(
-                        primary_key=order_by,
-                        cutoff_value=cutoff,
-                        offset=total_rows_downloaded,
-                        chunk_size=self.read_chunk_size,
-                    )
-                else:
-                    # Get a chunk
-                    rows = source_table.get_rows(
-                        offset=total_rows_downloaded,
-                        chunk_size=self.read_chunk_size,
-                        order_by=order_by,
-                    )
+                rows = self._get_rows(source_table, cutoff, order_by, total_rows_downloaded, keyset)
 
                 number_of_rows = rows.num_rows
                 total_rows_downloaded += number_of_rows
@@ -274,9 +455,7 @@ class DBSync:
                             rows_buffered,
                             destination_table_name,
                         )
-                        self.dest_db.copy(
-                            buffer, destination_table_name, if_exists="append", **kwargs
-                        )
+                        self._copy_to_destination(buffer, destination_table_name, **kwargs)
                         total_rows_written += rows_buffered
 
                         # Reset the buffer
@@ -285,6 +464,9 @@ class DBSync:
 
                     break
 
+                if keyset:
+                    cutoff = rows[order_by][-1]
+
                 # Add the new rows to our buffer
                 buffer.concat(rows)
                 rows_buffered += number_of_rows
@@ -292,7 +474,7 @@ class DBSync:
                 # If our buffer reaches our write threshold, write it out
                 if rows_buffered >= self.write_chunk_size:
                     logger.debug("Copying %s rows to %s", rows_buffered, destination_table_name)
-                    self.dest_db.copy(buffer, destination_table_name, if_exists="append", **kwargs)
+                    self._copy_to_destination(buffer, destination_table_name, **kwargs)
                     total_rows_written += rows_buffered
 
                     # Reset the buffer
@@ -313,6 +495,186 @@ class DBSync:
 
         return total_rows_written
 
+    def _get_rows(self, source_table, cutoff, order_by, offset, keyset):
+        """
+        Read the next chunk of rows from the source table.
+        """
+
+        with self._source_slots:
+            return self._query_rows(source_table, cutoff, order_by, offset, keyset)
+
+    def _query_rows(self, source_table, cutoff, order_by, offset, keyset):
+        if keyset:
+            # Pick up right after the last row we downloaded
+            return source_table.get_new_rows(
+                primary_key=order_by,
+                cutoff_value=cutoff,
+                chunk_size=self.read_chunk_size,
+            )
+
+        if cutoff:
+            # If we have a cutoff, we are loading data incrementally -- filter out
+            # any data before our cutoff
+            return source_table.get_new_rows(
+                primary_key=order_by,
+                cutoff_value=cutoff,
+                offset=offset,
+                chunk_size=self.read_chunk_size,
+            )
+
+        # Get a chunk
+        return source_table.get_rows(
+            offset=offset,
+            chunk_size=self.read_chunk_size,
+            order_by=order_by,
+        )
+
+    def _copy_to_destination(self, buffer, destination_table_name, **kwargs):
+        """
+        Append a chunk of rows to the destination table.
+        """
+
+        with self._destination_slots:
+            self.dest_db.copy(buffer, destination_table_name, if_exists="append", **kwargs)
+
+    def _with_retries(self, func, description):
+        """
+        Call ``func``, retrying up to ``self.retries`` times if it raises.
+        """
+
+        retries_left = self.retries
+
+        while True:
+            try:
+                return func()
+            except Exception:
+                if retries_left == 0:
+                    logger.debug("No retries remaining")
+                    raise
+
+                retries_left -= 1
+                logger.exception(f"Unhandled error {description}; retrying")
+
+    def _read_write_chunks(self, source_table, cutoff, order_by, keyset):
+        """
+        Read the source table, yielding tables of at least ``write_chunk_size`` rows (except
+        for the last one).
+        """
+
+        buffer = Table()
+        rows_buffered = 0
+        total_rows_downloaded = 0
+
+        while True:
+            rows = self._with_retries(
+                lambda: self._get_rows(
+                    source_table, cutoff, order_by, total_rows_downloaded, keyset
+                ),
+                "reading data",
+            )
+
+            number_of_rows = rows.num_rows
+            if number_of_rows == 0:
+                break
+
+            total_rows_downloaded += number_of_rows
+            if keyset:
+                cutoff = rows[order_by][-1]
+
+            buffer.concat(rows)
+            rows_buffered += number_of_rows
+
+            if rows_buffered >= self.write_chunk_size:
+                yield buffer
+                buffer = Table()
+                rows_buffered = 0
+
+        if rows_buffered > 0:
+            yield buffer
+
+    def _copy_rows_pipelined(
+        self, source_table, destination_table_name, cutoff, order_by, keyset, **kwargs
+    ):
+        """
+        Copy rows with the calling thread reading from the source, while writer threads load
+        the chunks it hands them into the destination.
+        """
+
+        chunks = queue.Queue(maxsize=self.queue_depth)
+        failed = threading.Event()
+
+        def write_chunks():
+            rows_written = 0
+            error = None
+
+            # Keep draining the queue after a failure, so the reader never blocks on it
+            while True:
+                buffer = chunks.get()
+                if buffer is None:
+                    break
+
+                if failed.is_set():
+                    continue
+
+                try:
+                    rows_buffered = buffer.num_rows
+                    logger.debug("Copying %s rows to %s", rows_buffered, destination_table_name)
+                    self._with_retries(
+                        lambda: self._copy_to_destination(buffer, destination_table_name, **kwargs),
+                        "copying data",
+                    )
+                    rows_written += rows_buffered
+                except Exception as e:
+                    error = e
+                    failed.set()
+
+            if error:
+                raise error
+
+            return rows_written
+
+        with ThreadPoolExecutor(max_workers=self.writer_threads) as executor:
+            writers = [executor.submit(write_chunks) for _ in range(self.writer_threads)]
+
+            try:
+                for buffer in self._read_write_chunks(source_table, cutoff, order_by, keyset):
+                    if failed.is_set():
+                        break
+                    chunks.put(buffer)
+            finally:
+                for _ in writers:
+                    chunks.put(None)
+
+            return sum(writer.result() for writer in writers)
+
+    def _use_keyset_pagination(self, source_table, order_by, cutoff):
+        """
+        Determine whether rows can be read with keyset pagination rather than OFFSET.
+        """
+
+        if not self.keyset_pagination or not order_by:
+            return False
+
+        if order_by not in source_table.columns:
+            logger.info(f"Ordering by {order_by}, which is not a column; paginating with OFFSET.")
+            return False
+
+        # Incremental syncs already require a distinct primary key. A full sync may be
+        # ordered by any column, and keyset pagination would skip rows that share a value
+        # across a chunk boundary.
+        if cutoff is None and not source_table.distinct_primary_key(order_by):
+            logger.info(f"{order_by} is not distinct; paginating with OFFSET.")
+            return False
+
+        # Rows with a NULL can't be paged past with ">", and a chunk ending in one would
+        # start the sync again from the first row. An incremental sync's cutoff already
+        # filters them out.
+        if cutoff is None and source_table.has_nulls(order_by):
+            logger.info(f"{order_by} has NULL values; paginating with OFFSET.")
+            return False
+
+        return True
+
     @staticmethod
     def _check_column_match(source_table_obj, destination_table_obj):
         """
@@ -29,48 +29,49 @@ class MySQLCreateTable(DatabaseCreateStatement):
     def is_valid_integer(self, val):
         return self.is_valid_sql_num(val)
 
+    def _max_width(self, values):
+        # Widths are measured on the repr of the encoded value
+        return max(
+            (len(str(str(value).encode("utf-8"))) for value in values if value is not None),
+            default=0,
+        )
+
     def evaluate_column(self, column_rows):
         # Generate MySQL data types and widths for a column.
 
-        col_width = 0
-        col_type = None
-
-        # Iterate through each row in the column
-        for row in column_rows:
-            # Get the MySQL data type
-            col_type = self.data_type(row, col_type)
+        values = self._distinct_values(column_rows)
+        col_type = self._detect_distinct_type(values)
 
-            # Calculate width if a varchar
-            if col_type == "varchar":
-                row_width = len(str(row.encode("utf-8")))
-
-                # Evaluate width vs. current max width
-                if row_width > col_width:
-                    col_width = row_width
+        # Calculate width if a varchar
+        col_width = 0
+        if col_type == "varchar":
+            col_width = self._max_width(values)
 
         return col_type, col_width
 
-    def evaluate_table(self, tbl):
+    def evaluate_table(self, tbl, sample_size=None, verify_sample=False):
         # Generate a dict of MySQL column types and widths for all columns
         # in a table.
 
-        table_map = []
+        table_map = self.profile_columns(tbl, sample_size=sample_size, verify_sample=verify_sample)
 
-        for col in tbl.columns:
-            col_type, col_width = self.evaluate_column(tbl.column_data(col))
-            col_map = {"name": col, "type": col_type, "width": col_width}
-            table_map.append(col_map)
+        # Only varchar columns have a width
+        for col_map in table_map:
+            if col_map["type"] != "varchar":
+                col_map["width"] = 0
 
         return table_map
 
-    def create_statement(self, tbl, table_name, strict_length=True):
+    def create_statement(
+        self, tbl, table_name, strict_length=True, sample_size=None, verify_sample=False
+    ):
         # Generate create statement SQL for a given Parsons table.
 
         # Validate and rename column names if needed
         tbl.table = petl.setheader(tbl.table, self.columns_convert(tbl.columns))
 
         # Generate the table map
-        table_map = self.evaluate_table(tbl)
+        table_map = self.evaluate_table(tbl, sample_size=sample_size, verify_sample=verify_sample)
 
         # Generate the column syntax
         column_syntax = []
@@ -1,16 +1,20 @@
+import csv
 import logging
 import os
-import pickle
+import tempfile
+import time
 from contextlib import contextmanager
+from itertools import islice
 
 import mysql.connector as mysql
-import petl
 
 from parsons import Table
 from parsons.databases.alchemy import Alchemy
 from parsons.databases.database_connector import DatabaseConnector
 from parsons.databases.mysql.create_table import MySQLCreateTable
+from parsons.databases.pool import PooledConnector
 from parsons.databases.table import BaseTable
+from parsons.etl.spill import SpillView, SpillWriter
 from parsons.utilities import check_env, files
 
 # Max number of rows that we query at a time, so we can avoid loading huge
@@ -21,7 +25,7 @@ QUERY_BATCH_SIZE = 100000
 logger = logging.getLogger(__name__)
 
 
-class MySQL(DatabaseConnector, MySQLCreateTable, Alchemy):
+class MySQL(DatabaseConnector, MySQLCreateTable, Alchemy, PooledConnector):
     """
     Connect to a MySQL database.
 
@@ -58,19 +62,16 @@ class MySQL(DatabaseConnector, MySQLCreateTable, Alchemy):
         any context manager):
         ``with mysql.connection() as conn:``
 
+        If a connection pool is enabled (see ``enable_connection_pool``), the connection is
+        taken from the pool and returned to it, instead of being closed.
+
         `Returns:`
             MySQL `connection` object
         """
 
-        # Create a mysql connection and cursor
-        connection = mysql.connect(
-            host=self.host,
-            user=self.username,
-            passwd=self.password,
-            database=self.db,
-            port=self.port,
-        )
+        connection = self._acquire_connection()
 
+        reuse = False
         try:
             yield connection
         except mysql.Error:
@@ -78,8 +79,24 @@ class MySQL(DatabaseConnector, MySQLCreateTable, Alchemy):
             raise
         else:
             connection.commit()
+            reuse = True
         finally:
-            connection.close()
+            self._release_connection(connection, reuse=reuse)
+
+    def _connect(self):
+        # Create a mysql connection
+        return mysql.connect(
+            host=self.host,
+            user=self.username,
+            passwd=self.password,
+            database=self.db,
+            port=self.port,
+            # Allows copies to use LOAD DATA LOCAL INFILE, but only for Parsons temp files
+            allow_local_infile_in_path=tempfile.gettempdir(),
+        )
+
+    def _connection_is_healthy(self, connection):
+        return connection.is_connected()
 
     @contextmanager
     def cursor(self, connection):
@@ -169,30 +186,80 @@ class MySQL(DatabaseConnector, MySQLCreateTable, Alchemy):
                 return None
 
             else:
-                # Fetch the data in batches, and "pickle" the rows to a temp file.
-                # (We pickle rather than writing to, say, a CSV, so that we maintain
+                # Fetch the data in batches, and spill each batch to a temp file.
+                # (We use a spill file rather than, say, a CSV, so that we maintain
                 # all the type information for each field.)
                 temp_file = files.create_temp_file()
 
-                with open(temp_file, "wb") as f:
-                    # Grab the header
-                    pickle.dump(cursor.column_names, f)
-
+                # Grab the header
+                with SpillWriter(temp_file, cursor.column_names) as writer:
                     while True:
                         batch = cursor.fetchmany(QUERY_BATCH_SIZE)
                         if len(batch) == 0:
                             break
 
                         logger.debug(f"Fetched {len(batch)} rows.")
-                        for row in batch:
-                            pickle.dump(row, f)
+                        writer.write_rows(batch)
 
                 # Load a Table from the file
-                final_tbl = Table(petl.frompickle(temp_file))
+                final_tbl = Table(SpillView(temp_file, num_rows=writer.num_rows))
 
                 logger.debug(f"Query returned {final_tbl.num_rows} rows.")
                 return final_tbl
 
+    def query_stream(self, sql, parameters=None, batch_size=QUERY_BATCH_SIZE):
+        """
+        Execute a query against the database and stream the results back in batches.
+
+        Unlike ``query()``, which downloads the whole result to a temp file before returning,
+        this reads the result through an unbuffered (streaming) cursor and yields a Parsons
+        Table for each batch of rows as soon as it arrives. Downstream transformations and
+        loads can start on the first batch while the rest is still being fetched, and only one
+        batch is held in memory at a time.
+
+        The connection stays open until the generator is exhausted or closed. Only a single
+        statement that returns rows (e.g. ``SELECT``) can be streamed.
+
+        .. code-block:: python
+
+            for index, tbl in enumerate(mysql.query_stream("SELECT * FROM my_table", batch_size=50000)):
+                if index == 0:
+                    tbl.to_csv("my_table.csv")
+                else:
+                    tbl.append_csv("my_table.csv")
+
+        `Args:`
+            sql: str
+                A valid SQL statement
+            parameters: list
+                A list of python variables to be converted into SQL values in your query
+            batch_size: int
+                The number of rows to fetch per batch
+
+        `Returns:`
+            Generator of Parsons Tables
+        """
+
+        with self.connection() as connection:
+            cursor = connection.cursor(buffered=False)
+
+            try:
+                logger.debug(f"SQL Query: {sql}")
+                cursor.execute(sql, parameters)
+
+                while True:
+                    batch = cursor.fetchmany(batch_size)
+                    if not batch:
+                        break
+
+                    logger.debug(f"Fetched {len(batch)} rows.")
+                    yield Table([list(cursor.column_names), *batch])
+            finally:
+                # If the caller stopped early, the rest of the result has to be read off
+                # the connection before it can be used again
+                connection.consume_results()
+                cursor.close()
+
     def copy(
         self,
         tbl: Table,
@@ -200,14 +267,16 @@ class MySQL(DatabaseConnector, MySQLCreateTable, Alchemy):
         if_exists: str = "fail",
         chunk_size: int = 1000,
         strict_length: bool = True,
+        method: str = "auto",
     ):
         """
         Copy a :ref:`parsons-table` to the database.
 
         .. note::
-            This method utilizes extended inserts rather `LOAD DATA INFILE` since
-            many MySQL Database configurations do not allow data files to be
-            loaded. It results in a minor performance hit compared to `LOAD DATA`.
+            By default this method uses ``LOAD DATA LOCAL INFILE`` when the server allows it
+            (the ``local_infile`` system variable is enabled), which is much faster. Since
+            many MySQL database configurations do not allow data files to be loaded, it
+            otherwise falls back to batched inserts.
 
         `Args:`
             tbl: parsons.Table
@@ -218,14 +287,21 @@ class MySQL(DatabaseConnector, MySQLCreateTable, Alchemy):
                 If the table already exists, either ``fail``, ``append``, ``drop``
                 or ``truncate`` the table.
             chunk_size: int
-                The number of rows to insert per query.
+                The number of rows to insert per query, when using batched inserts.
             strict_length: bool
                 If the database table needs to be created, strict_length determines whether
                 the created table's column sizes will be sized to exactly fit the current data,
                 or if their size will be rounded up to account for future values being larger
                 then the current dataset. defaults to ``True``
+            method: str
+                How to load the data: ``load_data`` to use ``LOAD DATA LOCAL INFILE``,
+                ``executemany`` to use batched, parameterized inserts, or ``auto`` to use
+                ``load_data`` when the server allows it.
         """
 
+        if method not in ["auto", "load_data", "executemany"]:
+            raise ValueError("Invalid value for `method` argument")
+
         if tbl.num_rows == 0:
             logger.info("Parsons table is empty. Table will not be created.")
             return None
@@ -237,31 +313,96 @@ class MySQL(DatabaseConnector, MySQLCreateTable, Alchemy):
                 self.query_with_connection(sql, connection, commit=False)
                 logger.info(f"Table {table_name} created.")
 
-            # Chunk tables in batches of 1K rows, though this can be tuned and
-            # optimized further.
-            for t in tbl.chunk(chunk_size):
-                sql = self._insert_statement(t, table_name)
-                self.query_with_connection(sql, connection, commit=False)
+            if method == "auto":
+                method = "load_data" if self._local_infile_enabled(connection) else "executemany"
+
+            start = time.time()
+
+            if method == "load_data":
+                num_rows = self._load_data(tbl, table_name, connection)
+            else:
+                num_rows = self._insert_rows(tbl, table_name, connection, chunk_size)
+
+            seconds = time.time() - start
+            logger.info(
+                f"Copied {num_rows} rows to {table_name} with {method} in {seconds:.2f} "
+                f"seconds ({num_rows / max(seconds, 0.001):.0f} rows/second)."
+            )
 
-    def _insert_statement(self, tbl, table_name):
+    def _local_infile_enabled(self, connection):
         """
-        Convert the table data into a string for bulk importing.
+        Whether the server allows ``LOAD DATA LOCAL INFILE``.
         """
 
-        # Single column tables
-        if len(tbl.columns) == 1:
-            values = [f"({row[0]})" for row in tbl.data]
+        result = self.query_with_connection(
+            "SELECT @@GLOBAL.local_infile AS local_infile", connection, commit=False
+        )
 
-        # Multi-column tables
-        else:
-            values = [str(row) for row in tbl.data]
+        return bool(result and int(result.first))
+
+    @staticmethod
+    def _load_data_value(value):
+        # Encode a value for LOAD DATA; NULL is \N, so backslashes in values are escaped
+        if value is None:
+            return "\\N"
+        if isinstance(value, bool):
+            return int(value)
+        if isinstance(value, (int, float)):
+            return value
+
+        return str(value).replace("\\", "\\\\")
+
+    def _load_data(self, tbl, table_name, connection):
+        """
+        Load the table with ``LOAD DATA LOCAL INFILE``, from a CSV file written for MySQL.
+        """
+
+        local_path = files.create_temp_file(suffix=".csv")
+        with open(local_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f, lineterminator="\n")
+            for row in tbl.data:
+                writer.writerow([self._load_data_value(value) for value in row])
 
-        # Create full insert statement
+        escaped_path = local_path.replace("\\", "\\\\")
+        sql = f"""LOAD DATA LOCAL INFILE '{escaped_path}'
+                  INTO TABLE {table_name}
+                  CHARACTER SET utf8mb4
+                  FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '"' ESCAPED BY '\\\\'
+                  LINES TERMINATED BY '\\n'
+                  ({",".join(tbl.columns)});"""
+
+        try:
+            with self.cursor(connection) as cursor:
+                cursor.execute(sql)
+                return cursor.rowcount
+        finally:
+            files.close_temp_file(local_path)
+
+    def _insert_rows(self, tbl, table_name, connection, chunk_size):
+        """
+        Insert the table in batches of ``chunk_size`` rows, with the values passed as
+        parameters so that the driver escapes them.
+        """
+
+        width = len(tbl.columns)
         sql = f"""INSERT INTO {table_name}
                   ({",".join(tbl.columns)})
-                  VALUES {",".join(values)};"""
+                  VALUES ({", ".join(["%s"] * width)})"""
+
+        # Short rows are padded with NULLs
+        rows = (tuple(row[:width]) + (None,) * (width - len(row)) for row in tbl.data)
 
-        return sql
+        num_rows = 0
+        with self.cursor(connection) as cursor:
+            while True:
+                batch = list(islice(rows, chunk_size))
+                if not batch:
+                    break
+
+                cursor.executemany(sql, batch)
+                num_rows += len(batch)
+
+        return num_rows
 
     def _create_table_precheck(self, connection, table_name, if_exists):
         """
@@ -322,6 +463,25 @@ class MySQL(DatabaseConnector, MySQLCreateTable, Alchemy):
             return False
 
     def table(self, table_name):
-        # Return a BaseTable table object
+        # Return a MySQL table object
+
+        return MySQLTable(self, table_name)
+
+
+class MySQLTable(BaseTable):
+    # MySQL table object.
+
+    @property
+    def estimated_num_rows(self):
+        # An approximation for InnoDB tables
+        if "." in self.table:
+            schema, table = self.table.split(".", 1)
+            sql = "SELECT table_rows FROM information_schema.tables WHERE table_schema = %s"
+            parameters = [schema]
+        else:
+            table = self.table
+            sql = "SELECT table_rows FROM information_schema.tables WHERE table_schema = DATABASE()"
+            parameters = []
 
-        return BaseTable(self, table_name)
+        result = self.db.query(f"{sql} AND table_name = %s", [*parameters, table])
+        return result.first if result else None
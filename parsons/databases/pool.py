@@ -0,0 +1,247 @@
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionPool:
+    """
+    A thread-safe pool of open database connections.
+
+    Connections are handed out most recently used first. The pool only limits how many idle
+    connections it keeps; if every pooled connection is in use, a new one is opened, and it
+    is closed rather than pooled when released to a full pool. This means code that opens a
+    second connection while holding one (as several connector methods do) can never block.
+
+    `Args:`
+        connect: callable
+            A function that opens a new connection
+        size: int
+            The max number of idle connections to keep open
+        idle_timeout: int
+            Seconds after which an idle connection is closed
+        health_check: callable
+            (Optional) A function that takes a connection and returns whether it is still
+            usable. It is run before handing out a connection that has been idle for more
+            than ``health_check_interval`` seconds.
+        health_check_interval: int
+            Seconds a connection can be idle before it is health checked
+    """
+
+    def __init__(
+        self, connect, size=5, idle_timeout=300, health_check=None, health_check_interval=30
+    ):
+        self.connect = connect
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self.health_check = health_check
+        self.health_check_interval = health_check_interval
+
+        # (connection, released at) pairs, oldest first
+        self._idle = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _pop_expired(self):
+        # Remove and return the idle connections that have passed the idle timeout. Must be
+        # called while holding the lock.
+        cutoff = time.monotonic() - self.idle_timeout
+        count = 0
+        while count < len(self._idle) and self._idle[count][1] < cutoff:
+            count += 1
+
+        expired = [conn for conn, _ in self._idle[:count]]
+        del self._idle[:count]
+        return expired
+
+    def acquire(self):
+        """
+        Get a connection from the pool, or open a new one if none are idle.
+        """
+
+        while True:
+            with self._lock:
+                expired = self._pop_expired()
+                conn, released_at = self._idle.pop() if self._idle else (None, None)
+
+            for expired_conn in expired:
+                self._close(expired_conn)
+
+            if conn is None:
+                return self.connect()
+
+            idle = time.monotonic() - released_at
+            if self.health_check and idle > self.health_check_interval:
+                if not self.health_check(conn):
+                    logger.debug("Discarding pooled connection that failed its health check.")
+                    self._close(conn)
+                    continue
+
+            return conn
+
+    def release(self, conn):
+        """
+        Return a connection to the pool. It is closed instead if the pool is full or closed.
+        """
+
+        with self._lock:
+            expired = self._pop_expired()
+            pooled = not self._closed and len(self._idle) < self.size
+            if pooled:
+                self._idle.append((conn, time.monotonic()))
+
+        for expired_conn in expired:
+            self._close(expired_conn)
+
+        if not pooled:
+            self._close(conn)
+
+    def close(self):
+        """
+        Close all idle connections. Connections in use are closed when they are released.
+        """
+
+        with self._lock:
+            idle, self._idle = self._idle, []
+            self._closed = True
+
+        for conn, _ in idle:
+            self._close(conn)
+
+    @staticmethod
+    def _close(conn):
+        try:
+            conn.close()
+        except Exception as e:
+            logger.debug(f"Error closing pooled connection: {e}")
+
+
+class PooledConnector(ABC):
+    """
+    Adds opt-in connection pooling and connection pinning to a database connector.
+
+    Connectors implement ``_connect`` to open a new connection, and use
+    ``_acquire_connection`` and ``_release_connection`` in their ``connection`` method.
+    They can also implement ``_connection_is_healthy`` for the pool's health check.
+    """
+
+    _connection_pool = None
+
+    @abstractmethod
+    def _connect(self):
+        """
+        Open a new connection to the database.
+        """
+
+    def _connection_is_healthy(self, connection):
+        return True
+
+    def enable_connection_pool(self, size=5, idle_timeout=300, health_check_interval=30):
+        """
+        Reuse database connections, instead of opening a new connection for every query.
+
+        Once enabled, ``query()`` and every other method of the connector take connections
+        from the pool, and return them when done. The pool is shared by all threads using
+        this connector.
+
+        `Args:`
+            size: int
+                The max number of idle connections to keep open
+            idle_timeout: int
+                Seconds after which an idle connection is closed
+            health_check_interval: int
+                Seconds a connection can be idle before it is checked, and replaced if it was
+                dropped, before being reused
+        """
+
+        self.close_connection_pool()
+        self._connection_pool = ConnectionPool(
+            self._connect,
+            size=size,
+            idle_timeout=idle_timeout,
+            health_check=self._connection_is_healthy,
+            health_check_interval=health_check_interval,
+        )
+
+    def close_connection_pool(self):
+        """
+        Close all pooled connections and stop pooling.
+        """
+
+        if self._connection_pool:
+            self._connection_pool.close()
+            self._connection_pool = None
+
+    @property
+    def _pinned(self):
+        # Thread-local state holding the pinned connection, if any
+        pinned = self.__dict__.get("_pinned_state")
+        if pinned is None:
+            pinned = self.__dict__.setdefault("_pinned_state", threading.local())
+        return pinned
+
+    @contextmanager
+    def pinned_connection(self):
+        """
+        Use a single connection for everything run in the block, on the current thread.
+
+        Each ``query()`` and other method call made in the block reuses the pinned connection,
+        rather than getting its own. Each call still commits on its own, as it would
+        otherwise. The connection is committed and released at the end of the block.
+
+        .. code-block:: python
+
+            with rs.pinned_connection():
+                if rs.table_exists("my_schema.my_table"):
+                    rs.query("truncate my_schema.my_table")
+
+        `Returns:`
+            The pinned connection
+        """
+
+        conn = getattr(self._pinned, "connection", None)
+        if conn is not None:
+            # Already pinned by an enclosing block
+            yield conn
+            return
+
+        conn = self._acquire_connection()
+        self._pinned.connection = conn
+
+        reuse = False
+        try:
+            yield conn
+            conn.commit()
+            reuse = True
+        finally:
+            self._pinned.connection = None
+            self._release_connection(conn, reuse=reuse)
+
+    def _acquire_connection(self):
+        pinned = getattr(self._pinned, "connection", None)
+        if pinned is not None:
+            return pinned
+
+        if self._connection_pool:
+            return self._connection_pool.acquire()
+
+        return self._connect()
+
+    def _release_connection(self, conn, reuse=True):
+        # Some methods switch their connection to autocommit (e.g. to run VACUUM), which
+        # mustn't carry over to the next user of the connection
+        if reuse and getattr(conn, "autocommit", False):
+            conn.autocommit = False
+
+        # A pinned connection is released at the end of its pinned_connection block
+        if conn is getattr(self._pinned, "connection", None):
+            return
+
+        if reuse and self._connection_pool:
+            self._connection_pool.release(conn)
+        else:
+            # Connections that saw an error are closed rather than reused
+            conn.close()
@@ -7,6 +7,10 @@ from parsons.databases.database_connector import DatabaseConnector
 from parsons.databases.postgres.postgres_core import PostgresCore
 from parsons.databases.table import BaseTable
 from parsons.etl.table import Table
+from parsons.utilities.csv_stream import CSVStream
+
+# Number of characters sent to the server per message during a COPY
+COPY_BUFFER_SIZE = 1024 * 1024
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +67,9 @@ class Postgres(PostgresCore, Alchemy, DatabaseConnector):
         """
         Copy a :ref:`parsons-table` to Postgres.
 
+        The table is streamed to the database with ``COPY``, encoding rows as they are sent,
+        so no local copy of the data is written to disk.
+
         `Args:`
             tbl: parsons.Table
                 A Parsons table object
@@ -88,11 +95,15 @@ class Postgres(PostgresCore, Alchemy, DatabaseConnector):
                 self.query_with_connection(sql, connection, commit=False)
                 logger.info(f"{table_name} created.")
 
-            sql = f"""COPY "{table_name}" ("{'","'.join(tbl.columns)}") FROM STDIN CSV HEADER;"""
+            sql = f"""COPY "{table_name}" ("{'","'.join(tbl.columns)}") FROM STDIN CSV;"""
+
+            # Encode the rows as CSV as psycopg2 reads them, rather than writing the whole
+            # table to a local file first
+            stream = CSVStream(tbl.data)
 
             with self.cursor(connection) as cursor:
-                cursor.copy_expert(sql, open(tbl.to_csv(), "r"))
-                logger.info(f"{tbl.num_rows} rows copied to {table_name}.")
+                cursor.copy_expert(sql, stream, size=COPY_BUFFER_SIZE)
+                logger.info(f"{stream.num_rows} rows copied to {table_name}.")
 
     def table(self, table_name):
         # Return a Postgres table object
@@ -103,6 +114,15 @@ class Postgres(PostgresCore, Alchemy, DatabaseConnector):
 class PostgresTable(BaseTable):
     # Postgres table object.
 
+    @property
+    def estimated_num_rows(self):
+        # Updated by VACUUM and ANALYZE; -1 if the table has never been analyzed
+        result = self.db.query(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s)", [self.table]
+        )
+        estimate = result.first if result else None
+        return estimate if estimate is not None and estimate >= 0 else None
+
     def max_value(self, column: str):
         """Get the max value of this column from the table."""
         return self.db.query(
@@ -1,13 +1,14 @@
 import logging
-import pickle
+import random
 from contextlib import contextmanager
 from typing import Optional
 
-import petl
 import psycopg2
 import psycopg2.extras
 
+from parsons.databases.pool import PooledConnector
 from parsons.databases.postgres.postgres_create_statement import PostgresCreateStatement
+from parsons.etl.spill import SpillView, SpillWriter
 from parsons.etl.table import Table
 from parsons.utilities import files
 
@@ -19,7 +20,7 @@ QUERY_BATCH_SIZE = 100000
 logger = logging.getLogger(__name__)
 
 
-class PostgresCore(PostgresCreateStatement):
+class PostgresCore(PostgresCreateStatement, PooledConnector):
     @contextmanager
     def connection(self):
         """
@@ -31,12 +32,30 @@ class PostgresCore(PostgresCreateStatement):
         any context manager):
         ``with pg.connection() as conn:``
 
+        If a connection pool is enabled (see ``enable_connection_pool``), the connection is
+        taken from the pool and returned to it, instead of being closed.
+
         `Returns:`
             Psycopg2 `connection` object
         """
 
-        # Create a psycopg2 connection and cursor
-        conn = psycopg2.connect(
+        conn = self._acquire_connection()
+
+        reuse = False
+        try:
+            yield conn
+        except psycopg2.Error:
+            conn.rollback()
+            raise
+        else:
+            conn.commit()
+            reuse = True
+        finally:
+            self._release_connection(conn, reuse=reuse)
+
+    def _connect(self):
+        # Create a psycopg2 connection
+        return psycopg2.connect(
             user=self.username,
             password=self.password,
             host=self.host,
@@ -45,15 +64,18 @@ class PostgresCore(PostgresCreateStatement):
             connect_timeout=self.timeout,
         )
 
+    def _connection_is_healthy(self, connection):
+        if connection.closed:
+            return False
+
         try:
-            yield conn
+            with connection.cursor() as cursor:
+                cursor.execute("select 1")
+            connection.rollback()
         except psycopg2.Error:
-            conn.rollback()
-            raise
-        else:
-            conn.commit()
-        finally:
-            conn.close()
+            return False
+
+        return True
 
     @contextmanager
     def cursor(self, connection):
@@ -140,32 +162,87 @@ class PostgresCore(PostgresCreateStatement):
                 return None
 
             else:
-                # Fetch the data in batches, and "pickle" the rows to a temp file.
-                # (We pickle rather than writing to, say, a CSV, so that we maintain
+                # Fetch the data in batches, and spill each batch to a temp file.
+                # (We use a spill file rather than, say, a CSV, so that we maintain
                 # all the type information for each field.)
 
                 temp_file = files.create_temp_file()
 
-                with open(temp_file, "wb") as f:
-                    # Grab the header
-                    header = [i[0] for i in cursor.description]
-                    pickle.dump(header, f)
+                # Grab the header
+                header = [i[0] for i in cursor.description]
 
+                with SpillWriter(temp_file, header) as writer:
                     while True:
                         batch = cursor.fetchmany(QUERY_BATCH_SIZE)
                         if not batch:
                             break
 
                         logger.debug(f"Fetched {len(batch)} rows.")
-                        for row in batch:
-                            pickle.dump(list(row), f)
+                        writer.write_rows(batch)
 
                 # Load a Table from the file
-                final_tbl = Table(petl.frompickle(temp_file))
+                final_tbl = Table(SpillView(temp_file, num_rows=writer.num_rows))
 
                 logger.debug(f"Query returned {final_tbl.num_rows} rows.")
                 return final_tbl
 
+    def query_stream(self, sql, parameters=None, batch_size=QUERY_BATCH_SIZE):
+        """
+        Execute a query against the Postgres database and stream the results back in batches.
+
+        Unlike ``query()``, which downloads the whole result to a temp file before returning,
+        this reads the result through a server-side cursor and yields a Parsons Table for each
+        batch of rows as soon as it arrives. Downstream transformations and loads can start on
+        the first batch while the rest is still being fetched, and only one batch is held in
+        memory at a time.
+
+        The connection stays open until the generator is exhausted or closed. Only a single
+        statement that returns rows (e.g. ``SELECT``) can be streamed.
+
+        .. code-block:: python
+
+            for index, tbl in enumerate(pg.query_stream("SELECT * FROM my_schema.my_table", batch_size=50000)):
+                if index == 0:
+                    tbl.to_csv("my_table.csv")
+                else:
+                    tbl.append_csv("my_table.csv")
+
+        `Args:`
+            sql: str
+                A valid SQL statement
+            parameters: list
+                A list of python variables to be converted into SQL values in your query
+            batch_size: int
+                The number of rows to fetch per batch
+
+        `Returns:`
+            Generator of Parsons Tables
+        """
+
+        with self.connection() as connection:
+            # Naming the cursor makes psycopg2 declare it on the server, so rows are only
+            # sent over the wire as they are fetched
+            cursor = connection.cursor(
+                name=f"parsons_stream_{random.randrange(10**9)}",
+                cursor_factory=psycopg2.extras.DictCursor,
+            )
+            cursor.itersize = batch_size
+
+            try:
+                logger.debug(f"SQL Query: {sql}")
+                cursor.execute(sql, parameters)
+
+                while True:
+                    batch = cursor.fetchmany(batch_size)
+                    if not batch:
+                        break
+
+                    logger.debug(f"Fetched {len(batch)} rows.")
+                    header = [i[0] for i in cursor.description]
+                    yield Table([header, *[tuple(row) for row in batch]])
+            finally:
+                cursor.close()
+
     def _create_table_precheck(self, connection, table_name, if_exists):
         """
         Helper to determine what to do when you need a table that may already exist.
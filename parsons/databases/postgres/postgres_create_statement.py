@@ -54,6 +54,8 @@ class PostgresCreateStatement(DatabaseCreateStatement):
         varchar_truncate=True,
         columntypes=None,
         strict_length=True,
+        sample_size=None,
+        verify_sample=False,
     ):
         # Generate a table create statement. Distkeys and sortkeys are only used by
         # Redshift and should not be passed when generating a create statement for
@@ -65,7 +67,9 @@ class PostgresCreateStatement(DatabaseCreateStatement):
         # Validate and rename column names if needed
         tbl.table = petl.setheader(tbl.table, self.column_name_validate(tbl.columns))
 
-        mapping = self.generate_data_types(tbl)
+        mapping = self.generate_data_types(
+            tbl, sample_size=sample_size, verify_sample=verify_sample
+        )
 
         if padding:
             mapping["longest"] = self.vc_padding(mapping, padding)
@@ -100,37 +104,21 @@ class PostgresCreateStatement(DatabaseCreateStatement):
     def is_valid_integer(self, val):
         return self.is_valid_sql_num(val)
 
-    def generate_data_types(self, table):
+    def generate_data_types(self, table, sample_size=None, verify_sample=False):
         # Generate column data types
 
-        longest, type_list = [], []
-
-        cont = petl.records(table.table)
-
-        # Populate empty values for the columns
-        for col in table.columns:
-            longest.append(0)
-            type_list.append("")
-
-        for row in cont:
-            for i in range(len(row)):
-                # NA is the csv null value
-                if type_list[i] == "varchar" or row[i] in ["NA", ""]:
-                    pass
-                else:
-                    var_type = self.data_type(row[i], type_list[i])
-                    type_list[i] = var_type
-
-                # Calculate width
-                width = len(str(row[i]).encode("utf-8"))
-                if width > longest[i]:
-                    longest[i] = width
-
-        # In L140 'NA' and '' will be skipped
-        # If the entire column is either one of those (or a mix of the two)
-        # the type will be empty.
-        # Fill with a default varchar
-        type_list = [typ or "varchar" for typ in type_list]
+        # NA is the csv null value. 'NA' and '' are skipped when detecting types; if the
+        # entire column is either one of those (or a mix of the two) the type will be
+        # empty. Fill with a default varchar
+        profile = self.profile_columns(
+            table,
+            null_values=("NA", ""),
+            sample_size=sample_size,
+            verify_sample=verify_sample,
+        )
+
+        longest = [col["width"] for col in profile]
+        type_list = [col["type"] or "varchar" for col in profile]
 
         return {"longest": longest, "headers": table.columns, "type_list": type_list}
 
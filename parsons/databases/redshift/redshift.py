@@ -2,22 +2,25 @@ import datetime
 import json
 import logging
 import os
-import pickle
 import random
-from contextlib import contextmanager
-from typing import List, Optional
+from contextlib import contextmanager, nullcontext
+from typing import List, Optional, Union
 
 import petl
 import psycopg2
 import psycopg2.extras
 
+from parsons.aws.s3 import S3
 from parsons.databases.alchemy import Alchemy
 from parsons.databases.database_connector import DatabaseConnector
-from parsons.databases.redshift.rs_copy_table import RedshiftCopyTable
+from parsons.databases.pool import PooledConnector
+from parsons.databases.redshift.rs_copy_table import S3_UPLOAD_WORKERS, RedshiftCopyTable
 from parsons.databases.redshift.rs_create_table import RedshiftCreateTable
 from parsons.databases.redshift.rs_schema import RedshiftSchema
 from parsons.databases.redshift.rs_table_utilities import RedshiftTableUtilities
 from parsons.databases.table import BaseTable
+from parsons.etl.arrow import ParquetView
+from parsons.etl.spill import SpillView, SpillWriter
 from parsons.etl.table import Table
 from parsons.utilities import files, sql_helpers
 
@@ -26,6 +29,9 @@ from parsons.utilities import files, sql_helpers
 # 100k rows per batch at ~1k bytes each = ~100MB per batch.
 QUERY_BATCH_SIZE = 100000
 
+# The VACUUM types that upsert can run, besides the default full vacuum
+VACUUM_OPTIONS = ["full", "sort only", "delete only", "reindex", "recluster"]
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,6 +41,7 @@ class Redshift(
     RedshiftTableUtilities,
     RedshiftSchema,
     Alchemy,
+    PooledConnector,
     DatabaseConnector,
 ):
     """
@@ -127,12 +134,27 @@ class Redshift(
         any context manager):
         ``with rs.connection() as conn:``
 
+        If a connection pool is enabled (see ``enable_connection_pool``), the connection is
+        taken from the pool and returned to it, instead of being closed.
+
         `Returns:`
             Psycopg2 ``connection`` object
         """
 
-        # Create a psycopg2 connection and cursor
-        conn = psycopg2.connect(
+        conn = self._acquire_connection()
+
+        reuse = False
+        try:
+            yield conn
+
+            conn.commit()
+            reuse = True
+        finally:
+            self._release_connection(conn, reuse=reuse)
+
+    def _connect(self):
+        # Create a psycopg2 connection
+        return psycopg2.connect(
             user=self.username,
             password=self.password,
             host=self.host,
@@ -140,12 +162,19 @@ class Redshift(
             port=self.port,
             connect_timeout=self.timeout,
         )
+
+    def _connection_is_healthy(self, connection):
+        if connection.closed:
+            return False
+
         try:
-            yield conn
+            with connection.cursor() as cursor:
+                cursor.execute("select 1")
+            connection.rollback()
+        except psycopg2.Error:
+            return False
 
-            conn.commit()
-        finally:
-            conn.close()
+        return True
 
     @contextmanager
     def cursor(self, connection):
@@ -237,32 +266,88 @@ class Redshift(
                 return None
 
             else:
-                # Fetch the data in batches, and "pickle" the rows to a temp file.
-                # (We pickle rather than writing to, say, a CSV, so that we maintain
+                # Fetch the data in batches, and spill each batch to a temp file.
+                # (We use a spill file rather than, say, a CSV, so that we maintain
                 # all the type information for each field.)
 
                 temp_file = files.create_temp_file()
 
-                with open(temp_file, "wb") as f:
-                    # Grab the header
-                    header = [i[0] for i in cursor.description]
-                    pickle.dump(header, f)
+                # Grab the header
+                header = [i[0] for i in cursor.description]
 
+                with SpillWriter(temp_file, header) as writer:
                     while True:
                         batch = cursor.fetchmany(QUERY_BATCH_SIZE)
                         if not batch:
                             break
 
                         logger.debug(f"Fetched {len(batch)} rows.")
-                        for row in batch:
-                            pickle.dump(list(row), f)
+                        writer.write_rows(batch)
 
                 # Load a Table from the file
-                final_tbl = Table(petl.frompickle(temp_file))
+                final_tbl = Table(SpillView(temp_file, num_rows=writer.num_rows))
 
                 logger.debug(f"Query returned {final_tbl.num_rows} rows.")
                 return final_tbl
 
+    def query_stream(self, sql, parameters=None, batch_size=QUERY_BATCH_SIZE):
+        """
+        Execute a query against the Redshift database and stream the results back in batches.
+
+        Unlike ``query()``, which downloads the whole result to a temp file before returning,
+        this reads the result through a server-side cursor and yields a Parsons Table for each
+        batch of rows as soon as it arrives. Downstream transformations and loads can start on
+        the first batch while the rest is still being fetched, and only one batch is held in
+        memory at a time.
+
+        The connection stays open until the generator is exhausted or closed. Only a single
+        statement that returns rows (e.g. ``SELECT``) can be streamed.
+
+        .. code-block:: python
+
+            for index, tbl in enumerate(rs.query_stream("SELECT * FROM my_schema.my_table", batch_size=50000)):
+                if index == 0:
+                    tbl.to_csv("my_table.csv")
+                else:
+                    tbl.append_csv("my_table.csv")
+
+        `Args:`
+            sql: str
+                A valid SQL statement
+            parameters: list
+                A list of python variables to be converted into SQL values in your query
+            batch_size: int
+                The number of rows to fetch per batch
+
+        `Returns:`
+            Generator of Parsons Tables
+        """
+
+        with self.connection() as connection:
+            # Naming the cursor makes psycopg2 declare it on the server, so rows are only
+            # sent over the wire as they are fetched
+            cursor = connection.cursor(
+                name=f"parsons_stream_{random.randrange(10**9)}",
+                cursor_factory=psycopg2.extras.DictCursor,
+            )
+            cursor.itersize = batch_size
+
+            try:
+                if "credentials" not in sql:
+                    logger.debug(f"SQL Query: {sql}")
+                cursor.execute(sql, parameters)
+
+                while True:
+                    batch = cursor.fetchmany(batch_size)
+                    if not batch:
+                        break
+
+                    logger.debug(f"Fetched {len(batch)} rows.")
+                    header = [i[0] for i in cursor.description]
+                    yield Table([header, *[tuple(row) for row in batch]])
+            finally:
+                cursor.close()
+
     def copy_s3(
         self,
         table_name,
@@ -499,6 +584,8 @@ class Redshift(
         temp_bucket_region: Optional[str] = None,
         strict_length: bool = True,
         csv_encoding: str = "utf-8",
+        slices: Optional[Union[int, str]] = None,
+        data_type: str = "csv",
     ):
         """
         Copy a :ref:`parsons-table` to Redshift.
@@ -612,12 +699,31 @@ class Redshift(
             csv_ecoding: str
                 String encoding to use when writing the temporary CSV file that is uploaded to S3.
                 Defaults to 'utf-8'.
+            slices: int or str
+                The number of files to split the table into when staging it in S3. The files
+                are compressed and uploaded concurrently, and loaded by a single ``COPY`` using
+                a manifest, so that every slice of the cluster loads data in parallel. Ideally a
+                multiple of the number of slices in the cluster; pass ``"auto"`` to use the
+                number of slices. Defaults to a single file, which is faster for small tables.
+            data_type: str
+                The format of the files staged in S3, either ``csv`` (gzip compressed) or
+                ``parquet``. Parquet files are written with the types of the destination
+                table's columns, so they are smaller and skip CSV parsing in Redshift. The CSV
+                options (e.g. ``max_errors``, ``dateformat``, ``emptyasnull``) don't apply to
+                Parquet; empty strings are loaded as nulls in non-varchar columns. Parquet
+                requires the ``pyarrow`` package.
 
         `Returns`
             Parsons Table or ``None``
                 See :ref:`parsons-table` for output options.
         """
 
+        if data_type not in ("csv", "parquet"):
+            raise ValueError(f"Only supports csv or parquet files [data_type = {data_type}]")
+
+        if slices is not None and slices != "auto" and not isinstance(slices, int):
+            raise ValueError(f"slices must be an int or 'auto' [slices = {slices}]")
+
         # Specify the columns for a copy statement.
         if specifycols or (specifycols is None and template_table):
             cols = tbl.columns
@@ -652,12 +758,29 @@ class Redshift(
                     tbl, table_name, drop_dependencies=alter_table_cascade
                 )
 
+            if slices == "auto":
+                slices = self.cluster_slices(connection)
+
+            # An empty table has no parts to list in a manifest, and COPY rejects an
+            # empty manifest
+            if slices and slices > 1 and tbl.num_rows == 0:
+                slices = None
+
+            parquet_schema = None
+            if data_type == "parquet":
+                parquet_schema = self.parquet_schema(
+                    table_name, tbl.columns, connection, match_names=cols is not None
+                )
+
             # Upload the table to S3
             key = self.temp_s3_copy(
                 tbl,
                 aws_access_key_id=aws_access_key_id,
                 aws_secret_access_key=aws_secret_access_key,
                 csv_encoding=csv_encoding,
+                slices=slices,
+                data_type=data_type,
+                parquet_schema=parquet_schema,
             )
 
             try:
@@ -680,6 +803,8 @@ class Redshift(
                     "aws_secret_access_key": aws_secret_access_key,
                     "compression": "gzip",
                     "bucket_region": temp_bucket_region,
+                    "manifest": bool(slices and slices > 1),
+                    "data_type": data_type,
                 }
 
                 # Copy from S3 to Redshift
@@ -696,6 +821,27 @@ class Redshift(
                 if key and cleanup_s3_file:
                     self.temp_s3_delete(key)
 
+    def cluster_slices(self, connection=None):
+        """
+        Get the number of slices in the cluster. Loading a multiple of this number of files
+        at once lets every slice take part in a ``COPY``.
+
+        `Args:`
+            connection: obj
+                (Optional) An existing database connection
+        `Returns:`
+            int
+        """
+
+        sql = "select count(*) as slices from stv_slices"
+
+        if connection:
+            tbl = self.query_with_connection(sql, connection, commit=False)
+        else:
+            tbl = self.query(sql)
+
+        return tbl.first
+
     def unload(
         self,
         sql,
@@ -821,6 +967,94 @@ class Redshift(
 
         return self.query(statement)
 
+    def unload_to_table(
+        self,
+        sql,
+        max_file_size="6.2 GB",
+        aws_region=None,
+        aws_access_key_id=None,
+        aws_secret_access_key=None,
+        max_workers=S3_UPLOAD_WORKERS,
+    ) -> Optional[Table]:
+        """
+        Run a query and return the results as a Parsons table, by unloading them to S3.
+
+        This is a much faster way to extract large results than :meth:`query`, which reads
+        every row through a single cursor. The results are unloaded in parallel by every
+        slice of the cluster, as Parquet files in a temp folder of the S3 temp bucket. The
+        files are downloaded concurrently, and the temp folder is then removed. The table
+        reads the downloaded files lazily, a batch of rows at a time. Requires the
+        ``pyarrow`` package.
+
+        Unlike :meth:`query`, rows are not returned in the order of an ``ORDER BY`` clause.
+
+        `Args:`
+            sql: str
+                A valid SQL statement
+            max_file_size: str
+                The max size of each unloaded file. Smaller files spread the download across
+                more workers.
+            aws_region: str
+                The AWS Region of the S3 temp bucket, if not the same as the cluster's
+            aws_access_key_id:
+                An AWS access key granted to the S3 temp bucket. Not required if keys are
+                stored as environmental variables.
+            aws_secret_access_key:
+                An AWS secret access key granted to the S3 temp bucket. Not required if keys
+                are stored as environmental variables.
+            max_workers: int
+                The max number of files to download at the same time
+
+        `Returns:`
+            Parsons Table or ``None``
+                ``None`` if the query returns zero rows. See :ref:`parsons-table` for output
+                options.
+        """
+
+        if not self.s3_temp_bucket:
+            raise KeyError(
+                (
+                    "Missing S3_TEMP_BUCKET, needed for unloading data from Redshift. "
+                    "Must be specified as env vars or kwargs"
+                )
+            )
+
+        # Coalesce S3 Key arguments
+        aws_access_key_id = aws_access_key_id or self.aws_access_key_id
+        aws_secret_access_key = aws_secret_access_key or self.aws_secret_access_key
+
+        self.s3 = S3(
+            aws_access_key_id=aws_access_key_id,
+            aws_secret_access_key=aws_secret_access_key,
+            use_env_token=self.use_env_token,
+            max_workers=max_workers,
+        )
+
+        folder = self.temp_s3_folder()
+        try:
+            self.unload(
+                sql,
+                self.s3_temp_bucket,
+                f"{folder}/part_",
+                manifest=False,
+                max_file_size=max_file_size,
+                aws_region=aws_region,
+                format="parquet",
+                aws_access_key_id=aws_access_key_id,
+                aws_secret_access_key=aws_secret_access_key,
+            )
+            file_paths = self.temp_s3_download(folder)
+        finally:
+            self.temp_s3_delete_folder(folder)
+
+        view = ParquetView(file_paths)
+        logger.info(f"Unloaded {view.num_rows} rows in {len(file_paths)} files.")
+
+        if not view.num_rows:
+            return None
+
+        return Table(view)
+
     def drop_and_unload(
         self,
         rs_table,
@@ -890,6 +1124,7 @@ class Redshift(
         manifest_bucket=None,
         manifest_key=None,
         path=None,
+        content_length=False,
     ):
         """
         Given a list of S3 buckets, generate a manifest file (JSON format). A manifest file
@@ -916,6 +1151,9 @@ class Redshift(
                 Optional bucket to write manifest file.
             manifest_key: str
                 Optional key name for S3 bucket to write file
+            content_length: boolean
+                Whether to include the size of each file in the manifest, which Redshift
+                requires to ``COPY`` columnar files such as Parquet.
 
         `Returns:`
             ``dict`` of manifest
@@ -938,10 +1176,11 @@ class Redshift(
         for bucket in buckets:
             # Retrieve list of files in bucket
             key_list = s3.list_keys(bucket, prefix=prefix)
-            for key in key_list:
-                manifest["entries"].append(
-                    {"url": "/".join(["s3:/", bucket, key]), "mandatory": mandatory}
-                )
+            for key, key_info in key_list.items():
+                entry = {"url": "/".join(["s3:/", bucket, key]), "mandatory": mandatory}
+                if content_length:
+                    entry["meta"] = {"content_length": key_info["Size"]}
+                manifest["entries"].append(entry)
 
         logger.info("Manifest generated.")
 
@@ -972,6 +1211,8 @@ class Redshift(
         from_s3=False,
         distkey=None,
         sortkey=None,
+        method="delete_insert",
+        temp_staging_table=False,
         **copy_args,
     ):
         r"""
@@ -985,10 +1226,16 @@ class Redshift(
                 The schema and table name to upsert
             primary_key: str or list
                 The primary key column(s) of the target table
-            vacuum: boolean
+            vacuum: boolean or str
                 Re-sorts rows and reclaims space in the specified table. You must be a table owner
                 or super user to effectively vacuum a table, however the method will not fail
-                if you lack these priviledges.
+                if you lack these priviledges. Set to a vacuum type (``full``, ``sort only``,
+                ``delete only``, ``reindex`` or ``recluster``) to run that type of vacuum
+                rather than a full vacuum. Set to ``auto`` to only sort the unsorted rows
+                (``recluster``) if the table has a compound sort key, to sort without
+                reclaiming space (``sort only``) if it has an interleaved sort key, or
+                otherwise only reclaim the space of the replaced rows (``delete only``); on
+                large tables this takes a fraction of the time of a full vacuum.
             distinct_check: boolean
                 Check if the primary key column is distinct. Raise error if not.
             cleanup_temp_table: boolean
@@ -1006,10 +1253,25 @@ class Redshift(
                 The column name of the distkey. If not provided, will default to ``primary_key``.
             sortkey: str or list
                 The column name(s) of the sortkey. If not provided, will default to ``primary_key``.
+            method: str
+                How the staged rows are applied to the target table. ``delete_insert`` deletes
+                the matching rows, then inserts the staged rows. ``merge`` runs a single
+                ``MERGE`` statement, which scans the target table once; it requires the staged
+                rows to have distinct primary keys.
+            temp_staging_table: boolean
+                Stage the rows in a temporary table rather than a regular table in the target
+                table's schema. Temporary tables aren't backed up or replicated, so are faster
+                to load, and are dropped automatically at the end of the session.
             **copy_args: kwargs
                 See :func:`~parsons.databases.Redshift.copy` for options.
         """
 
+        if method not in ["delete_insert", "merge"]:
+            raise ValueError(f"Invalid upsert method: {method}")
+
+        if isinstance(vacuum, str) and vacuum.lower() not in VACUUM_OPTIONS + ["auto"]:
+            raise ValueError(f"Invalid vacuum type: {vacuum}")
+
         if isinstance(primary_key, str):
             primary_keys = [primary_key]
         else:
@@ -1038,6 +1300,9 @@ class Redshift(
         date_stamp = datetime.datetime.now().strftime("%Y%m%d_%H%M")
         # Generate a temp table like "table_tmp_20200210_1230_14212"
         staging_tbl = "{}_stg_{}_{}".format(target_table, date_stamp, noise)
+        if temp_staging_table:
+            # Temporary tables live in a schema of their own
+            staging_tbl = self.split_full_table_name(staging_tbl)[1]
 
         if distinct_check:
             primary_keys_statement = ", ".join(primary_keys)
@@ -1057,10 +1322,21 @@ class Redshift(
             if diff > 0:
                 raise ValueError("Primary key column contains duplicate values.")
 
-        with self.connection() as connection:
+        # A temporary staging table is loaded and applied on the same connection, as it is
+        # only visible to the session that created it
+        pinned = self.pinned_connection() if temp_staging_table else nullcontext()
+        with pinned, self.connection() as connection:
             try:
                 # Copy to a staging table
                 logger.info(f"Building staging table: {staging_tbl}")
+                if temp_staging_table:
+                    self.query_with_connection(
+                        f"CREATE TEMP TABLE {staging_tbl} (LIKE {target_table});",
+                        connection,
+                        commit=False,
+                    )
+                    copy_args = dict(copy_args, if_exists="append")
+
                 if "compupdate" not in copy_args:
                     # Especially with a lot of columns, compupdate=True can
                     # cause a lot of processing/analysis by Redshift before upload.
@@ -1087,51 +1363,115 @@ class Redshift(
                         **copy_args,
                     )
 
-                staging_table_name = staging_tbl.split(".")[1]
-                target_table_name = target_table.split(".")[1]
+                staging_table_name = self.split_full_table_name(staging_tbl)[1]
+                target_table_name = self.split_full_table_name(target_table)[1]
 
-                # Delete rows
                 comparisons = [
                     f"{staging_table_name}.{primary_key} = {target_table_name}.{primary_key}"
                     for primary_key in primary_keys
                 ]
                 where_clause = " and ".join(comparisons)
 
-                sql = f"""
-                       DELETE FROM {target_table}
-                       USING {staging_tbl}
-                       WHERE {where_clause}
-                       """
-                self.query_with_connection(sql, connection, commit=False)
-                logger.debug(f"Target rows deleted from {target_table}.")
-
-                # Insert rows
-                # ALTER TABLE APPEND would be more efficient, but you can't run it in a
-                # transaction block. It's worth the performance hit to not commit until the
-                # end.
-                sql = f"""
-                       INSERT INTO {target_table}
-                       SELECT * FROM {staging_tbl};
-                       """
+                if method == "merge":
+                    # Replaces the matching rows and inserts the rest in one pass
+                    sql = f"""
+                           MERGE INTO {target_table}
+                           USING {staging_tbl}
+                           ON {where_clause}
+                           REMOVE DUPLICATES;
+                           """
+                    self.query_with_connection(sql, connection, commit=False)
+                    logger.info(f"Target rows merged into {target_table}")
 
-                self.query_with_connection(sql, connection, commit=False)
-                logger.info(f"Target rows inserted to {target_table}")
-
-            finally:
+                else:
+                    # Delete rows
+                    sql = f"""
+                           DELETE FROM {target_table}
+                           USING {staging_tbl}
+                           WHERE {where_clause}
+                           """
+                    self.query_with_connection(sql, connection, commit=False)
+                    logger.debug(f"Target rows deleted from {target_table}.")
+
+                    # Insert rows
+                    # ALTER TABLE APPEND would be more efficient, but you can't run it in a
+                    # transaction block. It's worth the performance hit to not commit until the
+                    # end.
+                    sql = f"""
+                           INSERT INTO {target_table}
+                           SELECT * FROM {staging_tbl};
+                           """
+
+                    self.query_with_connection(sql, connection, commit=False)
+                    logger.info(f"Target rows inserted to {target_table}")
+
+            except Exception:
                 if cleanup_temp_table:
-                    # Drop the staging table
-                    self.query_with_connection(
-                        f"DROP TABLE IF EXISTS {staging_tbl};", connection, commit=False
-                    )
-                    logger.info(f"{staging_tbl} staging table dropped.")
+                    self._drop_staging_table_after_error(staging_tbl, connection)
+                raise
+
+            if cleanup_temp_table:
+                # Drop the staging table
+                self.query_with_connection(
+                    f"DROP TABLE IF EXISTS {staging_tbl};", connection, commit=False
+                )
+                logger.info(f"{staging_tbl} staging table dropped.")
 
         # Vacuum table. You must commit when running this type of transaction.
         if vacuum:
+            if vacuum is True:
+                sql = f"VACUUM {target_table};"
+            elif vacuum.lower() == "auto":
+                sql = f"VACUUM {self._incremental_vacuum_type(target_table)} {target_table};"
+            else:
+                sql = f"VACUUM {vacuum.upper()} {target_table};"
+
             with self.connection() as connection:
                 connection.set_session(autocommit=True)
-                self.query_with_connection(f"VACUUM {target_table};", connection)
+                self.query_with_connection(sql, connection)
                 logger.info(f"{target_table} vacuumed.")
 
+    def _drop_staging_table_after_error(self, staging_tbl, connection):
+        # The error aborted the connection's transaction, so it is rolled back before the
+        # drop. A failure to drop is only logged, so that it doesn't hide the error.
+        try:
+            connection.rollback()
+            self.query_with_connection(f"DROP TABLE IF EXISTS {staging_tbl};", connection)
+            logger.info(f"{staging_tbl} staging table dropped.")
+        except Exception as e:
+            logger.warning(f"Unable to drop staging table {staging_tbl}: {e}")
+
+    def _incremental_vacuum_type(self, table_name):
+        # Sorting only the unsorted region is much cheaper than a full vacuum, which
+        # re-sorts the whole table; without a sort key, there is nothing to sort
+        schema, table = self.split_full_table_name(table_name)
+        info = self.query(
+            """
+            select table_id, sortkey1, sortkey_num
+            from svv_table_info
+            where "schema" = %s and "table" = %s;
+            """,
+            parameters=[schema, table],
+        )
+
+        if not info or not info[0]["sortkey_num"]:
+            return "DELETE ONLY"
+
+        sortkey1 = info[0]["sortkey1"] or ""
+        if sortkey1.upper().startswith("AUTO"):
+            # Redshift picks and maintains automatic sort keys itself
+            return "DELETE ONLY"
+
+        # RECLUSTER isn't supported on interleaved sort keys
+        interleaved = sortkey1.upper().startswith("INTERLEAVED") or self.query(
+            "select 1 from svv_interleaved_columns where tbl = %s limit 1;",
+            parameters=[info[0]["table_id"]],
+        )
+        if interleaved:
+            return "SORT ONLY"
+
+        return "RECLUSTER"
+
     def drop_dependencies_for_cols(self, schema, table, cols):
         fmt_cols = ", ".join([f"'{c}'" for c in cols])
         sql_depend = f"""
@@ -1242,4 +1582,13 @@ class Redshift(
 class RedshiftTable(BaseTable):
     # Redshift table object.
 
-    pass
+    @property
+    def estimated_num_rows(self):
+        schema, table = self.db.split_full_table_name(self.table)
+        # Only tables with data are listed, so a missing row could be an empty table or
+        # one that doesn't exist
+        result = self.db.query(
+            'SELECT tbl_rows FROM svv_table_info WHERE "schema" = %s AND "table" = %s',
+            [schema, table],
+        )
+        return result.first if result else None
@@ -1,6 +1,8 @@
 import logging
+import math
 import os
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 from parsons.aws.s3 import S3
 
@@ -8,6 +10,13 @@ logger = logging.getLogger(__name__)
 
 S3_TEMP_KEY_PREFIX = "Parsons_RedshiftCopyTable"
 
+# Max number of file parts that are written and uploaded to S3 at once when staging a
+# sliced copy. Each part in flight is spilled to a local temp file.
+S3_UPLOAD_WORKERS = 8
+
+# Name of the manifest file, relative to the temp folder of a sliced copy
+S3_MANIFEST_NAME = "manifest"
+
 
 class RedshiftCopyTable(object):
     aws_access_key_id = None
@@ -62,6 +71,12 @@ class RedshiftCopyTable(object):
         if bucket_region:
             sql += f"region '{bucket_region}'\n"
             logger.info("Copying data from S3 bucket %s in region %s", bucket, bucket_region)
+
+        # Columnar files carry their own types and layout, so the CSV and JSON
+        # options don't apply
+        if data_type == "parquet":
+            return sql + "format as parquet \n;"
+
         sql += f"maxerror {max_errors} \n"
 
         # Redshift has some default behavior when statupdate is left out
@@ -145,6 +160,9 @@ class RedshiftCopyTable(object):
         aws_access_key_id=None,
         aws_secret_access_key=None,
         csv_encoding="utf-8",
+        slices=None,
+        data_type="csv",
+        parquet_schema=None,
     ):
         if not self.s3_temp_bucket:
             raise KeyError(
@@ -164,19 +182,174 @@ class RedshiftCopyTable(object):
             use_env_token=self.use_env_token,
         )
 
+        if data_type == "parquet":
+            suffix = ".parquet"
+
+            def write_file(part):
+                return part.to_parquet(schema=parquet_schema)
+
+        else:
+            suffix = ".csv.gz"
+
+            # Convert table to compressed CSV file, to optimize the transfers to S3 and to
+            # Redshift.
+            def write_file(part):
+                return part.to_csv(temp_file_compression="gzip", encoding=csv_encoding)
+
+        if slices and slices > 1:
+            return self.temp_s3_copy_sliced(
+                tbl,
+                self.temp_s3_folder(),
+                slices,
+                write_file,
+                suffix,
+                aws_access_key_id=aws_access_key_id,
+                aws_secret_access_key=aws_secret_access_key,
+                content_length=data_type == "parquet",
+            )
+
         hashed_name = hash(time.time())
-        key = f"{S3_TEMP_KEY_PREFIX}/{hashed_name}.csv.gz"
+        key = f"{S3_TEMP_KEY_PREFIX}/{hashed_name}{suffix}"
         if self.s3_temp_bucket_prefix:
             key = self.s3_temp_bucket_prefix + "/" + key
 
-        # Convert table to compressed CSV file, to optimize the transfers to S3 and to
-        # Redshift.
-        local_path = tbl.to_csv(temp_file_compression="gzip", encoding=csv_encoding)
+        local_path = write_file(tbl)
         # Copy table to bucket
         self.s3.put_file(self.s3_temp_bucket, key, local_path)
 
         return key
 
+    def temp_s3_copy_sliced(
+        self,
+        tbl,
+        folder,
+        slices,
+        write_file,
+        suffix,
+        aws_access_key_id=None,
+        aws_secret_access_key=None,
+        content_length=False,
+    ):
+        # Split the table into ``slices`` files, each written with ``write_file`` and
+        # uploaded to S3 concurrently, and generate a manifest so that a single COPY loads
+        # all of them.
+        # Redshift loads the files of a manifest in parallel across the slices of the
+        # cluster, while a single file is only loaded by one slice.
+        # Returns the key of the manifest.
+
+        rows_per_part = max(math.ceil(tbl.num_rows / slices), 1)
+
+        def upload_part(index, part):
+            key = f"{folder}/part_{index:04d}{suffix}"
+            local_path = write_file(part)
+            self.s3.put_file(self.s3_temp_bucket, key, local_path)
+
+        # Each part is written to a local temp file as it is read from the table, rather
+        # than held in memory, and the next part is read as soon as one finishes uploading.
+        workers = min(slices, S3_UPLOAD_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = set()
+            for index, part in enumerate(tbl.iter_chunks(rows_per_part, to_file=True)):
+                if len(pending) >= workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+
+                pending.add(executor.submit(upload_part, index, part))
+
+            for future in pending:
+                future.result()
+
+        manifest_key = f"{folder}/{S3_MANIFEST_NAME}"
+        manifest = self.generate_manifest(
+            self.s3_temp_bucket,
+            aws_access_key_id=aws_access_key_id,
+            aws_secret_access_key=aws_secret_access_key,
+            prefix=f"{folder}/part_",
+            manifest_bucket=self.s3_temp_bucket,
+            manifest_key=manifest_key,
+            content_length=content_length,
+        )
+
+        logger.info(f"Staged {len(manifest['entries'])} files in S3 for copy.")
+
+        return manifest_key
+
+    def parquet_schema(self, table_name, columns, connection, match_names=False):
+        # Build the Parquet schema for a copy into an existing table, so that each column
+        # is written with the type of the column it is loaded into. Redshift rejects
+        # Parquet columns whose type doesn't match the table (e.g. an int64 loaded into an
+        # integer column).
+
+        import pyarrow as pa
+
+        schema, table = self.split_full_table_name(table_name)
+        sql = f"""
+            select column_name, data_type, numeric_precision, numeric_scale
+            from information_schema.columns
+            where table_schema = '{schema}' and table_name = '{table}'
+            order by ordinal_position
+        """
+        target = self.query_with_connection(sql, connection, commit=False) or []
+        target_columns = list(target)
+
+        if match_names:
+            by_name = {col["column_name"]: col for col in target_columns}
+            target_columns = [by_name.get(col.lower()) for col in columns]
+
+        types = {
+            "smallint": pa.int16(),
+            "integer": pa.int32(),
+            "bigint": pa.int64(),
+            "real": pa.float32(),
+            "double precision": pa.float64(),
+            "boolean": pa.bool_(),
+            "date": pa.date32(),
+            "timestamp without time zone": pa.timestamp("us"),
+            "timestamp with time zone": pa.timestamp("us", tz="UTC"),
+        }
+
+        fields = []
+        for index, col in enumerate(columns):
+            target_col = target_columns[index] if index < len(target_columns) else None
+
+            if target_col is None:
+                arrow_type = pa.string()
+            elif target_col["data_type"] == "numeric":
+                arrow_type = pa.decimal128(
+                    target_col["numeric_precision"], target_col["numeric_scale"]
+                )
+            else:
+                # Any other type is loaded from a string
+                arrow_type = types.get(target_col["data_type"], pa.string())
+
+            fields.append(pa.field(col, arrow_type))
+
+        return pa.schema(fields)
+
+    def temp_s3_folder(self):
+        # A new, unique folder for temp files in the S3 temp bucket
+        folder = f"{S3_TEMP_KEY_PREFIX}/{hash(time.time())}"
+        if self.s3_temp_bucket_prefix:
+            folder = self.s3_temp_bucket_prefix + "/" + folder
+
+        return folder
+
+    def temp_s3_download(self, folder):
+        # Download every file in a temp folder, returning the local paths in key order
+        keys = sorted(self.s3.list_keys(self.s3_temp_bucket, prefix=f"{folder}/"))
+        return list(self.s3.get_files(self.s3_temp_bucket, keys).values())
+
+    def temp_s3_delete_folder(self, folder):
+        keys = self.s3.list_keys(self.s3_temp_bucket, prefix=f"{folder}/")
+        self.s3.remove_files(self.s3_temp_bucket, keys)
+
     def temp_s3_delete(self, key):
-        if key:
+        if not key:
+            return
+
+        if key.endswith(f"/{S3_MANIFEST_NAME}"):
+            # A sliced copy; remove every file in its temp folder
+            self.temp_s3_delete_folder(key[: -len(S3_MANIFEST_NAME) - 1])
+        else:
             self.s3.remove_file(self.s3_temp_bucket, key)
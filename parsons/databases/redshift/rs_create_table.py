@@ -52,6 +52,8 @@ class RedshiftCreateTable(DatabaseCreateStatement):
         varchar_truncate=True,
         columntypes=None,
         strict_length=True,
+        sample_size=None,
+        verify_sample=False,
     ):
         # Warn the user if they don't provide a DIST key or a SORT key
         self._log_key_warning(distkey=distkey, sortkey=sortkey, method="copy")
@@ -64,7 +66,9 @@ class RedshiftCreateTable(DatabaseCreateStatement):
         if tbl.num_rows == 0:
             raise ValueError("Table is empty. Must have 1 or more rows.")
 
-        mapping = self.generate_data_types(tbl)
+        mapping = self.generate_data_types(
+            tbl, sample_size=sample_size, verify_sample=verify_sample
+        )
 
         if padding:
             mapping["longest"] = self.vc_padding(mapping, padding)
@@ -99,36 +103,21 @@ class RedshiftCreateTable(DatabaseCreateStatement):
     def is_valid_integer(self, val):
         return self.is_valid_sql_num(val)
 
-    def generate_data_types(self, table):
+    def generate_data_types(self, table, sample_size=None, verify_sample=False):
         # Generate column data types
 
-        longest, type_list = [], []
-
-        cont = petl.records(table.table)
-
-        # Populate empty values for the columns
-        for col in table.columns:
-            longest.append(0)
-            type_list.append("")
-
-        for row in cont:
-            for i in range(len(row)):
-                # NA is the csv null value
-                if type_list[i] == "varchar" or row[i] in ["NA", ""]:
-                    pass
-                else:
-                    var_type = self.data_type(row[i], type_list[i])
-                    type_list[i] = var_type
-
-                # Calculate width
-                if len(str(row[i]).encode("utf-8")) > longest[i]:
-                    longest[i] = len(str(row[i]).encode("utf-8"))
-
-        # In L138 'NA' and '' will be skipped
-        # If the entire column is either one of those (or a mix of the two)
-        # the type will be empty.
-        # Fill with a default varchar
-        type_list = [typ or "varchar" for typ in type_list]
+        # NA is the csv null value. 'NA' and '' are skipped when detecting types; if the
+        # entire column is either one of those (or a mix of the two) the type will be
+        # empty. Fill with a default varchar
+        profile = self.profile_columns(
+            table,
+            null_values=("NA", ""),
+            sample_size=sample_size,
+            verify_sample=verify_sample,
+        )
+
+        longest = [col["width"] for col in profile]
+        type_list = [col["type"] or "varchar" for col in profile]
 
         return {"longest": longest, "headers": table.columns, "type_list": type_list}
 
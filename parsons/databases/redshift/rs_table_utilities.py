@@ -30,6 +30,19 @@ class RedshiftTableUtilities(object):
         table_name = table_name.lower().split(".")
         table_name = [x.strip() for x in table_name]
 
+        if len(table_name) == 1:
+            # Names without a schema (e.g. temporary tables) are looked up on the search path
+            kinds = "'r', 'v'" if view else "'r'"
+            sql = f"""select count(*) from pg_class where relname='{table_name[0]}' and
+                      relkind in ({kinds}) and pg_table_is_visible(oid);"""
+
+            with self.cursor(connection) as cursor:
+                cursor.execute(sql)
+                exists = cursor.fetchone()[0] >= 1
+
+            logger.debug(f"{table_name[0]} {'exists' if exists else 'does NOT exist'}.")
+            return exists
+
         # Check in pg tables for the table
         sql = """select count(*) from pg_tables where schemaname='{}' and
                  tablename='{}';""".format(table_name[0], table_name[1])
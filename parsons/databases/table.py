@@ -26,6 +26,15 @@ class BaseTable:
 
         return self.db.query(f"SELECT COUNT(*) FROM {self.table}").first
 
+    @property
+    def estimated_num_rows(self):
+        """
+        Get an estimate of the number of rows in the table from the database's catalog,
+        without counting them. ``None`` if the database doesn't have an estimate.
+        """
+
+        return None
+
     def max_primary_key(self, primary_key):
         """
         Get the maximum primary key in the table.
@@ -56,6 +65,15 @@ class BaseTable:
         else:
             return True
 
+    def has_nulls(self, column):
+        """
+        Check if the column has any NULL values.
+        """
+
+        sql = f"SELECT COUNT(*) FROM {self.table} WHERE {column} IS NULL"
+
+        return self.db.query(sql).first > 0
+
     @property
     def columns(self):
         """
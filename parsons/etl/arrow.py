@@ -0,0 +1,274 @@
+from itertools import zip_longest
+
+import petl
+
+# Number of rows converted between Python objects and Arrow arrays at a time
+ARROW_BATCH_SIZE = 100000
+
+
+class ArrowView(petl.Table):
+    """
+    A petl table backed by a ``pyarrow.Table``.
+
+    Data stays in Arrow's columnar buffers and is only converted to Python objects, one
+    record batch at a time, as rows are iterated. Parsons ``Table`` methods that have a
+    vectorized implementation operate on ``arrow_table`` directly; every other petl
+    transformation works on top of this view like any other petl table.
+
+    `Args:`
+        arrow_table: pyarrow.Table
+            The Arrow table to wrap
+    """
+
+    def __init__(self, arrow_table):
+        self.arrow_table = arrow_table
+
+    def __iter__(self):
+        yield tuple(self.arrow_table.column_names)
+
+        for batch in self.arrow_table.to_batches(max_chunksize=ARROW_BATCH_SIZE):
+            if batch.num_columns == 0:
+                yield from (() for _ in range(batch.num_rows))
+            else:
+                yield from zip(*(column.to_pylist() for column in batch.columns))
+
+
+class ParquetView(petl.Table):
+    """
+    A petl table that reads one or more Parquet files with the same columns, one after the
+    other.
+
+    Files are read one record batch at a time, so only a single batch of rows is held in
+    memory while iterating. The number of rows is read from the file footers up front.
+
+    `Args:`
+        file_paths: list
+            The paths of the Parquet files
+        batch_size: int
+            The max number of rows to read at a time
+    """
+
+    def __init__(self, file_paths, batch_size=ARROW_BATCH_SIZE):
+        import pyarrow.parquet as pq
+
+        self.file_paths = file_paths
+        self.batch_size = batch_size
+        self.num_rows = sum(pq.read_metadata(file_path).num_rows for file_path in file_paths)
+
+    def __iter__(self):
+        import pyarrow.parquet as pq
+
+        for index, file_path in enumerate(self.file_paths):
+            parquet_file = pq.ParquetFile(file_path)
+
+            if index == 0:
+                yield tuple(parquet_file.schema_arrow.names)
+
+            for batch in parquet_file.iter_batches(batch_size=self.batch_size):
+                yield from zip(*(column.to_pylist() for column in batch.columns))
+
+
+def petl_to_arrow(table, batch_size=ARROW_BATCH_SIZE):
+    """
+    Convert a petl table into a ``pyarrow.Table``.
+
+    Rows are read in batches of ``batch_size`` and converted column by column, so only
+    one batch of Python objects is held in memory at a time. Column types are inferred
+    per batch and promoted across batches (e.g. a column that is entirely null in the
+    first batch).
+
+    `Args:`
+        table: petl table
+            The table to convert
+        batch_size: int
+            The number of rows to convert at a time
+    `Returns:`
+        pyarrow.Table
+    """
+
+    import pyarrow as pa
+
+    if isinstance(table, ArrowView):
+        return table.arrow_table
+
+    rows = iter(table)
+    header = [str(column) for column in next(rows, [])]
+
+    def to_batch(batch):
+        # Short rows are padded with None, like petl does when reading ragged rows
+        columns = list(zip_longest(*batch))[: len(header)]
+        columns += [[None] * len(batch)] * (len(header) - len(columns))
+        return pa.Table.from_arrays([pa.array(column) for column in columns], names=header)
+
+    tables = []
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            tables.append(to_batch(batch))
+            batch = []
+
+    if batch or not tables:
+        tables.append(to_batch(batch))
+
+    if len(tables) == 1:
+        return tables[0]
+
+    return pa.concat_tables(tables, promote_options="default")
+
+
+def is_compute_function(obj):
+    """
+    Whether an object is one of the vectorized ``pyarrow.compute`` functions.
+    """
+
+    return hasattr(obj, "__arrow_compute_function__")
+
+
+def sort_indices(arrow_table, columns, reverse=False):
+    """
+    Return the indices that sort ``arrow_table`` the way ``petl.sort`` would: a stable sort
+    on ``columns`` with nulls ordered before every other value.
+    """
+
+    import pyarrow.compute as pc
+
+    order = "descending" if reverse else "ascending"
+
+    return pc.sort_indices(
+        arrow_table,
+        sort_keys=[(column, order) for column in columns],
+        null_placement="at_end" if reverse else "at_start",
+    )
+
+
+def cast_arrow_table(arrow_table, schema):
+    """
+    Cast ``arrow_table`` to ``schema``, matching columns by position.
+
+    Empty strings are treated as nulls in any string column that is cast to another type,
+    the way databases treat empty values in a CSV. Any columns missing from ``arrow_table``
+    are filled with nulls.
+
+    `Args:`
+        arrow_table: pyarrow.Table
+            The table to cast
+        schema: pyarrow.Schema
+            The schema to cast to; must have the same number of columns
+    `Returns:`
+        pyarrow.Table
+    """
+
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    # Missing columns are filled with nulls, like short rows
+    missing = len(schema) - arrow_table.num_columns
+    sources = arrow_table.columns + [pa.nulls(arrow_table.num_rows)] * max(missing, 0)
+
+    columns = []
+    for column, field in zip(sources, schema):
+        if pa.types.is_string(column.type) and not pa.types.is_string(field.type):
+            # Combined first, as if_else doesn't handle sliced string arrays
+            column = column.combine_chunks()
+            column = pc.if_else(pc.equal(column, ""), pa.scalar(None, column.type), column)
+        columns.append(column.cast(field.type))
+
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def rows_to_arrow(rows, schema):
+    """
+    Convert a batch of rows into a ``pyarrow.Table`` with the given schema, matching
+    columns by position.
+
+    Unlike :func:`petl_to_arrow`, a column may mix Python types (e.g. the ints and strings
+    of a column read from a CSV); its values are then converted via their string
+    representation before being cast.
+
+    `Args:`
+        rows: iterable
+            The rows to convert, without a header
+        schema: pyarrow.Schema
+            The schema of the result
+    `Returns:`
+        pyarrow.Table
+    """
+
+    return cast_arrow_table(_rows_to_arrow(rows, schema.names), schema)
+
+
+def infer_schema(rows, names):
+    """
+    Infer a ``pyarrow.Schema`` from a batch of rows, the way :func:`rows_to_arrow` converts
+    them: a column that mixes Python types is a string column. Columns with no values are
+    also given a string type, as most file formats and databases don't have a type for
+    null.
+
+    `Args:`
+        rows: iterable
+            The rows to infer the schema from, without a header
+        names: list
+            The column names
+    `Returns:`
+        pyarrow.Schema
+    """
+
+    return null_columns_to_string(_rows_to_arrow(rows, names)).schema
+
+
+def incompatible_columns(rows, schema):
+    """
+    Return the names of the columns whose values in ``rows`` can't be cast to their type
+    in ``schema`` by :func:`rows_to_arrow` (e.g. strings in a column of ints).
+    """
+
+    import pyarrow as pa
+
+    arrow_table = _rows_to_arrow(rows, schema.names)
+
+    names = []
+    for column, field in zip(arrow_table.columns, schema):
+        try:
+            cast_arrow_table(pa.table([column], names=[field.name]), pa.schema([field]))
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            names.append(field.name)
+
+    return names
+
+
+def _rows_to_arrow(rows, names):
+    # Converts each column with the type pyarrow infers for it, or as strings if its
+    # values mix Python types
+    import pyarrow as pa
+
+    rows = list(rows)
+    columns = list(zip_longest(*rows))[: len(names)]
+    columns += [[None] * len(rows)] * (len(names) - len(columns))
+
+    arrays = []
+    for column in columns:
+        try:
+            array = pa.array(column)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            array = pa.array([None if v is None else str(v) for v in column], type=pa.string())
+        arrays.append(array)
+
+    return pa.Table.from_arrays(arrays, names=list(names))
+
+
+def null_columns_to_string(arrow_table):
+    """
+    Give any column with no values a string type, as most file formats and databases
+    don't have a type for null.
+    """
+
+    import pyarrow as pa
+
+    for index, field in enumerate(arrow_table.schema):
+        if pa.types.is_null(field.type):
+            arrow_table = arrow_table.set_column(
+                index, field.name, arrow_table.column(index).cast(pa.string())
+            )
+
+    return arrow_table
@@ -1,7 +1,11 @@
+import functools
 import logging
+import operator
 
 import petl
 
+from parsons.etl.arrow import ArrowView, is_compute_function, sort_indices
+
 logger = logging.getLogger(__name__)
 
 
@@ -9,6 +13,12 @@ class ETL(object):
     def __init__(self):
         pass
 
+    def _arrow_table(self):
+        # The backing pyarrow.Table when the Arrow storage backend is active, otherwise None
+        if isinstance(self.table, ArrowView):
+            return self.table.arrow_table
+        return None
+
     def head(self, n=5):
         """
         Return the first n rows of the table
@@ -146,10 +156,18 @@ class ETL(object):
             `Parsons Table` and also updates self
         """
 
+        arrow_table = self._arrow_table()
+
         if callable(fill_value):
             self.table = petl.convert(
                 self.table, column_name, lambda _, r: fill_value(r), pass_row=True
             )
+        elif arrow_table is not None:
+            import pyarrow as pa
+
+            index = arrow_table.column_names.index(column_name)
+            values = pa.repeat(fill_value, arrow_table.num_rows)
+            self.table = ArrowView(arrow_table.set_column(index, column_name, values))
         else:
             self.table = petl.update(self.table, column_name, fill_value)
 
@@ -209,6 +227,11 @@ class ETL(object):
         invocations or dictionary translations. This leverages the petl ``convert()``
         method. Example usage can be found `here <https://petl.readthedocs.io/en/v0.24/transform.html#petl.convert>`_.
 
+        If the table is stored in Arrow format (see :meth:`Table.materialize`), a
+        ``pyarrow.DataType`` or a ``pyarrow.compute`` function can be passed as the
+        converter to transform the whole column at once, e.g.
+        ``tbl.convert_column('name', pyarrow.compute.utf8_upper)``.
+
         `Args:`
             *column: str
                 A single column or multiple columns passed as a list
@@ -218,6 +241,28 @@ class ETL(object):
             `Parsons Table` and also updates self
         """
 
+        arrow_table = self._arrow_table()
+
+        if arrow_table is not None and len(column) == 2 and not kwargs:
+            import pyarrow as pa
+
+            fields, converter = column
+            if isinstance(converter, pa.DataType) or is_compute_function(converter):
+                if isinstance(fields, str):
+                    fields = [fields]
+
+                for field in fields:
+                    index = arrow_table.column_names.index(field)
+                    values = arrow_table.column(index)
+                    if isinstance(converter, pa.DataType):
+                        values = values.cast(converter)
+                    else:
+                        values = converter(values)
+                    arrow_table = arrow_table.set_column(index, field, values)
+
+                self.table = ArrowView(arrow_table)
+                return self
+
         self.table = petl.convert(self.table, *column, **kwargs)
 
         return self
@@ -781,6 +826,10 @@ class ETL(object):
 
         from parsons.etl.table import Table
 
+        arrow_table = self._arrow_table()
+        if arrow_table is not None:
+            return Table(ArrowView(arrow_table.select(list(columns))))
+
         return Table(petl.cut(self.table, *columns))
 
     def select_rows(self, *filters):
@@ -809,14 +858,28 @@ class ETL(object):
             tbl3
             >>> {'foo': 'a', 'bar': 2, 'baz': 88.1}
 
+            # Arrow Expression, if the table is stored in Arrow format
+            tbl.materialize(format='arrow')
+            tbl4 = tbl.select_rows(pyarrow.compute.field('baz') > 88.1)
+            tbl4
+            >>> {'foo': 'a', 'bar': 2, 'baz': 88.1}
+
         `Args:`
-            *filters: function or str
+            *filters: function or str or pyarrow.compute.Expression
         `Returns:`
             A new parsons table containing the selected rows
         """
 
         from parsons.etl.table import Table
 
+        arrow_table = self._arrow_table()
+        if arrow_table is not None and filters:
+            import pyarrow.compute as pc
+
+            if all(isinstance(f, pc.Expression) for f in filters):
+                expression = functools.reduce(operator.and_, filters)
+                return Table(ArrowView(arrow_table.filter(expression)))
+
         return Table(petl.select(self.table, *filters))
 
     def remove_null_rows(self, columns, null_value=None):
@@ -896,23 +959,73 @@ class ETL(object):
 
         self.table = petl.cat(self.table, *petl_tables, missing=missing)
 
-    def chunk(self, rows):
+    def chunk(self, rows, to_file=False):
         """
         Divides a Parsons table into smaller tables of a specified row count. If the table
         cannot be divided evenly, then the final table will only include the remainder.
 
+        The source table is read only once. Unless ``to_file`` is set, all of the chunks are
+        held in memory at the same time; to process a large table one chunk at a time, use
+        :meth:`iter_chunks` instead.
+
         `Args:`
             rows: int
                 The number of rows of each new Parsons table
+            to_file: bool
+                If ``True``, each chunk is written to its own local temp file rather than
+                held in memory. Defaults to ``False``.
         `Returns:`
             List of Parsons tables
         """
 
+        return list(self.iter_chunks(rows, to_file=to_file))
+
+    def iter_chunks(self, rows, to_file=False):
+        """
+        Lazily divides a Parsons table into smaller tables of a specified row count. If the
+        table cannot be divided evenly, then the final table will only include the remainder.
+
+        Unlike slicing the table once per chunk, this reads the source table a single time,
+        so chunking a table costs the same no matter how many chunks it is split into. Only
+        the chunk currently being yielded is held in memory.
+
+        `Args:`
+            rows: int
+                The number of rows of each new Parsons table
+            to_file: bool
+                If ``True``, each chunk is written to its own local temp file rather than
+                held in memory. Defaults to ``False``.
+        `Returns:`
+            Generator of Parsons tables
+        """
+
         from parsons.etl import Table
 
-        return [
-            Table(petl.rowslice(self.table, i, i + rows)) for i in range(0, self.num_rows, rows)
-        ]
+        def to_table(data):
+            tbl = Table(data)
+            if to_file:
+                tbl.materialize_to_file()
+            return tbl
+
+        arrow_table = self._arrow_table()
+        if arrow_table is not None:
+            # Arrow slices are zero-copy views, so there is nothing to scan
+            for offset in range(0, arrow_table.num_rows, rows):
+                yield to_table(ArrowView(arrow_table.slice(offset, rows)))
+            return
+
+        source = iter(self.table)
+        header = tuple(next(source, ()))
+
+        batch = [header]
+        for row in source:
+            batch.append(row)
+            if len(batch) > rows:
+                yield to_table(batch)
+                batch = [header]
+
+        if len(batch) > 1:
+            yield to_table(batch)
 
     @staticmethod
     def get_normalized_column_name(column_name):
@@ -1127,6 +1240,17 @@ class ETL(object):
             `Parsons Table` and also updates self
         """
 
+        arrow_table = self._arrow_table()
+        if arrow_table is not None:
+            if columns is None:
+                columns = arrow_table.column_names
+            elif isinstance(columns, str):
+                columns = [columns]
+
+            indices = sort_indices(arrow_table, columns, reverse=reverse)
+            self.table = ArrowView(arrow_table.take(indices))
+            return self
+
         self.table = petl.sort(self.table, key=columns, reverse=reverse)
 
         return self
@@ -1283,13 +1407,42 @@ class ETL(object):
             keys: str or list[str] or None
                 keys to deduplicate (and optionally sort) on.
             presorted: bool
-                If false, the row will be sorted.
+                If false, the row will be sorted. Ignored for tables stored in Arrow format,
+                which are always sorted.
         `Returns`:
             `Parsons Table` and also updates self
 
         """
 
+        arrow_table = self._arrow_table()
+        if arrow_table is not None:
+            self.table = ArrowView(self._deduplicate_arrow(arrow_table, keys))
+            return self
+
         deduped = petl.transform.dedup.distinct(self.table, key=keys, presorted=presorted)
         self.table = deduped
 
         return self
+
+    @staticmethod
+    def _deduplicate_arrow(arrow_table, keys):
+        # Keep the first row of each key, then order by key, which matches what
+        # petl's distinct does with its sort.
+
+        import pyarrow as pa
+
+        if keys is None:
+            keys = arrow_table.column_names
+        elif isinstance(keys, str):
+            keys = [keys]
+
+        row_numbers = pa.array(range(arrow_table.num_rows), pa.int64())
+        first_rows = (
+            arrow_table.select(keys)
+            .append_column("__parsons_row", row_numbers)
+            .group_by(keys, use_threads=False)
+            .aggregate([("__parsons_row", "min")])
+        )
+        deduped = arrow_table.take(first_rows["__parsons_row_min"])
+
+        return deduped.take(sort_indices(deduped, keys))
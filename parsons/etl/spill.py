@@ -0,0 +1,158 @@
+import pickle
+import struct
+import zlib
+
+import petl
+
+from parsons.utilities import files
+
+# Identifies a Parsons spill file, and the version of the format
+SPILL_MAGIC = b"PARSONS-SPILL-1\n"
+
+# Number of rows written per block when spilling an arbitrary iterable of rows
+SPILL_BLOCK_SIZE = 10000
+
+# zlib level 1 compresses typical query results several-fold while staying much faster than
+# the disk it saves
+SPILL_COMPRESSION_LEVEL = 1
+
+_BLOCK_LENGTH = struct.Struct("<Q")
+
+
+class SpillWriter:
+    """
+    Writes rows to a Parsons spill file.
+
+    A spill file is a compact, typed, on-disk store for table data. Rows are written in
+    blocks; each block is pickled as a whole (which keeps all of the Python type
+    information for each value) and compressed with zlib. Compared to pickling one row at a
+    time this writes and reads many times faster and takes much less disk space.
+
+    Use as a context manager, and pass each batch of rows (e.g. from ``cursor.fetchmany()``)
+    to :meth:`write_rows`:
+
+    .. code-block:: python
+
+        with SpillWriter(temp_file, header) as writer:
+            writer.write_rows(cursor.fetchmany(1000))
+
+        tbl = Table(SpillView(temp_file, num_rows=writer.num_rows))
+
+    `Args:`
+        file_path: str
+            The path of the file to write
+        header: list
+            The column names
+        compression_level: int
+            The zlib compression level, from 0 (none) to 9 (smallest)
+    """
+
+    def __init__(self, file_path, header, compression_level=SPILL_COMPRESSION_LEVEL):
+        self.file_path = file_path
+        self.compression_level = compression_level
+        self.num_rows = 0
+
+        self._file = open(file_path, "wb")
+        self._file.write(SPILL_MAGIC)
+        self._write_block(tuple(header))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _write_block(self, obj):
+        data = zlib.compress(
+            pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL), self.compression_level
+        )
+        self._file.write(_BLOCK_LENGTH.pack(len(data)))
+        self._file.write(data)
+
+    def write_rows(self, rows):
+        """
+        Write a batch of rows as a single block.
+
+        `Args:`
+            rows: list
+                A list of rows, each row a sequence of values
+        """
+
+        block = [tuple(row) for row in rows]
+        if not block:
+            return
+
+        self._write_block(block)
+        self.num_rows += len(block)
+
+    def close(self):
+        self._file.close()
+
+
+class SpillView(petl.Table):
+    """
+    A petl table that reads a Parsons spill file written with :class:`SpillWriter`.
+
+    The file is read back one block at a time, so only a single block of rows is held in
+    memory while iterating.
+
+    `Args:`
+        file_path: str
+            The path of the spill file
+        num_rows: int
+            The number of rows in the file, if known
+    """
+
+    def __init__(self, file_path, num_rows=None):
+        self.file_path = file_path
+        self.num_rows = num_rows
+
+    def __iter__(self):
+        with open(self.file_path, "rb") as f:
+            if f.read(len(SPILL_MAGIC)) != SPILL_MAGIC:
+                raise ValueError(f"{self.file_path} is not a Parsons spill file")
+
+            header = True
+            while True:
+                length = f.read(_BLOCK_LENGTH.size)
+                if not length:
+                    break
+
+                block = pickle.loads(zlib.decompress(f.read(_BLOCK_LENGTH.unpack(length)[0])))
+
+                if header:
+                    yield block
+                    header = False
+                else:
+                    yield from block
+
+
+def spill(table, file_path=None, block_size=SPILL_BLOCK_SIZE):
+    """
+    Write a petl table to a spill file and return a view that reads it back.
+
+    `Args:`
+        table: petl table
+            The table to write
+        file_path: str
+            The path of the file to write; if not specified, a temp file will be created.
+        block_size: int
+            The number of rows per block
+    `Returns:`
+        SpillView
+    """
+
+    file_path = file_path or files.create_temp_file()
+    rows = iter(table)
+
+    with SpillWriter(file_path, next(rows, ())) as writer:
+        block = []
+        for row in rows:
+            block.append(row)
+            if len(block) >= block_size:
+                writer.write_rows(block)
+                block = []
+
+        writer.write_rows(block)
+
+    return SpillView(file_path, num_rows=writer.num_rows)
@@ -1,18 +1,30 @@
 import logging
-import pickle
 from enum import Enum
 from typing import Union
 
 import petl
 
+from parsons.etl.arrow import ArrowView, ParquetView, petl_to_arrow
 from parsons.etl.etl import ETL
+from parsons.etl.spill import SpillView, spill
 from parsons.etl.tofrom import ToFrom
-from parsons.utilities import files
 
 logger = logging.getLogger(__name__)
 
 DIRECT_INDEX_WARNING_COUNT = 10
 
+# petl views that always yield exactly as many rows as their source. A cached row count
+# survives a transformation that wraps the previous table in one of these.
+ROW_PRESERVING_VIEWS = (
+    petl.transform.basics.AddFieldView,
+    petl.transform.basics.CutView,
+    petl.transform.basics.CutOutView,
+    petl.transform.basics.MoveFieldView,
+    petl.transform.conversions.FieldConvertView,
+    petl.transform.headers.RenameView,
+    petl.transform.headers.SetHeaderView,
+)
+
 
 class _EmptyDefault(Enum):
     """Default argument for Table()
@@ -28,6 +40,24 @@ class _EmptyDefault(Enum):
 _EMPTYDEFAULT = _EmptyDefault.token
 
 
+def _preserves_row_count(view, source):
+    """
+    Checks whether a petl table is a chain of row preserving views on top of ``source``.
+    """
+
+    while view is not source:
+        if isinstance(view, petl.transform.basics.StackView) and len(view.sources) == 1:
+            view = view.sources[0]
+        elif isinstance(view, petl.transform.basics.MoveFieldView):
+            view = view.table
+        elif isinstance(view, ROW_PRESERVING_VIEWS):
+            view = view.source
+        else:
+            return False
+
+    return True
+
+
 class Table(ETL, ToFrom):
     """
     Create a Parsons Table. Accepts one of the following:
@@ -35,6 +65,9 @@ class Table(ETL, ToFrom):
     - A list of dicts
     - A petl table
 
+    To hold data in Arrow's columnar format instead, see :meth:`materialize` and
+    :meth:`~parsons.etl.tofrom.ToFrom.from_arrow`.
+
     `Args:`
         lst: list
             See above for accepted list formats
@@ -44,6 +77,12 @@ class Table(ETL, ToFrom):
             The name of the table (optional)
     """
 
+    _table = None
+
+    # Cached number of rows, populated the first time the rows are counted and cleared
+    # whenever the underlying petl table is replaced by one that may change the row count.
+    _num_rows = None
+
     def __init__(
         self,
         lst: Union[list, tuple, petl.util.base.Table, _EmptyDefault] = _EMPTYDEFAULT,
@@ -88,6 +127,24 @@ class Table(ETL, ToFrom):
         # against inefficient usage.
         self._index_count = 0
 
+    @property
+    def table(self):
+        """
+        The underlying petl table.
+        """
+        return self._table
+
+    @table.setter
+    def table(self, table):
+        if isinstance(table, ArrowView):
+            self._num_rows = table.arrow_table.num_rows
+        elif isinstance(table, (SpillView, ParquetView)) and table.num_rows is not None:
+            self._num_rows = table.num_rows
+        elif self._num_rows is not None and not _preserves_row_count(table, self._table):
+            self._num_rows = None
+
+        self._table = table
+
     def __repr__(self):
         return repr(petl.dicts(self.table))
 
@@ -109,6 +166,9 @@ class Table(ETL, ToFrom):
             raise TypeError("You must pass a string or an index as a value.")
 
     def __bool__(self):
+        if self._num_rows is not None:
+            return self._num_rows > 0
+
         # Try to get a single row from our table
         head_one = petl.head(self.table)
 
@@ -125,11 +185,17 @@ class Table(ETL, ToFrom):
     @property
     def num_rows(self):
         """
+        The count is cached after the first call, so the table is only scanned once. The cache
+        is cleared whenever a transformation that might add or drop rows is applied.
+
         `Returns:`
             int
                 Number of rows in the table
         """
-        return petl.nrows(self.table)
+        if self._num_rows is None:
+            self._num_rows = petl.nrows(self.table)
+
+        return self._num_rows
 
     def __len__(self):
         return self.num_rows
@@ -209,23 +275,44 @@ class Table(ETL, ToFrom):
         else:
             raise ValueError("Column name not found.")
 
-    def materialize(self):
+    def materialize(self, format=None):
         """
         "Materializes" a Table, meaning all data is loaded into memory and all pending
         transformations are applied.
 
         Use this if petl's lazy-loading behavior is causing you problems, eg. if you want to read
         data from a file immediately.
+
+        By default rows are stored as Python tuples. With ``format="arrow"`` the data is
+        stored in columnar Arrow arrays instead, which takes a fraction of the memory for
+        large tables, and lets ``cut``, ``select_rows``, ``sort``, ``deduplicate``,
+        ``fill_column`` and ``convert_column`` run as vectorized column operations. Requires
+        the ``pyarrow`` package.
+
+        `Args:`
+            format: str
+                ``None`` to store rows as Python tuples, or ``"arrow"`` to store columnar
+                Arrow arrays.
         """
 
-        self.table = petl.wrap(petl.tupleoftuples(self.table))
+        if format == "arrow":
+            self.table = ArrowView(petl_to_arrow(self.table))
+            return
+
+        if format is not None:
+            raise ValueError(f"Unsupported materialize format: {format}")
+
+        data = petl.tupleoftuples(self.table)
+        self.table = petl.wrap(data)
+        self._num_rows = max(len(data) - 1, 0)
 
     def materialize_to_file(self, file_path=None):
         """
         "Materializes" a Table, meaning all pending transformations are applied.
 
         Unlike the original materialize function, this method does not bring the data into memory,
-        but instead loads the data into a local temp file.
+        but instead loads the data into a local temp file. The file is written in Parsons' compact
+        spill format (see :class:`~parsons.etl.spill.SpillWriter`).
 
         This method updates the current table in place.
 
@@ -238,20 +325,13 @@ class Table(ETL, ToFrom):
                 Path to the temp file that now contains the table
         """
 
-        # Load the data in batches, and "pickle" the rows to a temp file.
-        # (We pickle rather than writing to, say, a CSV, so that we maintain
-        # all the type information for each field.)
-
-        file_path = file_path or files.create_temp_file()
-
-        with open(file_path, "wb") as handle:
-            for row in self.table:
-                pickle.dump(list(row), handle)
+        # Write the data in compressed blocks to a spill file, and load the Table from it.
+        # (We use a spill file rather than, say, a CSV, so that we maintain all the type
+        # information for each field.)
 
-        # Load a Table from the file
-        self.table = petl.frompickle(file_path)
+        self.table = spill(self.table, file_path)
 
-        return file_path
+        return self.table.file_path
 
     def is_valid_table(self):
         """
@@ -5,6 +5,16 @@ from typing import Optional
 
 import petl
 
+from parsons.etl.arrow import (
+    ARROW_BATCH_SIZE,
+    ArrowView,
+    cast_arrow_table,
+    incompatible_columns,
+    infer_schema,
+    null_columns_to_string,
+    petl_to_arrow,
+    rows_to_arrow,
+)
 from parsons.utilities import files, zip_archive
 
 
@@ -38,6 +48,122 @@ class ToFrom(object):
             coerce_float=coerce_float,
         )
 
+    def to_arrow(self):
+        """
+        Outputs table as a ``pyarrow.Table``. Requires the ``pyarrow`` package.
+
+        Rows are converted in batches, so memory use stays close to the size of the
+        resulting Arrow table. If the table is already stored in Arrow format, the
+        underlying Arrow table is returned without copying.
+
+        `Returns:`
+            pyarrow.Table
+        """
+
+        return petl_to_arrow(self.table)
+
+    def to_parquet(self, local_path=None, schema=None, row_group_size=ARROW_BATCH_SIZE):
+        """
+        Outputs table to a Parquet file. Requires the ``pyarrow`` package.
+
+        Parquet files are columnar and keep the type of each column, so they are typically
+        much smaller than the equivalent CSV and faster to load into a data warehouse.
+
+        .. warning::
+                If a file already exists at the given location, it will be
+                overwritten.
+
+        `Args:`
+            local_path: str
+                The path to write the Parquet file locally. If not specified, a temporary
+                file will be created and returned, and that file will be removed automatically
+                when the script is done running.
+            schema: pyarrow.Schema
+                (Optional) The schema of the file, with a field for each column in order.
+                When given, the table is written one row group at a time and each row group
+                is cast to the schema; see :func:`~parsons.etl.arrow.rows_to_arrow`.
+                Otherwise the schema is inferred from the first row group: columns that mix
+                types (e.g. ints and empty strings), or that have no values in the first row
+                group, are written as strings. If a later row group doesn't fit the inferred
+                schema, the mismatched columns are made strings and the file is written
+                again.
+            row_group_size: int
+                The max number of rows per row group.
+        `Returns:`
+            str
+                The path of the new file
+        """
+
+        import pyarrow.parquet as pq
+
+        if not local_path:
+            local_path = files.create_temp_file(suffix=".parquet")
+
+        arrow_table = self._arrow_table()
+        if schema is None and arrow_table is not None:
+            arrow_table = null_columns_to_string(arrow_table)
+            pq.write_table(arrow_table, local_path, row_group_size=row_group_size)
+            return local_path
+
+        if schema is None:
+            return self._to_parquet_inferred(local_path, row_group_size)
+
+        with pq.ParquetWriter(local_path, schema) as writer:
+            for chunk in self.iter_chunks(row_group_size):
+                if isinstance(chunk.table, ArrowView):
+                    row_group = cast_arrow_table(chunk.table.arrow_table, schema)
+                else:
+                    row_group = rows_to_arrow(petl.data(chunk.table), schema)
+                writer.write_table(row_group)
+
+        return local_path
+
+    def _to_parquet_inferred(self, local_path, row_group_size):
+        # The schema is inferred from the first row group. If a later row group has values
+        # that don't fit it (e.g. strings in a column of ints), those columns are made
+        # strings and the file is written again, so only one row group is held in memory.
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        names = [str(column) for column in self.columns]
+        string_columns = set()
+
+        while True:
+            writer = None
+            rewrite = False
+            try:
+                for chunk in self.iter_chunks(row_group_size):
+                    rows = list(petl.data(chunk.table))
+
+                    if writer is None:
+                        schema = infer_schema(rows, names)
+                        schema = pa.schema(
+                            pa.field(field.name, pa.string())
+                            if field.name in string_columns
+                            else field
+                            for field in schema
+                        )
+                        writer = pq.ParquetWriter(local_path, schema)
+                    else:
+                        mismatched = incompatible_columns(rows, schema)
+                        if mismatched:
+                            string_columns.update(mismatched)
+                            rewrite = True
+                            break
+
+                    writer.write_table(rows_to_arrow(rows, schema))
+
+                if writer is None:
+                    # No rows
+                    schema = infer_schema([], names)
+                    writer = pq.ParquetWriter(local_path, schema)
+            finally:
+                if writer is not None:
+                    writer.close()
+
+            if not rewrite:
+                return local_path
+
     def to_html(
         self,
         local_path=None,
@@ -812,7 +938,16 @@ class ToFrom(object):
             return cls(petl.fromjson(local_path, header=header))
 
     @classmethod
-    def from_redshift(cls, sql, username=None, password=None, host=None, db=None, port=None):
+    def from_redshift(
+        cls,
+        sql,
+        username=None,
+        password=None,
+        host=None,
+        db=None,
+        port=None,
+        via_unload=False,
+    ):
         """
         Create a ``parsons table`` from a Redshift query.
 
@@ -831,6 +966,11 @@ class ToFrom(object):
                 Required if env variable ``REDSHIFT_DB`` not populated
             port: int
                 Required if env variable ``REDSHIFT_PORT`` not populated. Port 5439 is typical.
+            via_unload: bool
+                Unload the results to S3 in parallel and read them back, rather than reading
+                them through a single cursor. Much faster for large results; requires the
+                ``S3_TEMP_BUCKET`` env variable. See
+                :meth:`~parsons.databases.Redshift.unload_to_table`.
 
         `Returns:`
             Parsons Table
@@ -840,6 +980,10 @@ class ToFrom(object):
         from parsons.databases.redshift import Redshift
 
         rs = Redshift(username=username, password=password, host=host, db=db, port=port)
+
+        if via_unload:
+            return rs.unload_to_table(sql)
+
         return rs.query(sql)
 
     @classmethod
@@ -873,6 +1017,7 @@ class ToFrom(object):
         from_manifest=False,
         aws_access_key_id=None,
         aws_secret_access_key=None,
+        stream=False,
         **csvargs,
     ):
         r"""
@@ -890,6 +1035,15 @@ class ToFrom(object):
                 Required if not included as environmental variable.
             aws_secret_access_key: str
                 Required if not included as environmental variable.
+            stream: bool
+                Read the keys straight from S3, instead of downloading each one to a temp file
+                first. Rows are available as soon as the first bytes arrive, gzip files are
+                decompressed on the fly, and the next key starts downloading while the
+                current one is read. Since nothing is stored locally, every pass over the
+                table reads from S3 again; call ``materialize()`` or ``materialize_to_file()``
+                on the table if you will read it more than once. The keys are read one
+                after the other, so they must have the same columns. Zip files are always
+                downloaded.
             **csvargs: kwargs
                 ``csv_reader`` optional arguments
         `Returns:`
@@ -897,6 +1051,7 @@ class ToFrom(object):
         """
 
         from parsons.aws import S3
+        from parsons.aws.s3_stream import ChainedView, S3Source
 
         s3 = S3(aws_access_key_id, aws_secret_access_key)
 
@@ -910,14 +1065,23 @@ class ToFrom(object):
             s3_keys = [f"s3://{bucket}/{key}"]
 
         tbls = []
-        for key in s3_keys:
+        next_source = None
+        for key in reversed(s3_keys):
             # TODO handle urls that end with '/', i.e. urls that point to "folders"
             _, _, bucket_, key_ = key.split("/", 3)
-            file_ = s3.get_file(bucket_, key_)
-            if files.compression_type_for_path(key_) == "zip":
-                file_ = zip_archive.unzip_archive(file_)
+            if stream and files.compression_type_for_path(key_) != "zip":
+                # Each source starts downloading the next one when it is opened
+                file_ = next_source = S3Source(s3.client, bucket_, key_, next_source=next_source)
+            else:
+                file_ = s3.get_file(bucket_, key_)
+                if files.compression_type_for_path(key_) == "zip":
+                    file_ = zip_archive.unzip_archive(file_)
+
+            tbls.insert(0, petl.fromcsv(file_, **csvargs))
 
-            tbls.append(petl.fromcsv(file_, **csvargs))
+        if stream:
+            # Opens one key at a time, where petl.cat would open every key at once
+            return cls(ChainedView(tbls))
 
         return cls(petl.cat(*tbls))
 
@@ -963,3 +1127,22 @@ class ToFrom(object):
         """
 
         return cls(petl.fromdataframe(dataframe, include_index=include_index))
+
+    @classmethod
+    def from_arrow(cls, arrow_table):
+        """
+        Create a ``parsons table`` backed by a ``pyarrow.Table``.
+
+        The data stays in Arrow's columnar format; rows are only converted to Python
+        objects as they are iterated. See :meth:`Table.materialize` for the methods that
+        run as vectorized column operations on such a table.
+
+        `Args:`
+            arrow_table: pyarrow.Table
+                A pyarrow Table object
+        `Returns:`
+            Parsons Table
+                See :ref:`parsons-table` for output options.
+        """
+
+        return cls(ArrowView(arrow_table))
@@ -113,7 +113,7 @@ class CensusGeocoder(object):
             )
             raise ValueError(msg)
 
-        chunked_tables = table.chunk(BATCH_SIZE)
+        chunked_tables = table.iter_chunks(BATCH_SIZE)
         batch_count = 1
         records_processed = 0
 
@@ -1,7 +1,6 @@
 import datetime
 import json
 import logging
-import pickle
 import random
 import uuid
 from contextlib import contextmanager
@@ -18,6 +17,7 @@ from google.oauth2.credentials import Credentials
 from parsons.databases.database_connector import DatabaseConnector
 from parsons.databases.table import BaseTable
 from parsons.etl import Table
+from parsons.etl.spill import SpillView, SpillWriter
 from parsons.google.google_cloud_storage import GoogleCloudStorage
 from parsons.google.utilities import (
     load_google_application_credentials,
@@ -184,6 +184,7 @@ class GoogleBigQuery(DatabaseConnector):
         # without valid GOOGLE_APPLICATION_CREDENTIALS raises an exception.
         # This attribute will be used to hold the client once we have created it.
         self._client = None
+        self._storage_client = None
 
         self._dbapi = dbapi
 
@@ -208,6 +209,22 @@ class GoogleBigQuery(DatabaseConnector):
 
         return self._client
 
+    @property
+    def storage_client(self):
+        """
+        Get the BigQuery Storage API client, used to read query results. Requires the
+        ``google-cloud-bigquery-storage`` package.
+
+        `Returns:`
+            `google.cloud.bigquery_storage.BigQueryReadClient`
+        """
+        if not self._storage_client:
+            from google.cloud import bigquery_storage
+
+            self._storage_client = bigquery_storage.BigQueryReadClient(credentials=self.credentials)
+
+        return self._storage_client
+
     @contextmanager
     def connection(self):
         """
@@ -247,6 +264,8 @@ class GoogleBigQuery(DatabaseConnector):
         sql: str,
         parameters: Optional[Union[list, dict]] = None,
         return_values: bool = True,
+        use_storage_api: bool = False,
+        max_stream_count: Optional[int] = None,
     ) -> Optional[Table]:
         """
         Run a BigQuery query and return the results as a Parsons table.
@@ -275,6 +294,16 @@ class GoogleBigQuery(DatabaseConnector):
                 A valid BigTable statement
             parameters: dict
                 A dictionary of query parameters for BigQuery.
+            use_storage_api: bool
+                Read the results through the BigQuery Storage Read API, rather than paging
+                through them row by row. The results are downloaded as Arrow record batches
+                over parallel streams and spilled to a columnar temp file, which is much faster
+                for large results. Requires the ``google-cloud-bigquery-storage`` and
+                ``pyarrow`` packages, and the ``bigquery.readsessions.create`` permission.
+            max_stream_count: int
+                The max number of parallel streams when ``use_storage_api`` is set. Defaults
+                to the number chosen by BigQuery. Results of a query with an ``ORDER BY`` are
+                always read over a single stream, to keep their order.
 
         `Returns:`
             Parsons Table
@@ -283,11 +312,23 @@ class GoogleBigQuery(DatabaseConnector):
 
         with self.connection() as connection:
             return self.query_with_connection(
-                sql, connection, parameters=parameters, return_values=return_values
+                sql,
+                connection,
+                parameters=parameters,
+                return_values=return_values,
+                use_storage_api=use_storage_api,
+                max_stream_count=max_stream_count,
             )
 
     def query_with_connection(
-        self, sql, connection, parameters=None, commit=True, return_values: bool = True
+        self,
+        sql,
+        connection,
+        parameters=None,
+        commit=True,
+        return_values: bool = True,
+        use_storage_api: bool = False,
+        max_stream_count: Optional[int] = None,
     ):
         """
         Execute a query against the BigQuery database, with an existing connection.
@@ -303,6 +344,11 @@ class GoogleBigQuery(DatabaseConnector):
                 A list of python variables to be converted into SQL values in your query
             commit: boolean
                 Must be true. BigQuery
+            use_storage_api: bool
+                Read the results through the BigQuery Storage Read API. See
+                :func:`~parsons.google.google_bigquery.GoogleBigQuery.query`.
+            max_stream_count: int
+                The max number of parallel streams when ``use_storage_api`` is set.
 
         `Returns:`
             Parsons Table
@@ -334,6 +380,9 @@ class GoogleBigQuery(DatabaseConnector):
             if not cursor.description:
                 return None
 
+            if use_storage_api:
+                return self._fetch_query_results_arrow(cursor, max_stream_count)
+
             final_table = self._fetch_query_results(cursor=cursor)
 
             return final_table
@@ -795,6 +844,7 @@ class GoogleBigQuery(DatabaseConnector):
         schema: Optional[List[dict]] = None,
         max_timeout: int = 21600,
         convert_dict_list_columns_to_json: bool = True,
+        data_type: str = "csv",
         **load_kwargs,
     ):
         """
@@ -829,11 +879,18 @@ class GoogleBigQuery(DatabaseConnector):
                 The maximum number of seconds to wait for a request before the job fails.
             convert_dict_list_columns_to_json: bool
                 If set to True, will convert any dict or list columns (which cannot by default be successfully loaded to BigQuery to JSON strings)
+            data_type: str
+                The format of the file staged in Google Cloud Storage, either ``csv`` or
+                ``parquet``. Parquet files are smaller and keep the type of each column, so
+                unless a ``schema`` or ``template_table`` is given (or the table already
+                exists), the column types come from the file rather than from scanning the
+                table. Otherwise each column of the file is written with the type of the
+                column it is loaded into. The CSV options (e.g. ``quote``) don't apply to
+                Parquet. Parquet requires the ``pyarrow`` package.
             **load_kwargs: kwargs
                 Arguments to pass to the underlying load_table_from_uri call on the BigQuery
                 client.
         """
-        data_type = "csv"
         tmp_gcs_bucket = (
             tmp_gcs_bucket
             or self.tmp_gcs_bucket
@@ -844,6 +901,9 @@ class GoogleBigQuery(DatabaseConnector):
                 "Must set GCS_TEMP_BUCKET environment variable or pass in tmp_gcs_bucket parameter"
             )
 
+        if data_type not in ["csv", "parquet"]:
+            raise ValueError(f"Only supports csv or parquet files [data_type = {data_type}]")
+
         self._validate_copy_inputs(if_exists=if_exists, data_type=data_type)
 
         # If our source table is loaded from CSV with no transformations
@@ -856,18 +916,20 @@ class GoogleBigQuery(DatabaseConnector):
             csv_delimiter = ","
 
         if convert_dict_list_columns_to_json:
-            # Convert dict columns to JSON strings
-            for field in tbl.get_columns_type_stats():
-                if "dict" in field["type"] or "list" in field["type"]:
-                    new_petl = tbl.table.addfield(
-                        field["name"] + "_replace",
-                        lambda row: json.dumps(row[field["name"]]),
-                    )
-                    new_tbl = Table(new_petl)
-                    new_tbl.remove_column(field["name"])
-                    new_tbl.rename_column(field["name"] + "_replace", field["name"])
-                    new_tbl.materialize()
-                    tbl = new_tbl
+            # Convert dict and list columns to JSON strings, in a single lazy pass
+            json_columns = [
+                field["name"]
+                for field in tbl.get_columns_type_stats()
+                if "dict" in field["type"] or "list" in field["type"]
+            ]
+            if json_columns:
+                tbl = Table(petl.convert(tbl.table, {col: json.dumps for col in json_columns}))
+
+        if data_type == "parquet":
+            # Parquet files describe their own columns, and the CSV options don't apply
+            allow_quoted_newlines = None
+            allow_jagged_rows = None
+            quote = None
 
         job_config = self._process_job_config(
             job_config=job_config,
@@ -876,7 +938,7 @@ class GoogleBigQuery(DatabaseConnector):
             max_errors=max_errors,
             data_type=data_type,
             template_table=template_table,
-            parsons_table=tbl,
+            parsons_table=tbl if data_type == "csv" else None,
             ignoreheader=ignoreheader,
             nullas=nullas,
             allow_quoted_newlines=allow_quoted_newlines,
@@ -887,18 +949,30 @@ class GoogleBigQuery(DatabaseConnector):
         )
 
         # Reorder schema to match table to ensure compatibility
-        schema = []
-        for column in tbl.columns:
-            try:
-                schema_row = [i for i in job_config.schema if i.name.lower() == column.lower()][0]
-            except IndexError:
-                raise IndexError(f"Column found in Table that was not found in schema: {column}")
-            schema.append(schema_row)
-        job_config.schema = schema
+        if job_config.schema:
+            schema = []
+            for column in tbl.columns:
+                try:
+                    schema_row = [i for i in job_config.schema if i.name.lower() == column.lower()][
+                        0
+                    ]
+                except IndexError:
+                    raise IndexError(
+                        f"Column found in Table that was not found in schema: {column}"
+                    )
+                schema.append(schema_row)
+            job_config.schema = schema
+
+        # Write each column of a Parquet file with the type of the column it is loaded into
+        upload_kwargs = {}
+        if data_type == "parquet" and job_config.schema:
+            upload_kwargs["schema"] = self._parquet_schema(job_config.schema)
 
         gcs_client = gcs_client or GoogleCloudStorage(app_creds=self.app_creds)
         temp_blob_name = f"{uuid.uuid4()}.{data_type}"
-        temp_blob_uri = gcs_client.upload_table(tbl, tmp_gcs_bucket, temp_blob_name)
+        temp_blob_uri = gcs_client.upload_table(
+            tbl, tmp_gcs_bucket, temp_blob_name, data_type=data_type, **upload_kwargs
+        )
 
         # load CSV from Cloud Storage into BigQuery
         try:
@@ -1357,11 +1431,10 @@ class GoogleBigQuery(DatabaseConnector):
             job_config.skip_leading_rows = ignoreheader
 
         if not job_config.source_format:
-            job_config.source_format = (
-                bigquery.SourceFormat.CSV
-                if data_type == "csv"
-                else bigquery.SourceFormat.NEWLINE_DELIMITED_JSON
-            )
+            job_config.source_format = {
+                "csv": bigquery.SourceFormat.CSV,
+                "parquet": bigquery.SourceFormat.PARQUET,
+            }.get(data_type, bigquery.SourceFormat.NEWLINE_DELIMITED_JSON)
 
         if not job_config.field_delimiter:
             if data_type == "csv":
@@ -1396,25 +1469,45 @@ class GoogleBigQuery(DatabaseConnector):
 
     def _fetch_query_results(self, cursor) -> Table:
         # We will use a temp file to cache the results so that they are not all living
-        # in memory. We'll use pickle to serialize the results to file in order to maintain
+        # in memory. We'll use a spill file to serialize the results in order to maintain
         # the proper data types (e.g. integer).
         temp_filename = create_temp_file()
 
-        with open(temp_filename, "wb") as temp_file:
-            header = [i[0] for i in cursor.description]
-            pickle.dump(header, temp_file)
-
+        header = [i[0] for i in cursor.description]
+        with SpillWriter(temp_filename, header) as writer:
             while True:
                 batch = cursor.fetchmany(QUERY_BATCH_SIZE)
                 if len(batch) == 0:
                     break
 
-                for row in batch:
-                    row_data = list(row.values())
-                    pickle.dump(row_data, temp_file)
+                writer.write_rows([row.values() for row in batch])
+
+        return Table(SpillView(temp_filename, num_rows=writer.num_rows))
+
+    def _fetch_query_results_arrow(self, cursor, max_stream_count=None) -> Table:
+        # Record batches are written to an Arrow IPC file as they arrive, then memory mapped,
+        # so the results don't all need to fit in memory and are never converted to rows
+        import pyarrow as pa
+
+        results = cursor.query_job.result()
+        batches = results.to_arrow_iterable(
+            bqstorage_client=self.storage_client, max_stream_count=max_stream_count
+        )
+
+        first_batch = next(batches, None)
+        if first_batch is None:
+            return Table([[field.name for field in results.schema]])
+
+        temp_filename = create_temp_file()
+        with pa.OSFile(temp_filename, "wb") as sink:
+            with pa.ipc.new_file(sink, first_batch.schema) as writer:
+                writer.write_batch(first_batch)
+                for batch in batches:
+                    writer.write_batch(batch)
+
+        arrow_table = pa.ipc.open_file(pa.memory_map(temp_filename)).read_all()
 
-        ptable = petl.frompickle(temp_filename)
-        return Table(ptable)
+        return Table.from_arrow(arrow_table)
 
     def _validate_copy_inputs(self, if_exists: str, data_type: str):
         if if_exists not in ["fail", "truncate", "append", "drop"]:
@@ -1422,8 +1515,8 @@ class GoogleBigQuery(DatabaseConnector):
                 f"Unexpected value for if_exists: {if_exists}, must be one of "
                 '"append", "drop", "truncate", or "fail"'
             )
-        if data_type not in ["csv", "json"]:
-            raise ValueError(f"Only supports csv or json files [data_type = {data_type}]")
+        if data_type not in ["csv", "json", "parquet"]:
+            raise ValueError(f"Only supports csv, json or parquet files [data_type = {data_type}]")
 
     def _load_table_from_uri(
         self, source_uris, destination, job_config, max_timeout, **load_kwargs
@@ -1447,6 +1540,43 @@ class GoogleBigQuery(DatabaseConnector):
 
             raise e
 
+    @staticmethod
+    def _parquet_schema(schema_fields):
+        # Build the Parquet schema for a load with the given BigQuery schema. BigQuery
+        # rejects Parquet columns whose type doesn't match the table (e.g. a string loaded
+        # into an INTEGER column).
+
+        import pyarrow as pa
+
+        types = {
+            "INTEGER": pa.int64(),
+            "INT64": pa.int64(),
+            "FLOAT": pa.float64(),
+            "FLOAT64": pa.float64(),
+            "NUMERIC": pa.decimal128(38, 9),
+            "BIGNUMERIC": pa.decimal256(76, 38),
+            "BOOLEAN": pa.bool_(),
+            "BOOL": pa.bool_(),
+            "DATE": pa.date32(),
+            "DATETIME": pa.timestamp("us"),
+            "TIMESTAMP": pa.timestamp("us", tz="UTC"),
+            "TIME": pa.time64("us"),
+            "BYTES": pa.binary(),
+        }
+
+        fields = []
+        for field in schema_fields:
+            if field.mode == "REPEATED":
+                # Lists are loaded as JSON strings
+                arrow_type = pa.string()
+            else:
+                # Any other type is loaded from a string
+                arrow_type = types.get(field.field_type.upper(), pa.string())
+
+            fields.append(pa.field(field.name, arrow_type))
+
+        return pa.schema(fields)
+
     @staticmethod
     def _bigquery_type(tp):
         return BIGQUERY_TYPE_MAP[tp]
@@ -4,6 +4,7 @@ import logging
 import time
 import uuid
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Union
 
 import google
@@ -19,6 +20,11 @@ from parsons.utilities import files
 
 logger = logging.getLogger(__name__)
 
+# Max number of requests the GCS batch API accepts in one call
+GCS_BATCH_SIZE = 100
+# Default number of blobs copied at the same time
+GCS_TRANSFER_WORKERS = 10
+
 
 class GoogleCloudStorage(object):
     """Google Cloud Storage connector utility
@@ -164,7 +170,11 @@ class GoogleCloudStorage(object):
         """
 
         bucket = self.get_bucket(bucket_name)
-        bucket.delete(force=delete_blobs)
+        if delete_blobs:
+            # Bucket.delete(force=True) refuses buckets with more than 256 blobs and
+            # deletes them one at a time, so empty the bucket in batches instead.
+            self.delete_blobs(bucket_name, self.list_blobs(bucket_name))
+        bucket.delete()
         logger.info(f"{bucket_name} bucket deleted.")
 
     def list_blobs(
@@ -197,8 +207,16 @@ class GoogleCloudStorage(object):
             A list of blob names (or `Blob` objects if `include_file_details` is invoked)
         """
 
+        # Only ask for the names when the details aren't needed, which makes each page of
+        # the listing a fraction of the size
+        fields = None if include_file_details else "items(name),nextPageToken"
+
         blobs = self.client.list_blobs(
-            bucket_name, max_results=max_results, prefix=prefix, match_glob=match_glob
+            bucket_name,
+            max_results=max_results,
+            prefix=prefix,
+            match_glob=match_glob,
+            fields=fields,
         )
 
         if include_file_details:
@@ -319,7 +337,153 @@ class GoogleCloudStorage(object):
         blob.delete()
         logger.info(f"{blob_name} blob in {bucket_name} bucket deleted.")
 
-    def upload_table(self, table, bucket_name, blob_name, data_type="csv", default_acl=None):
+    def delete_blobs(self, bucket_name, blob_names, batch_size=GCS_BATCH_SIZE):
+        """
+        Delete many blobs, sending the deletes through the GCS batch API.
+
+        Blobs that no longer exist are skipped, so an interrupted delete can be rerun. If a
+        batch fails, its deletes are sent again one at a time, so that missing blobs can be
+        told apart from other errors; any other error is raised and no more batches are
+        sent.
+
+        `Args:`
+            bucket_name: str
+                The bucket name
+            blob_names: list
+                The names of the blobs to delete
+            batch_size: int
+                The number of deletes sent in each request. GCS accepts at most 100.
+        `Returns:`
+            ``None``
+        """
+
+        bucket = storage.Bucket(self.client, name=bucket_name)
+
+        for i in range(0, len(blob_names), batch_size):
+            batch_names = blob_names[i : i + batch_size]
+
+            try:
+                with self.client.batch():
+                    for blob_name in batch_names:
+                        bucket.delete_blob(blob_name)
+            except google.cloud.exceptions.GoogleCloudError as e:
+                # The batch only raises its first error, which may just be a missing blob
+                logger.debug(f"Batch delete failed ({e}), deleting blobs one at a time.")
+                for blob_name in batch_names:
+                    try:
+                        bucket.delete_blob(blob_name)
+                    except google.cloud.exceptions.NotFound:
+                        logger.debug(f"Blob {blob_name} was already deleted.")
+
+            logger.debug(f"Deleted {i + len(batch_names)} of {len(blob_names)} blobs.")
+
+        logger.info(f"{len(blob_names)} blobs in {bucket_name} bucket deleted.")
+
+    def copy_blobs(
+        self,
+        source_bucket,
+        destination_bucket,
+        blob_names=None,
+        prefix=None,
+        destination_prefix="",
+        overwrite=False,
+        max_workers=GCS_TRANSFER_WORKERS,
+    ):
+        """
+        Copy blobs between GCS buckets, several at a time.
+
+        Copies are done server-side with the rewrite API, so the data does not pass
+        through the machine running the script. Blobs already in the destination with the
+        same checksum are skipped (unless ``overwrite`` is set), so an interrupted copy
+        picks up where it left off when rerun.
+
+        `Args:`
+            source_bucket: str
+                The name of the bucket to copy from
+            destination_bucket: str
+                The name of the bucket to copy to. Can be the same as the source bucket.
+            blob_names: list
+                The names of the blobs to copy. If not passed, copies every blob in the
+                source bucket that starts with ``prefix``.
+            prefix: str
+                Only copy blobs whose name starts with this prefix
+            destination_prefix: str
+                Replaces ``prefix`` at the start of the names of the copied blobs. When
+                ``prefix`` is not set, it is prepended to the names instead.
+            overwrite: bool
+                Copy blobs even if they already exist in the destination
+            max_workers: int
+                The max number of blobs copied at the same time
+        `Returns:`
+            list
+                The names of the blobs that were copied
+        """
+
+        def destination_name(blob_name):
+            return destination_prefix + blob_name[len(prefix or "") :]
+
+        source_crc32c = {}
+        if blob_names is None or not overwrite:
+            source_crc32c = {
+                blob.name: blob.crc32c
+                for blob in self.list_blobs(source_bucket, prefix=prefix, include_file_details=True)
+            }
+
+        if blob_names is None:
+            blob_names = list(source_crc32c)
+        elif prefix:
+            blob_names = [name for name in blob_names if name.startswith(prefix)]
+
+        if source_bucket == destination_bucket and any(
+            destination_name(name) == name for name in blob_names
+        ):
+            raise ValueError("Blobs can't be copied onto themselves")
+
+        if not overwrite:
+            existing_crc32c = {
+                blob.name: blob.crc32c
+                for blob in self.list_blobs(
+                    destination_bucket,
+                    prefix=destination_prefix or None,
+                    include_file_details=True,
+                )
+            }
+            remaining = [
+                name
+                for name in blob_names
+                if name not in source_crc32c
+                or existing_crc32c.get(destination_name(name)) != source_crc32c[name]
+            ]
+            if len(remaining) < len(blob_names):
+                logger.info(
+                    f"Skipping {len(blob_names) - len(remaining)} blobs already in "
+                    f"{destination_bucket}."
+                )
+            blob_names = remaining
+
+        source = storage.Bucket(self.client, name=source_bucket)
+        destination = storage.Bucket(self.client, name=destination_bucket)
+
+        def copy_blob(blob_name):
+            dest_blob = destination.blob(destination_name(blob_name))
+            # Large blobs, or copies between locations or storage classes, take more than
+            # one rewrite call
+            token, _, _ = dest_blob.rewrite(source.blob(blob_name))
+            while token is not None:
+                token, _, _ = dest_blob.rewrite(source.blob(blob_name), token=token)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for count, _ in enumerate(executor.map(copy_blob, blob_names), 1):
+                if count % 1000 == 0:
+                    logger.info(f"Copied {count} of {len(blob_names)} blobs.")
+
+        logger.info(f"Copied {len(blob_names)} blobs from {source_bucket} to {destination_bucket}.")
+
+        return blob_names
+
+    def upload_table(
+        self, table, bucket_name, blob_name, data_type="csv", default_acl=None, schema=None
+    ):
         """
         Load the data from a Parsons table into a blob.
 
@@ -331,9 +495,13 @@ class GoogleCloudStorage(object):
             blob_name: str
                 The name of the blob to upload the data into.
             data_type: str
-                The file format to use when writing the data. One of: `csv` or `json`
+                The file format to use when writing the data. One of: `csv`, `json` or
+                `parquet`
             default_acl:
                 ACL desired for newly uploaded table
+            schema: pyarrow.Schema
+                (Optional) The schema of a `parquet` file. See
+                :meth:`~parsons.etl.tofrom.ToFrom.to_parquet`.
 
         `Returns`:
             String representation of file URI in GCS
@@ -357,8 +525,13 @@ class GoogleCloudStorage(object):
         elif data_type == "json":
             local_file = table.to_json()
             content_type = "application/json"
+        elif data_type == "parquet":
+            local_file = table.to_parquet(schema=schema)
+            content_type = "application/vnd.apache.parquet"
         else:
-            raise ValueError(f"Unknown data_type value ({data_type}): must be one of: csv or json")
+            raise ValueError(
+                f"Unknown data_type value ({data_type}): must be one of: csv, json or parquet"
+            )
 
         try:
             blob.upload_from_filename(
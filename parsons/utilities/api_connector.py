@@ -1,14 +1,29 @@
 import logging
+import time
 import urllib.parse
 
-from requests import request as _request
+import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError
-from simplejson.errors import JSONDecodeError
 
 from parsons import Table
+from parsons.utilities.rate_limit import (
+    MAX_RETRY_DELAY,
+    TokenBucket,
+    parse_rate_limit_reset,
+    retry_delay,
+)
 
 logger = logging.getLogger(__name__)
 
+# Default number of connections kept open to each host
+API_POOL_MAXSIZE = 10
+
+# Responses that are retried. Server errors are only retried for idempotent requests,
+# since the server may have acted on the request before failing.
+RETRY_STATUS_CODES = (429, 502, 503, 504)
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+
 
 class APIConnector(object):
     """
@@ -31,11 +46,39 @@ class APIConnector(object):
         data_key: str
             The name of the key in the response json where the data is contained. Required
             if the data is nested in the response json
+        pool_maxsize: int
+            The max number of connections kept open to each host. Raise this when making
+            requests to the API from several threads.
+        max_retries: int
+            The number of times a request is retried after being rate limited (429) or
+            after a temporary server error (502, 503, 504). Set to 0 to disable retries.
+        backoff_factor: float
+            The max number of seconds to wait before the first retry, doubling with each
+            retry. Only used when the response doesn't say how long to wait with a
+            ``Retry-After`` or ``X-RateLimit-Reset`` header.
+        rate_limit: float
+            (Optional) The max number of requests made per second, across all threads.
+            Set this to the API's documented rate limit to avoid being throttled.
+        rate_limit_burst: int
+            (Optional) The max number of requests that can be made at once, before
+            ``rate_limit`` applies. Defaults to ``rate_limit``.
     `Returns`:
         APIConnector class
     """
 
-    def __init__(self, uri, headers=None, auth=None, pagination_key=None, data_key=None):
+    def __init__(
+        self,
+        uri,
+        headers=None,
+        auth=None,
+        pagination_key=None,
+        data_key=None,
+        pool_maxsize=API_POOL_MAXSIZE,
+        max_retries=3,
+        backoff_factor=1,
+        rate_limit=None,
+        rate_limit_burst=None,
+    ):
         # Add a trailing slash if its missing
         if not uri.endswith("/"):
             uri = uri + "/"
@@ -45,6 +88,35 @@ class APIConnector(object):
         self.auth = auth
         self.pagination_key = pagination_key
         self.data_key = data_key
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+
+        self.rate_limiter = TokenBucket(rate_limit, rate_limit_burst) if rate_limit else None
+        # When the API has told us it is out of requests, no requests are made until then
+        self._paused_until = 0
+
+        self._session = None
+
+    @property
+    def session(self):
+        """
+        The ``requests.Session`` used for all requests. Connections are kept alive and
+        reused across requests, rather than opening a new one for each request.
+        """
+
+        if self._session is None:
+            self._session = self._configure_session(requests.Session())
+
+        return self._session
+
+    def _configure_session(self, session):
+        adapter = HTTPAdapter(pool_maxsize=self.pool_maxsize)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({"Accept-Encoding": "gzip, deflate", "Connection": "keep-alive"})
+
+        return session
 
     def request(self, url, req_type, json=None, data=None, params=None):
         """
@@ -74,15 +146,81 @@ class APIConnector(object):
         """
         full_url = urllib.parse.urljoin(self.uri, url)
 
-        return _request(
-            req_type,
-            full_url,
-            headers=self.headers,
-            auth=self.auth,
-            json=json,
-            data=data,
-            params=params,
-        )
+        attempt = 0
+        while True:
+            self._throttle()
+
+            # Headers and auth are passed on each request, rather than set on the session,
+            # since connectors update them after the APIConnector is created
+            resp = self.session.request(
+                req_type,
+                full_url,
+                headers=self.headers,
+                auth=self.auth,
+                json=json,
+                data=data,
+                params=params,
+            )
+
+            # A file being uploaded has been read, so can't be sent again
+            retryable = not hasattr(data, "read") and self._should_retry(resp, req_type)
+            if attempt >= self.max_retries or not retryable:
+                break
+
+            delay = retry_delay(resp.headers, attempt, self.backoff_factor, resp.status_code)
+            if delay is None:
+                logger.warning(
+                    f"Request to {full_url} failed ({resp.status_code}), and the API asked "
+                    f"to wait more than {MAX_RETRY_DELAY} seconds before retrying."
+                )
+                break
+
+            logger.info(
+                f"Request to {full_url} failed ({resp.status_code}), "
+                f"retrying in {delay:.1f} seconds."
+            )
+            self._pause(delay)
+            attempt += 1
+
+        if resp.status_code < 400:
+            self._pause_for_rate_limit(resp)
+
+        return resp
+
+    def _pause_for_rate_limit(self, resp):
+        # Wait out the rate limit window now, rather than getting a 429 next time
+        delay = parse_rate_limit_reset(resp.headers)
+        if not delay:
+            return
+
+        if delay > MAX_RETRY_DELAY:
+            logger.warning(
+                f"Rate limit reached until {delay:.0f} seconds from now, pausing requests for "
+                f"{MAX_RETRY_DELAY} seconds."
+            )
+            delay = MAX_RETRY_DELAY
+        else:
+            logger.info(f"Rate limit reached, pausing requests for {delay:.1f} seconds.")
+
+        self._pause(delay)
+
+    def _should_retry(self, resp, req_type):
+        if resp.status_code == 429:
+            return True
+
+        return resp.status_code in RETRY_STATUS_CODES and req_type.upper() in IDEMPOTENT_METHODS
+
+    def _pause(self, seconds):
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def _throttle(self):
+        # Wait until a request is allowed
+        delay = self._paused_until - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
 
     def get_request(self, url, params=None, return_format="json"):
         """
@@ -238,8 +376,10 @@ class APIConnector(object):
         """
 
         if resp.status_code >= 400:
-            if resp.reason:
-                message = f"HTTP error occurred ({resp.status_code}): {resp.reason}"
+            # httpx responses call the reason reason_phrase
+            reason = getattr(resp, "reason", None) or getattr(resp, "reason_phrase", None)
+            if reason:
+                message = f"HTTP error occurred ({resp.status_code}): {reason}"
             elif resp.text:
                 message = f"HTTP error occurred ({resp.status_code}): {resp.text}"
             else:
@@ -307,7 +447,8 @@ class APIConnector(object):
         try:
             resp.json()
             return True
-        except JSONDecodeError:
+        # requests and httpx raise different JSONDecodeErrors, which are both ValueErrors
+        except ValueError:
             return False
 
     def convert_to_table(self, data):
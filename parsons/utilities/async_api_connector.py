@@ -0,0 +1,369 @@
+import asyncio
+import logging
+import time
+import urllib.parse
+
+from parsons import Table
+from parsons.utilities.api_connector import APIConnector
+from parsons.utilities.rate_limit import MAX_RETRY_DELAY, retry_delay
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncAPIConnector(APIConnector):
+    """
+    An asynchronous version of the :class:`APIConnector`, for making many independent
+    requests at the same time, e.g. looking up one record per row of a table.
+
+    The request methods (``get_request``, ``post_request``, etc.) match the
+    ``APIConnector``'s, but are coroutines. Retries, ``Retry-After`` handling and the
+    ``rate_limit`` work the same way, and the rate limit is shared by all of the
+    concurrent requests.
+
+    Run a coroutine for each row of a table, a limited number at a time, with
+    :meth:`gather`:
+
+    .. code-block:: python
+
+        connector = AsyncAPIConnector("https://myapi.com/v1/", rate_limit=10)
+
+        async def get_thing(thing_id):
+            return await connector.get_request(f"things/{thing_id}")
+
+        things = connector.gather(get_thing, ids_table, max_concurrency=20)
+
+    Requires the ``httpx`` package.
+
+    `Args:`
+        uri: str
+            The base uri for the api. Must include a trailing '/' (e.g. ``http://myapi.com/v1/``)
+        headers: dict
+            The request headers
+        auth: tuple
+            The username and password for basic authentication, or an ``httpx.Auth``
+        pagination_key: str
+            The name of the key in the response json where the pagination url is
+            located. Required for pagination.
+        data_key: str
+            The name of the key in the response json where the data is contained. Required
+            if the data is nested in the response json
+        pool_maxsize: int
+            The max number of connections open at once
+        **kwargs:
+            Other arguments passed to :class:`APIConnector`, e.g. ``max_retries`` or
+            ``rate_limit``
+    `Returns`:
+        AsyncAPIConnector class
+    """
+
+    @property
+    def session(self):
+        """
+        The ``httpx.AsyncClient`` used for all requests. It is created on first use and
+        closed by :meth:`aclose`.
+        """
+
+        if self._session is None:
+            import httpx
+
+            limits = httpx.Limits(
+                max_connections=self.pool_maxsize, max_keepalive_connections=self.pool_maxsize
+            )
+            # No timeout, to match requests
+            self._session = httpx.AsyncClient(limits=limits, timeout=None)
+
+        return self._session
+
+    async def aclose(self):
+        """
+        Close the connections held by the connector. A new client is created if the
+        connector is used again.
+        """
+
+        if self._session is not None:
+            await self._session.aclose()
+            self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def request(self, url, req_type, json=None, data=None, params=None):
+        """
+        Base request using httpx.
+
+        `Args:`
+            url: str
+                The url request string; if ``url`` is a relative URL, it will be joined with
+                the ``uri`` of the ``AsyncAPIConnector``; if ``url`` is an absolute URL, it
+                will be used as is.
+            req_type: str
+                The request type. One of GET, POST, PATCH, DELETE, OPTIONS
+            json: dict
+                The payload of the request object. By using json, it will automatically
+                serialize the dictionary
+            data: str or byte or dict
+                The payload of the request object. Use instead of json in some instances.
+            params: dict
+                The parameters to append to the url (e.g. http://myapi.com/things?id=1)
+
+        `Returns:`
+            httpx response
+        """
+        full_url = urllib.parse.urljoin(self.uri, url)
+
+        # A file being uploaded is read as it is sent, so can't be sent again
+        is_file = hasattr(data, "read")
+
+        # httpx takes raw bodies as content and only form data as data
+        content = None
+        if isinstance(data, (str, bytes)) or is_file:
+            content, data = data, None
+
+        attempt = 0
+        while True:
+            await self._throttle()
+
+            resp = await self.session.request(
+                req_type,
+                full_url,
+                headers=self.headers,
+                auth=self.auth,
+                json=json,
+                data=data,
+                content=content,
+                params=params,
+            )
+
+            retryable = not is_file and self._should_retry(resp, req_type)
+            if attempt >= self.max_retries or not retryable:
+                break
+
+            delay = retry_delay(resp.headers, attempt, self.backoff_factor, resp.status_code)
+            if delay is None:
+                logger.warning(
+                    f"Request to {full_url} failed ({resp.status_code}), and the API asked "
+                    f"to wait more than {MAX_RETRY_DELAY} seconds before retrying."
+                )
+                break
+
+            logger.info(
+                f"Request to {full_url} failed ({resp.status_code}), "
+                f"retrying in {delay:.1f} seconds."
+            )
+            self._pause(delay)
+            attempt += 1
+
+        if resp.status_code < 400:
+            self._pause_for_rate_limit(resp)
+
+        return resp
+
+    async def _throttle(self):
+        # Wait until a request is allowed
+        delay = self._paused_until - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        if self.rate_limiter:
+            delay = self.rate_limiter.reserve()
+            if delay:
+                await asyncio.sleep(delay)
+
+    async def get_request(self, url, params=None, return_format="json"):
+        """
+        Make a GET request.
+
+        Args:
+            url: str
+                A complete and valid url for the api request
+            params: dict
+                The request parameters
+        Returns:
+                A requests response object
+        """
+
+        r = await self.request(url, "GET", params=params)
+        self.validate_response(r)
+
+        if return_format == "json":
+            return r.json()
+        elif return_format == "content":
+            return r.content
+        else:
+            raise RuntimeError(f"{return_format} is not a valid format, change to json or content")
+
+    async def post_request(
+        self, url, params=None, data=None, json=None, success_codes=[200, 201, 202, 204]
+    ):
+        """
+        Make a POST request.
+
+        `Args:`
+            url: str
+                A complete and valid url for the api request
+            params: dict
+                The request parameters
+            data: str or dict
+                A data object to post
+            json: dict
+                A JSON object to post
+            success_code: int
+                The expected success code to be returned
+        `Returns:`
+            A requests response object
+        """
+
+        r = await self.request(url, "POST", params=params, data=data, json=json)
+        return self._parse_response(r, success_codes)
+
+    async def delete_request(self, url, params=None, success_codes=[200, 201, 204]):
+        """
+        Make a DELETE request.
+
+        Args:
+            url: str
+                A complete and valid url for the api request
+            params: dict
+                The request parameters
+            success_codes: int
+                The expected success codes to be returned
+        Returns:
+                A requests response object or status code
+        """
+
+        r = await self.request(url, "DELETE", params=params)
+        return self._parse_response(r, success_codes)
+
+    async def put_request(
+        self, url, data=None, json=None, params=None, success_codes=[200, 201, 204]
+    ):
+        """
+        Make a PUT request.
+
+        Args:
+            url: str
+                A complete and valid url for the api request
+            params: dict
+                The request parameters
+            data: str or dict
+                A data object to post
+            json: dict
+                A JSON object to post
+        Returns:
+                A requests response object
+        """
+
+        r = await self.request(url, "PUT", params=params, data=data, json=json)
+        return self._parse_response(r, success_codes)
+
+    async def patch_request(
+        self, url, params=None, data=None, json=None, success_codes=[200, 201, 204]
+    ):
+        """
+        Make a PATCH request.
+
+        `Args:`
+            url: str
+                A complete and valid url for the api request
+            params: dict
+                The request parameters
+            data: str or dict
+                A data object to post
+            json: dict
+                A JSON object to post
+            success_codes: int
+                The expected success codes to be returned
+        `Returns:`
+            A requests response object
+        """
+
+        r = await self.request(url, "PATCH", params=params, data=data, json=json)
+        return self._parse_response(r, success_codes)
+
+    def _parse_response(self, r, success_codes):
+        self.validate_response(r)
+
+        # Some APIs return messages with the success code and some do not. Be able to
+        # account for both of these types.
+        if r.status_code in success_codes:
+            if self.json_check(r):
+                return r.json()
+            else:
+                return r.status_code
+
+    def gather(self, func, inputs, max_concurrency=10, raise_on_error=True):
+        """
+        Run a coroutine function once for each input, ``max_concurrency`` at a time, and
+        collect the results in a table.
+
+        Closes the connector's client when done. To run from code that is already in an
+        event loop, await :meth:`gather_async` instead.
+
+        `Args:`
+            func: coroutine function
+                Called with each input. Called with the row's values as keyword arguments
+                when ``inputs`` is a table.
+            inputs: Parsons Table or list
+                The inputs to ``func``
+            max_concurrency: int
+                The max number of calls running at once
+            raise_on_error: bool
+                If ``False``, inputs whose call fails are logged and left out of the
+                results, rather than stopping the rest of the calls.
+        `Returns:`
+            Parsons Table
+                The results, in the same order as the inputs. Each call should return a dict,
+                a list of dicts (adding a row for each) or ``None`` (adding no rows).
+        """
+
+        async def run():
+            async with self:
+                return await self.gather_async(
+                    func, inputs, max_concurrency=max_concurrency, raise_on_error=raise_on_error
+                )
+
+        return asyncio.run(run())
+
+    async def gather_async(self, func, inputs, max_concurrency=10, raise_on_error=True):
+        """
+        Same as :meth:`gather`, but a coroutine. Does not close the connector's client.
+        """
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        is_table = isinstance(inputs, Table)
+
+        async def call(value):
+            async with semaphore:
+                try:
+                    if is_table:
+                        return await func(**value)
+                    return await func(value)
+                except Exception as e:
+                    if raise_on_error:
+                        raise
+                    logger.error(f"Call failed for {value}: {e}")
+
+        rows = list(inputs)
+        tasks = [asyncio.ensure_future(call(value)) for value in rows]
+
+        try:
+            results = await asyncio.gather(*tasks)
+        except Exception:
+            # Don't leave the other calls running in the background
+            for task in tasks:
+                task.cancel()
+            raise
+
+        data = []
+        for result in results:
+            if isinstance(result, list):
+                data.extend(result)
+            elif result is not None:
+                data.append(result)
+
+        logger.info(f"Gathered {len(data)} results from {len(rows)} calls.")
+
+        return Table(data)
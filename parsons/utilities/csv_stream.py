@@ -0,0 +1,64 @@
+import csv
+import io
+from itertools import islice
+
+# Number of rows encoded at a time when the stream needs more data
+CSV_STREAM_BATCH_ROWS = 1000
+
+
+class CSVStream(io.TextIOBase):
+    """
+    A read-only, file-like object that encodes rows as CSV text as it is read.
+
+    Useful for handing a table to an API that expects a file (e.g. a database bulk load)
+    without first writing the whole table to disk. Rows are pulled from the iterable and
+    encoded in small batches, only as the consumer asks for more data.
+
+    `Args:`
+        rows: iterable
+            The rows to encode, each row a sequence of values
+        **csvargs: kwargs
+            ``csv.writer`` formatting arguments (e.g. ``delimiter``)
+    """
+
+    def __init__(self, rows, **csvargs):
+        self.num_rows = 0
+
+        self._rows = iter(rows)
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, **csvargs)
+        self._pending = ""
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def _encode_batch(self):
+        # Encode the next batch of rows, returning False once the rows run out
+        rows = list(islice(self._rows, CSV_STREAM_BATCH_ROWS))
+        if not rows:
+            return False
+
+        self._writer.writerows(rows)
+        self.num_rows += len(rows)
+
+        self._pending = self._pending[self._position :] + self._buffer.getvalue()
+        self._position = 0
+        self._buffer.seek(0)
+        self._buffer.truncate()
+
+        return True
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            while self._encode_batch():
+                pass
+            size = len(self._pending) - self._position
+
+        while len(self._pending) - self._position < size and self._encode_batch():
+            pass
+
+        data = self._pending[self._position : self._position + size]
+        self._position += len(data)
+
+        return data
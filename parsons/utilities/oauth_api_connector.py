@@ -1,4 +1,5 @@
-import urllib.parse
+import threading
+import time
 from typing import Dict, Optional
 
 from oauthlib.oauth2 import BackendApplicationClient
@@ -7,6 +8,23 @@ from requests_oauthlib import OAuth2Session
 from parsons.utilities.api_connector import APIConnector
 
 
+class _OAuth2Session(OAuth2Session):
+    # Token refreshes are serialized, so that when the token expires while several threads
+    # are making requests through the session, it is only refreshed once
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._refresh_lock = threading.Lock()
+
+    def refresh_token(self, token_url, **kwargs):
+        with self._refresh_lock:
+            # Another thread may have refreshed the token while this one waited
+            expires_at = self.token.get("expires_at")
+            if expires_at and expires_at > time.time():
+                return self.token
+
+            return super().refresh_token(token_url, **kwargs)
+
+
 class OAuth2APIConnector(APIConnector):
     """
     The OAuth2API Connector is a low level class for authenticated API requests using OAuth2.
@@ -32,6 +50,12 @@ class OAuth2APIConnector(APIConnector):
         data_key: str
             The name of the key in the response json where the data is contained. Required
             if the data is nested in the response json
+        grant_type: str
+            The OAuth2 grant type used to fetch the token
+        authorization_kwargs: dict
+            Additional arguments sent when fetching and refreshing the token
+        **kwargs:
+            Other arguments passed to :class:`APIConnector`, e.g. ``rate_limit``
     `Returns`:
         OAuthAPIConnector class
     """
@@ -48,12 +72,14 @@ class OAuth2APIConnector(APIConnector):
         data_key: Optional[str] = None,
         grant_type: str = "client_credentials",
         authorization_kwargs: Optional[Dict[str, str]] = None,
+        **kwargs,
     ):
         super().__init__(
             uri,
             headers=headers,
             pagination_key=pagination_key,
             data_key=data_key,
+            **kwargs,
         )
 
         if not authorization_kwargs:
@@ -68,45 +94,15 @@ class OAuth2APIConnector(APIConnector):
             client_secret=client_secret,
             **authorization_kwargs,
         )
-        self.client = OAuth2Session(
-            client_id,
-            token=self.token,
-            auto_refresh_url=auto_refresh_url,
-            token_updater=self.token_saver,
-            auto_refresh_kwargs=authorization_kwargs,
-        )
-
-    def request(self, url, req_type, json=None, data=None, params=None):
-        """
-        Base request using requests libary.
-
-        `Args:`
-            url: str
-                The url request string; if ``url`` is a relative URL, it will be joined with
-                the ``uri`` of the ``OAuthAPIConnector`; if ``url`` is an absolute URL, it will
-                be used as is.
-            req_type: str
-                The request type. One of GET, POST, PATCH, DELETE, OPTIONS
-            json: dict
-                The payload of the request object. By using json, it will automatically
-                serialize the dictionary
-            data: str or byte or dict
-                The payload of the request object. Use instead of json in some instances.
-            params: dict
-                The parameters to append to the url (e.g. http://myapi.com/things?id=1)
-
-        `Returns:`
-            requests response
-        """
-        full_url = urllib.parse.urljoin(self.uri, url)
-        return self.client.request(
-            req_type,
-            full_url,
-            headers=self.headers,
-            auth=self.auth,
-            json=json,
-            data=data,
-            params=params,
+        # Requests are sent through the OAuth2 session, which adds the token to them
+        self._session = self.client = self._configure_session(
+            _OAuth2Session(
+                client_id,
+                token=self.token,
+                auto_refresh_url=auto_refresh_url,
+                token_updater=self.token_saver,
+                auto_refresh_kwargs=authorization_kwargs,
+            )
         )
 
     def token_saver(self, token):
@@ -0,0 +1,470 @@
+import itertools
+import logging
+import math
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import petl
+
+from parsons.etl.spill import SpillView, SpillWriter
+from parsons.etl.table import Table
+from parsons.utilities import files
+
+logger = logging.getLogger(__name__)
+
+
+def get_path(obj, path):
+    """
+    Get a value from nested dicts by a dotted path (e.g. ``"links.next"``), returning
+    ``None`` if any part of the path is missing.
+    """
+
+    for key in path.split("."):
+        if not isinstance(obj, dict):
+            return None
+        obj = obj.get(key)
+
+    return obj
+
+
+class Paginator(ABC):
+    """
+    Fetches the pages of a paginated API endpoint one at a time, through an
+    :class:`APIConnector`.
+
+    Use one of the subclasses for the way the API paginates (:class:`NextLinkPaginator`,
+    :class:`CursorPaginator`, :class:`PageNumberPaginator` or :class:`OffsetPaginator`),
+    then either loop over :meth:`pages` or get a lazy Table with :meth:`to_table`:
+
+    .. code-block:: python
+
+        paginator = NextLinkPaginator(connector, "people", next_key="links.next")
+        tbl = paginator.to_table()
+
+    `Args:`
+        connector: APIConnector
+            The connector to make the requests with
+        url: str
+            The url of the first page, relative to the connector's ``uri``
+        params: dict
+            The request parameters
+        data_key: str or function
+            The dotted path of the records in the response json (e.g. ``"data"`` or
+            ``"_embedded.people"``), or a function that takes the response json and returns
+            the records. Defaults to the connector's ``data_key``.
+        limit: int
+            The max number of records to return. No more pages are requested once it is
+            reached.
+    """
+
+    def __init__(self, connector, url, params=None, data_key=None, limit=None):
+        self.connector = connector
+        self.url = url
+        self.params = params or {}
+        self.data_key = data_key
+        self.limit = limit
+
+    def parse_records(self, resp):
+        """
+        Get the list of records in a page's response json.
+        """
+
+        if callable(self.data_key):
+            return self.data_key(resp) or []
+        elif self.data_key:
+            return get_path(resp, self.data_key) or []
+
+        return self.connector.data_parse(resp) or []
+
+    def first_request(self):
+        """
+        Return the url and params of the first page.
+        """
+
+        return self.url, dict(self.params)
+
+    @abstractmethod
+    def next_request(self, resp, records, url, params):
+        """
+        Return the url and params of the page after the one requested with ``url`` and
+        ``params``, or ``None`` if it was the last page.
+        """
+
+    def pages(self):
+        """
+        Request the pages one at a time, yielding the list of records in each.
+
+        Stops at the last page, at the first page with no records, or once ``limit``
+        records have been returned.
+
+        `Returns:`
+            Generator of lists of records
+        """
+
+        count = 0
+        for records in self.fetch():
+            if not records:
+                break
+
+            if self.limit is not None and count + len(records) >= self.limit:
+                yield records[: self.limit - count]
+                break
+
+            count += len(records)
+            yield records
+
+    def fetch(self, request=None):
+        """
+        Request the pages one at a time, yielding the list of records in each, until the
+        last page. Used by :meth:`pages`, which also handles empty pages and ``limit``.
+
+        `Args:`
+            request: tuple
+                The url and params of the page to start from. Defaults to the first page.
+        `Returns:`
+            Generator of lists of records
+        """
+
+        request = request or self.first_request()
+
+        while request is not None:
+            url, params = request
+            resp = self.connector.get_request(url, params=params)
+            records = self.parse_records(resp)
+            yield records
+
+            request = self.next_request(resp, records, url, params)
+
+    def to_table(self, header=None):
+        """
+        Return the records as a lazy Parsons Table.
+
+        The first page is requested straight away. Only one page is held in memory at a
+        time, and pages are saved to a temp file as they arrive, so reading the table
+        again doesn't request them again.
+
+        Without a ``header``, every page is requested when the table is created, to find
+        the fields of all of the records. With one, the rest of the pages are requested
+        as the table is read, so processing and loading can start before the last page
+        arrives.
+
+        `Args:`
+            header: list
+                The columns of the table. Defaults to the fields of all of the records, in
+                the order they are first seen.
+        `Returns:`
+            Parsons Table
+        """
+
+        return Table(PaginatedView(self, header=header))
+
+
+class NextLinkPaginator(Paginator):
+    """
+    A :class:`Paginator` for APIs whose responses include the url of the next page.
+
+    `Args:`
+        next_key: str
+            The dotted path of the next page's url in the response json
+        **kwargs:
+            Arguments passed to :class:`Paginator`
+    """
+
+    def __init__(self, connector, url, next_key="next", **kwargs):
+        super().__init__(connector, url, **kwargs)
+        self.next_key = next_key
+
+    def next_request(self, resp, records, url, params):
+        next_url = get_path(resp, self.next_key)
+        if not next_url:
+            return None
+
+        # The link includes the query parameters
+        return next_url, None
+
+
+class CursorPaginator(Paginator):
+    """
+    A :class:`Paginator` for APIs whose responses include a cursor, to be passed as a
+    parameter to get the next page.
+
+    `Args:`
+        cursor_key: str
+            The dotted path of the cursor in the response json
+        cursor_param: str
+            The name of the request parameter to pass the cursor in
+        **kwargs:
+            Arguments passed to :class:`Paginator`
+    """
+
+    def __init__(self, connector, url, cursor_key="next_cursor", cursor_param="cursor", **kwargs):
+        super().__init__(connector, url, **kwargs)
+        self.cursor_key = cursor_key
+        self.cursor_param = cursor_param
+
+    def next_request(self, resp, records, url, params):
+        cursor = get_path(resp, self.cursor_key)
+        if not cursor:
+            return None
+
+        return url, {**params, self.cursor_param: cursor}
+
+
+class PageNumberPaginator(Paginator):
+    """
+    A :class:`Paginator` for APIs that take the page number as a parameter.
+
+    `Args:`
+        page_param: str
+            The name of the page number request parameter
+        start_page: int
+            The number of the first page
+        page_size: int
+            (Optional) The number of records per page
+        page_size_param: str
+            The name of the page size request parameter
+        total_pages_key: str
+            (Optional) The dotted path of the total number of pages in the response json.
+            Saves requesting an empty page after the last one, and allows the pages to be
+            requested concurrently.
+        max_workers: int
+            The max number of pages requested at the same time, once the total number of
+            pages is known from the first page. Pages are still returned in order. Requires
+            ``total_pages_key``.
+        **kwargs:
+            Arguments passed to :class:`Paginator`
+    """
+
+    def __init__(
+        self,
+        connector,
+        url,
+        page_param="page",
+        start_page=1,
+        page_size=None,
+        page_size_param="per_page",
+        total_pages_key=None,
+        max_workers=1,
+        **kwargs,
+    ):
+        super().__init__(connector, url, **kwargs)
+        self.page_param = page_param
+        self.start_page = start_page
+        self.page_size = page_size
+        self.page_size_param = page_size_param
+        self.total_pages_key = total_pages_key
+        self.max_workers = max_workers
+
+    def first_request(self):
+        params = {**self.params, self.page_param: self.start_page}
+        if self.page_size:
+            params[self.page_size_param] = self.page_size
+
+        return self.url, params
+
+    def next_request(self, resp, records, url, params):
+        page = params[self.page_param]
+
+        if self.total_pages_key:
+            total_pages = get_path(resp, self.total_pages_key)
+            if total_pages is not None and page - self.start_page + 1 >= int(total_pages):
+                return None
+
+        return url, {**params, self.page_param: page + 1}
+
+    def fetch(self, request=None):
+        if self.max_workers <= 1 or not self.total_pages_key or request is not None:
+            yield from super().fetch(request)
+            return
+
+        url, params = self.first_request()
+        resp = self.connector.get_request(url, params=params)
+        records = self.parse_records(resp)
+        yield records
+
+        total_pages = get_path(resp, self.total_pages_key)
+        if total_pages is None:
+            # The API didn't report the total, so carry on one page at a time
+            request = self.next_request(resp, records, url, params)
+            if request is not None:
+                yield from super().fetch(request)
+            return
+
+        last_page = self.start_page + int(total_pages) - 1
+        if self.limit is not None:
+            # Don't request pages past the limit
+            page_size = self.page_size or len(records) or 1
+            last_page = min(last_page, self.start_page + math.ceil(self.limit / page_size) - 1)
+
+        yield from self.fetch_pages(range(self.start_page + 1, last_page + 1))
+
+    def fetch_pages(self, page_numbers):
+        """
+        Request the given pages, ``max_workers`` at a time, yielding the list of records
+        in each in the order of ``page_numbers``.
+
+        Only a few more pages than ``max_workers`` are requested ahead of the page being
+        read, so memory use stays bounded. The requests still in progress are cancelled if
+        the generator is closed.
+
+        `Args:`
+            page_numbers: iterable
+                The numbers of the pages to request
+        `Returns:`
+            Generator of lists of records
+        """
+
+        url, params = self.first_request()
+
+        def fetch_page(page):
+            resp = self.connector.get_request(url, params={**params, self.page_param: page})
+            return self.parse_records(resp)
+
+        page_numbers = iter(page_numbers)
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            futures = deque(
+                executor.submit(fetch_page, page)
+                for page in itertools.islice(page_numbers, self.max_workers * 2)
+            )
+            while futures:
+                records = futures.popleft().result()
+
+                page = next(page_numbers, None)
+                if page is not None:
+                    futures.append(executor.submit(fetch_page, page))
+
+                yield records
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+class OffsetPaginator(Paginator):
+    """
+    A :class:`Paginator` for APIs that take the offset of the first record as a parameter.
+
+    `Args:`
+        page_size: int
+            The number of records per page
+        offset_param: str
+            The name of the offset request parameter
+        page_size_param: str
+            The name of the page size request parameter
+        total_key: str
+            (Optional) The dotted path of the total number of records in the response
+            json. Saves requesting an empty page after the last one.
+        **kwargs:
+            Arguments passed to :class:`Paginator`
+    """
+
+    def __init__(
+        self,
+        connector,
+        url,
+        page_size=100,
+        offset_param="offset",
+        page_size_param="limit",
+        total_key=None,
+        **kwargs,
+    ):
+        super().__init__(connector, url, **kwargs)
+        self.page_size = page_size
+        self.offset_param = offset_param
+        self.page_size_param = page_size_param
+        self.total_key = total_key
+
+    def first_request(self):
+        params = {**self.params, self.offset_param: 0, self.page_size_param: self.page_size}
+        return self.url, params
+
+    def next_request(self, resp, records, url, params):
+        offset = params[self.offset_param] + len(records)
+
+        if self.total_key:
+            total = get_path(resp, self.total_key)
+            if total is not None and offset >= int(total):
+                return None
+
+        return url, {**params, self.offset_param: offset}
+
+
+class PaginatedView(petl.Table):
+    """
+    A petl table of the records of a :class:`Paginator`.
+
+    The first page is requested when the view is created. The records of each page are
+    written to a spill file as they arrive; once the last page has been written, the
+    table is read from the file.
+
+    Records can leave out fields (e.g. ones with no value), so without a ``header`` every
+    page is requested the first time the table is read, to find the fields of all of the
+    records. With a ``header``, the later pages are requested as the table is read, and
+    if a read stops partway through them, the next one requests them again.
+
+    `Args:`
+        paginator: Paginator
+            The paginator to get the records from
+        header: list
+            The columns of the table. Defaults to the fields of all of the records, in the
+            order they are first seen.
+    """
+
+    def __init__(self, paginator, header=None):
+        self.paginator = paginator
+        self.header = header
+
+        self._spill = None
+        self._fields = None
+        self.num_rows = None
+
+        # Request the first page now, so that errors are raised when the table is created
+        self._pages = paginator.pages()
+        self._first_page = next(self._pages, [])
+
+    def __iter__(self):
+        if self._spill is None and self.header is None:
+            for _ in self._fetch():
+                pass
+
+        if self._spill is not None:
+            header = tuple(self.header or self._fields)
+            yield header
+            for (record,) in petl.data(self._spill):
+                yield tuple(record.get(field) for field in header)
+            return
+
+        header = tuple(self.header)
+        yield header
+        for page in self._fetch():
+            yield from (tuple(record.get(field) for field in header) for record in page)
+
+    def _fetch(self):
+        # Yields each page, writing its records to a spill file. The table is read from the
+        # file once every page has been written.
+        fields = {}
+
+        file_path = files.create_temp_file()
+        with SpillWriter(file_path, ["record"]) as writer:
+            page = self._first_page
+            pages = None
+            while page:
+                writer.write_rows((record,) for record in page)
+                for record in page:
+                    fields.update(dict.fromkeys(record))
+                yield page
+
+                if pages is None:
+                    # Reading just the header or the first page leaves the requests made
+                    # so far to be used by the next read
+                    pages, self._pages = self._pages, None
+                    if pages is None:
+                        pages = self.paginator.pages()
+                        next(pages, None)
+
+                page = next(pages, None)
+
+        logger.debug(f"Retrieved {writer.num_rows} records.")
+        self._fields = list(fields)
+        self._spill = SpillView(file_path, num_rows=writer.num_rows)
+        self.num_rows = writer.num_rows
@@ -0,0 +1,163 @@
+import email.utils
+import random
+import threading
+import time
+
+# Longest we'll wait before retrying a request, or after using up a rate limit
+MAX_RETRY_DELAY = 300
+
+# Responses whose ``Retry-After`` header says how long to wait before the next request
+RETRY_AFTER_STATUS_CODES = (429, 503)
+
+# Above this, an ``X-RateLimit-Reset`` value is a timestamp rather than a number of seconds
+RESET_TIMESTAMP_THRESHOLD = 1_000_000_000
+
+
+class TokenBucket(object):
+    """
+    A client-side rate limiter, shared by every thread making requests to an API.
+
+    Holds up to ``capacity`` tokens, refilled at ``rate`` tokens per second. Each request
+    takes a token, waiting for the next one when the bucket is empty. This allows short
+    bursts of up to ``capacity`` requests, while keeping the sustained rate at ``rate``.
+
+    `Args:`
+        rate: float
+            The number of requests allowed per second
+        capacity: int
+            The max number of requests that can be made at once. Defaults to ``rate``,
+            or 1 if ``rate`` is less than 1.
+    """
+
+    def __init__(self, rate, capacity=None):
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+
+        self.rate = rate
+        self.capacity = capacity or max(1, rate)
+
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """
+        Take a token, and return how many seconds to wait before using it.
+
+        `Returns:`
+            float
+        """
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+            # The bucket can go negative, which queues callers up behind each other
+            self._tokens -= 1
+            return max(0, -self._tokens / self.rate)
+
+    def acquire(self):
+        """
+        Take a token, waiting until one is available.
+        """
+
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+
+def parse_retry_after(headers):
+    """
+    Get the number of seconds an API has asked us to wait, from the ``Retry-After`` header.
+    Only meaningful on a 429 or 503 response.
+
+    `Args:`
+        headers: dict
+            The response headers
+    `Returns:`
+        float
+            The number of seconds to wait, or ``None`` if the headers don't say
+    """
+
+    retry_after = headers.get("Retry-After")
+    if not retry_after:
+        return None
+
+    try:
+        return max(0, float(retry_after))
+    except ValueError:
+        # Retry-After can also be an HTTP date
+        try:
+            retry_at = email.utils.parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+        return max(0, retry_at.timestamp() - time.time())
+
+
+def parse_rate_limit_reset(headers):
+    """
+    Get the number of seconds until the API's rate limit resets, from the
+    ``X-RateLimit-Reset`` (or ``RateLimit-Reset``) header, when the rate limit is used up.
+
+    `Args:`
+        headers: dict
+            The response headers
+    `Returns:`
+        float
+            The number of seconds to wait, or ``None`` if the rate limit isn't used up
+    """
+
+    remaining = headers.get("X-RateLimit-Remaining", headers.get("RateLimit-Remaining"))
+    reset = headers.get("X-RateLimit-Reset", headers.get("RateLimit-Reset"))
+    if not reset or remaining is None or remaining.strip() != "0":
+        return None
+
+    try:
+        reset = float(reset)
+    except ValueError:
+        return None
+
+    # Some APIs give the time the limit resets at, others the seconds until it does
+    if reset > RESET_TIMESTAMP_THRESHOLD:
+        return max(0, reset - time.time())
+    return reset
+
+
+def retry_delay(headers, attempt, backoff_factor, status_code=429):
+    """
+    Get the number of seconds to wait before retrying a request.
+
+    Uses the wait the API asks for, if any: the ``Retry-After`` header of a 429 or 503
+    response, or the time until a used up rate limit resets. Otherwise backs off
+    exponentially from ``backoff_factor`` with full jitter, so that clients that were
+    throttled together don't all retry at once. Backoff is capped at ``MAX_RETRY_DELAY``.
+
+    `Args:`
+        headers: dict
+            The response headers
+        attempt: int
+            The number of retries already made for the request
+        backoff_factor: float
+            The max wait, in seconds, before the first retry
+        status_code: int
+            The status code of the response
+    `Returns:`
+        float
+            The number of seconds to wait, or ``None`` if the API asks to wait longer than
+            ``MAX_RETRY_DELAY``, as retrying any sooner would fail again.
+    """
+
+    delay = None
+    if status_code in RETRY_AFTER_STATUS_CODES:
+        delay = parse_retry_after(headers)
+    if delay is None:
+        delay = parse_rate_limit_reset(headers)
+
+    if delay is None:
+        return min(random.uniform(0, backoff_factor * 2**attempt), MAX_RETRY_DELAY)
+
+    if delay > MAX_RETRY_DELAY:
+        return None
+
+    return delay
@@ -6,11 +6,14 @@ from typing import Dict, Literal, Optional
 from parsons import Table
 from parsons.utilities import check_env
 from parsons.utilities.oauth_api_connector import OAuth2APIConnector
+from parsons.utilities.paginator import PageNumberPaginator
 
 logger = logging.getLogger(__name__)
 
 ZOOM_URI = "https://api.zoom.us/v2/"
 ZOOM_AUTH_CALLBACK = "https://zoom.us/oauth/token"
+# Number of pages requested at the same time
+ZOOM_PAGE_WORKERS = 4
 
 ##########
 
@@ -45,7 +48,7 @@ class ZoomV1:
             authorization_kwargs={"account_id": self.account_id},
         )
 
-    def _get_request(self, endpoint, data_key, params=None, **kwargs):
+    def _get_request(self, endpoint, data_key, params=None):
         """
         TODO: Consider increasing default page size.
 
@@ -68,7 +71,7 @@ class ZoomV1:
             "See docs for more information: https://move-coop.github.io/parsons/html/latest/zoom.html"
         )
 
-        r = self.client.get_request(endpoint, params=params, **kwargs)
+        r = self.client.get_request(endpoint, params=params)
         self.client.data_key = data_key
         data = self.client.data_parse(r)
 
@@ -82,12 +85,19 @@ class ZoomV1:
             if isinstance(data, list):
                 return Table(data)
 
-        # Else iterate through the pages and return a Table
+        # Else request the rest of the pages, several at a time, and return a Table
         else:
-            while r["page_number"] < r["page_count"]:
-                params["page_number"] = int(r["page_number"]) + 1
-                r = self.client.get_request(endpoint, params=params, **kwargs)
-                data.extend(self.client.data_parse(r))
+            # Records are parsed by the client, using the data_key set above
+            paginator = PageNumberPaginator(
+                self.client,
+                endpoint,
+                params=params,
+                page_param="page_number",
+                max_workers=ZOOM_PAGE_WORKERS,
+            )
+            pages = range(int(r["page_number"]) + 1, int(r["page_count"]) + 1)
+            for records in paginator.fetch_pages(pages):
+                data.extend(records)
             return Table(data)
 
     def __handle_nested_json(self, table: Table, column: str, version: int = 1) -> Table:
@@ -18,6 +18,8 @@ def main():
         extras_require = {
             "airtable": ["pyairtable"],
             "alchemer": ["surveygizmo"],
+            "arrow": ["pyarrow"],
+            "async": ["httpx"],
             "azure": ["azure-storage-blob"],
             "box": ["boxsdk"],
             "braintree": ["braintree"],
@@ -34,6 +36,7 @@ def main():
                 "apiclient",
                 "google-api-python-client",
                 "google-cloud-bigquery",
+                "google-cloud-bigquery-storage",
                 "google-cloud-storage",
                 "google-cloud-storage-transfer",
                 "gspread",
@@ -3344,6 +3344,11 @@ class TestActionNetwork(unittest.TestCase):
         )
         assert_matching_tables(self.an._get_entry_list("people"), Table(self.fake_people_list))
 
+        # A limit of 0 returns every entry
+        assert_matching_tables(
+            self.an._get_entry_list("people", limit=0), Table(self.fake_people_list)
+        )
+
     @requests_mock.Mocker()
     def test_filter_get_people(self, m):
         m.get(
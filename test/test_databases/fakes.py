@@ -1,4 +1,5 @@
 import logging
+import threading
 from typing import Optional, Union
 
 from parsons.databases.database_connector import DatabaseConnector
@@ -11,6 +12,7 @@ class FakeDatabase(DatabaseConnector):
     def __init__(self):
         self.table_map = {}
         self.copy_call_args = []
+        self._lock = threading.Lock()
 
     def query(self, sql: str, parameters: Optional[Union[list, dict]] = None) -> Table:
         return Table()
@@ -32,6 +34,10 @@ class FakeDatabase(DatabaseConnector):
         return self.table_map[table_name]["table"]
 
     def copy(self, data, table_name, **kwargs):
+        with self._lock:
+            self._copy(data, table_name, **kwargs)
+
+    def _copy(self, data, table_name, **kwargs):
         logger.info("Copying %s rows", data.num_rows)
         if table_name not in self.table_map:
             self.setup_table(table_name, Table())
@@ -81,6 +87,9 @@ class FakeTable:
         pk_set = set(pk_values)
         return len(pk_set) == len(pk_values)
 
+    def has_nulls(self, column):
+        return any(val is None for val in self.data[column])
+
     @property
     def columns(self):
         return self.data.columns
@@ -95,6 +104,10 @@ class FakeTable:
     def num_rows(self):
         return self.data.num_rows
 
+    @property
+    def estimated_num_rows(self):
+        return self.data.num_rows
+
     @property
     def exists(self):
         return self.data is not None
@@ -120,7 +133,10 @@ class FakeTable:
         return data.num_rows
 
     def get_new_rows(self, primary_key, cutoff_value, offset=0, chunk_size=None):
-        data = self.data.select_rows(lambda row: row[primary_key] > cutoff_value)
+        if cutoff_value is None:
+            data = self.data.cut(*self.data.columns)
+        else:
+            data = self.data.select_rows(lambda row: row[primary_key] > cutoff_value)
         data.sort(primary_key)
 
         return Table(data[offset : chunk_size + offset])
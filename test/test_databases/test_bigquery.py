@@ -101,6 +101,43 @@ class TestGoogleBigQuery(FakeCredentialTest):
         # Check that query results were not fetched
         bq._fetch_query_results.assert_not_called()
 
+    def test_query__storage_api(self):
+        import pyarrow as pa
+
+        bq = self._build_mock_client_for_querying([{"one": 1, "two": "a"}])
+        bq._storage_client = mock.MagicMock()
+
+        batches = [
+            pa.record_batch([pa.array([1, 2]), pa.array(["a", "b"])], names=["one", "two"]),
+            pa.record_batch([pa.array([3]), pa.array([None], pa.string())], names=["one", "two"]),
+        ]
+        cursor = bq._dbapi.connect.return_value.cursor.return_value
+        results = cursor.query_job.result.return_value
+        results.to_arrow_iterable.return_value = iter(batches)
+
+        result = bq.query("select * from table", use_storage_api=True, max_stream_count=4)
+
+        results.to_arrow_iterable.assert_called_once_with(
+            bqstorage_client=bq._storage_client, max_stream_count=4
+        )
+        cursor.fetchmany.assert_not_called()
+        self.assertEqual(result.columns, ["one", "two"])
+        self.assertEqual(list(result.data), [(1, "a"), (2, "b"), (3, None)])
+
+    def test_query__storage_api_no_rows(self):
+        bq = self._build_mock_client_for_querying([{"one": 1}])
+        bq._storage_client = mock.MagicMock()
+
+        cursor = bq._dbapi.connect.return_value.cursor.return_value
+        results = cursor.query_job.result.return_value
+        results.to_arrow_iterable.return_value = iter([])
+        results.schema = [bigquery.SchemaField("one", "INTEGER")]
+
+        result = bq.query("select * from table", use_storage_api=True)
+
+        self.assertEqual(result.columns, ["one"])
+        self.assertEqual(result.num_rows, 0)
+
     @mock.patch("parsons.utilities.files.create_temp_file")
     def test_query_with_transaction(self, create_temp_file_mock):
         queries = ["select * from table", "select foo from bar"]
@@ -399,6 +436,85 @@ class TestGoogleBigQuery(FakeCredentialTest):
         self.assertEqual(delete_call_args[0][0], self.tmp_gcs_bucket)
         self.assertEqual(delete_call_args[0][1], tmp_blob_name)
 
+    def test_copy_parquet(self):
+        gcs_client = self._build_mock_cloud_storage_client("gs://tmp/file")
+        bq = self._build_mock_client_for_copying(table_exists=False)
+        bq._load_table_from_uri = mock.MagicMock()
+
+        bq.copy(
+            self.default_table,
+            "dataset.table",
+            tmp_gcs_bucket=self.tmp_gcs_bucket,
+            gcs_client=gcs_client,
+            data_type="parquet",
+        )
+
+        upload_call_args = gcs_client.upload_table.call_args
+        self.assertEqual(upload_call_args[1]["data_type"], "parquet")
+        self.assertTrue(upload_call_args[0][2].endswith(".parquet"))
+
+        # The column types come from the file
+        job_config = bq._load_table_from_uri.call_args[1]["job_config"]
+        self.assertEqual(job_config.source_format, bigquery.SourceFormat.PARQUET)
+        self.assertFalse(job_config.schema)
+        self.assertIsNone(job_config.skip_leading_rows)
+
+    def test_copy_parquet_existing_table(self):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        gcs_client = self._build_mock_cloud_storage_client("gs://tmp/file")
+        bq = self._build_mock_client_for_copying()
+        bq.client.get_table.return_value.schema = [
+            bigquery.SchemaField("day", "DATE"),
+            bigquery.SchemaField("num", "INTEGER"),
+            bigquery.SchemaField("ltr", "STRING"),
+        ]
+        bq._load_table_from_uri = mock.MagicMock()
+
+        # Values read from a CSV are all strings
+        tbl = Table([["num", "ltr", "day"], ["1", "a", "2024-01-02"], ["2", "b", ""]])
+        bq.copy(
+            tbl,
+            "dataset.table",
+            if_exists="append",
+            tmp_gcs_bucket=self.tmp_gcs_bucket,
+            gcs_client=gcs_client,
+            data_type="parquet",
+        )
+
+        # The file is written with the types of the table's columns, in the file's order
+        schema = gcs_client.upload_table.call_args[1]["schema"]
+        self.assertEqual(schema.names, ["num", "ltr", "day"])
+        self.assertEqual(schema.types, [pa.int64(), pa.string(), pa.date32()])
+
+        written = pq.read_table(tbl.to_parquet(schema=schema))
+        self.assertEqual(written.schema, schema)
+        self.assertEqual(written.column("num").to_pylist(), [1, 2])
+
+    def test_copy__converts_dict_list_columns_to_json(self):
+        gcs_client = self._build_mock_cloud_storage_client("gs://tmp/file")
+        bq = self._build_mock_client_for_copying(table_exists=False)
+        bq._load_table_from_uri = mock.MagicMock()
+
+        tbl = Table(
+            [
+                {"num": 1, "obj": {"a": 1}, "arr": [1, 2]},
+                {"num": 2, "obj": None, "arr": []},
+            ]
+        )
+        bq.copy(tbl, "dataset.table", tmp_gcs_bucket=self.tmp_gcs_bucket, gcs_client=gcs_client)
+
+        uploaded = gcs_client.upload_table.call_args[0][0]
+        self.assertEqual(uploaded.columns, ["num", "obj", "arr"])
+        self.assertEqual(
+            uploaded.to_dicts(),
+            [
+                {"num": 1, "obj": '{"a": 1}', "arr": "[1, 2]"},
+                {"num": 2, "obj": "null", "arr": "[]"},
+            ],
+        )
+
     @mock.patch("parsons.google.google_cloud_storage.load_google_application_credentials")
     @mock.patch("parsons.google.google_bigquery.load_google_application_credentials")
     def test_copy__credentials_are_correctly_set__from_filepath(
@@ -1,8 +1,14 @@
+import functools
+import random
+from decimal import Decimal
+
 import pytest
 
+from parsons import Table
 from parsons.databases.database.constants import (
     BIGINT,
     BOOL,
+    FLOAT,
     INT,
     MEDIUMINT,
     SMALLINT,
@@ -106,6 +112,85 @@ def test_detect_data_type_bools(dcs, val, cmp_type, detected_type):
     assert dcs.detect_data_type(val, cmp_type) == detected_type
 
 
+@pytest.mark.parametrize(
+    ("values", "cmp_type", "detected_type"),
+    (
+        ([1, 2, 3], None, SMALLINT),
+        ([1, 40000, 2], None, MEDIUMINT),
+        ([-30000000, 2], None, INT),
+        ([1, 2**40], None, BIGINT),
+        ([1, 1.0], None, FLOAT),
+        ([1, "1.5"], None, SMALLINT),
+        (["1", "2"], None, None),
+        ([1, "01"], None, VARCHAR),
+        ([None, None], None, None),
+        ([None, 5], INT, INT),
+        ([1, True], None, BOOL),
+        ([True, 1], None, SMALLINT),
+        ([True, 1, True], None, BOOL),
+        ([Decimal("1.5"), 2], None, VARCHAR),
+        ([[1], 2], None, VARCHAR),
+        ([1, 2], VARCHAR, VARCHAR),
+    ),
+)
+def test_detect_column_type(dcs, values, cmp_type, detected_type):
+    assert dcs.detect_column_type(values, cmp_type) == detected_type
+
+
+def test_detect_column_type_matches_detect_data_type(dcs):
+    # Whatever the mix of values, the column type should be the same as when checking
+    # every value in turn
+    rng = random.Random(42)
+    candidates = [None, True, False, 0, 1, -1, 40000, 2**31, 2**40, 1.5, 0.0, "2", "1.5"]
+    candidates += ["02", "a", "", Decimal("3.1")]
+
+    for _ in range(500):
+        values = rng.choices(candidates, k=rng.randint(0, 12))
+        expected = functools.reduce(lambda t, v: dcs.detect_data_type(v, t), values, None)
+        assert dcs.detect_column_type(values) == expected, values
+
+
+def test_profile_columns(dcs):
+    tbl = Table(
+        [
+            ["a", "b", "c", "d"],
+            [1, "x", "NA", 1.5],
+            [40000, "héllo", "", 2],
+            [3, None, "", None],
+            [4],
+        ]
+    )
+
+    assert dcs.profile_columns(tbl, null_values=("NA", "")) == [
+        {"name": "a", "type": MEDIUMINT, "width": 5},
+        {"name": "b", "type": VARCHAR, "width": 6},
+        {"name": "c", "type": None, "width": 4},
+        {"name": "d", "type": FLOAT, "width": 4},
+    ]
+
+    # Profiling in small batches gives the same result
+    assert dcs.profile_columns(tbl, null_values=("NA", ""), batch_size=1) == (
+        dcs.profile_columns(tbl, null_values=("NA", ""))
+    )
+
+
+def test_profile_columns_sample(dcs):
+    tbl = Table([["a", "b"]] + [[i, "x"] for i in range(100)] + [[1.5, "a longer value"]])
+
+    sampled = dcs.profile_columns(tbl, sample_size=10)
+    assert sampled == [
+        {"name": "a", "type": SMALLINT, "width": 1},
+        {"name": "b", "type": VARCHAR, "width": 1},
+    ]
+
+    verified = dcs.profile_columns(tbl, sample_size=10, verify_sample=True)
+    assert verified == dcs.profile_columns(tbl)
+    assert verified == [
+        {"name": "a", "type": FLOAT, "width": 3},
+        {"name": "b", "type": VARCHAR, "width": 14},
+    ]
+
+
 @pytest.mark.parametrize(
     ("col", "renamed"),
     (
@@ -2,10 +2,11 @@ import os
 import unittest
 from abc import ABC
 from typing import Optional, Type
+from unittest import mock
 
 from parsons import DBSync, Postgres, Redshift, Table
 from parsons.databases.database_connector import DatabaseConnector
-from test.test_databases.fakes import FakeDatabase
+from test.test_databases.fakes import FakeDatabase, FakeTable
 from test.utils import assert_matching_tables
 
 _dir = os.path.dirname(__file__)
@@ -182,6 +183,159 @@ class TestFakeDBSync(TestDBSync):
             self.destination_db.copy_call_args[0],
         )
 
+    def test_table_sync_full_keyset_pagination(self):
+        self.set_up_db_sync(read_chunk_size=40)
+        source = self.source_db.table(self.source_table)
+
+        with mock.patch.object(source, "get_new_rows", wraps=source.get_new_rows) as get_new_rows:
+            self.table_sync_full(if_exists="drop", order_by="pk")
+
+        self.assert_matching_tables()
+
+        # Each chunk starts after the last key read, without an offset
+        cutoffs = [c.kwargs["cutoff_value"] for c in get_new_rows.call_args_list]
+        self.assertEqual(cutoffs, [None, "040", "080", "100"])
+        self.assertTrue(all("offset" not in c.kwargs for c in get_new_rows.call_args_list))
+
+    def test_table_sync_full_keyset_pagination_not_distinct(self):
+        self.source_db.copy(self.table1, self.source_table, if_exists="append")
+        self.set_up_db_sync(read_chunk_size=40)
+        source = self.source_db.table(self.source_table)
+
+        with mock.patch.object(source, "get_rows", wraps=source.get_rows) as get_rows:
+            self.table_sync_full(if_exists="drop", order_by="pk")
+
+        # Falls back to OFFSET pagination, since keys repeat
+        self.assertEqual(get_rows.call_args_list[1].kwargs["offset"], 40)
+        self.assertEqual(self.destination_db.table(self.destination_table).num_rows, 200)
+
+    def test_table_sync_full_keyset_pagination_nulls(self):
+        self.source_db.copy(
+            Table([{"pk": None, "data": "0.5"}]), self.source_table, if_exists="append"
+        )
+        self.set_up_db_sync(read_chunk_size=40)
+        source = self.source_db.table(self.source_table)
+
+        with mock.patch.object(source, "get_new_rows") as get_new_rows:
+            self.table_sync_full(if_exists="drop", order_by="pk")
+
+        # Falls back to OFFSET pagination, and every row is copied once
+        get_new_rows.assert_not_called()
+        self.assertEqual(self.destination_db.table(self.destination_table).num_rows, 101)
+
+    def test_table_sync_full_offset_pagination(self):
+        self.set_up_db_sync(read_chunk_size=2, keyset_pagination=False)
+        source = self.source_db.table(self.source_table)
+
+        with mock.patch.object(source, "get_new_rows") as get_new_rows:
+            self.table_sync_full(if_exists="drop", order_by="pk")
+
+        get_new_rows.assert_not_called()
+        self.assert_matching_tables()
+
+    def test_table_sync_full_pipelined(self):
+        self.set_up_db_sync(read_chunk_size=10, write_chunk_size=25, pipelined=True)
+        self.table_sync_full(if_exists="drop", order_by="pk")
+        self.assert_matching_tables()
+
+        # 100 rows read 10 at a time, written in 4 chunks
+        self.assertEqual(
+            [c["data"].num_rows for c in self.destination_db.copy_call_args], [30, 30, 30, 10]
+        )
+
+    def test_table_sync_full_pipelined_multiple_writers(self):
+        self.set_up_db_sync(read_chunk_size=10, pipelined=True, writer_threads=3, queue_depth=1)
+        self.table_sync_full(if_exists="drop", order_by="pk")
+
+        source = self.source_db.table(self.source_table).data
+        destination = self.destination_db.table(self.destination_table).data
+        assert_matching_tables(source, destination.sort("pk"))
+
+    def test_table_sync_full_pipelined_with_retry(self):
+        self.destination_db.setup_table(self.destination_table, Table(), failures=2)
+        self.set_up_db_sync(read_chunk_size=10, pipelined=True, retries=2)
+        self.table_sync_full(if_exists="drop")
+        self.assert_matching_tables()
+
+    def test_table_sync_full_pipelined_without_retry(self):
+        self.destination_db.setup_table(self.destination_table, Table(), failures=1)
+        self.set_up_db_sync(read_chunk_size=10, pipelined=True)
+        self.assertRaisesRegex(
+            ValueError, "Canned error", lambda: self.table_sync_full(if_exists="drop")
+        )
+
+    def test_table_sync_incremental_pipelined(self):
+        self.set_up_db_sync(read_chunk_size=10, pipelined=True)
+        self.destination_db.copy(self.table1, self.destination_table)
+        self.source_db.copy(self.table2, self.source_table, if_exists="append")
+        self.db_sync.table_sync_incremental(self.source_table, self.destination_table, "pk")
+        self.assert_matching_tables()
+
+    def test_sync_tables(self):
+        self.source_db.copy(self.table2, "small_source")
+        self.destination_db.copy(self.table1, self.destination_table)
+        self.source_db.copy(self.table2, self.source_table, if_exists="append")
+
+        report = self.db_sync.sync_tables(
+            [
+                ("small_source", "small_destination"),
+                {
+                    "source_table": self.source_table,
+                    "destination_table": self.destination_table,
+                    "primary_key": "pk",
+                },
+            ],
+            max_workers=1,
+            max_source_connections=1,
+            max_destination_connections=1,
+        )
+        self.assert_matching_tables()
+
+        # The largest table is synced first
+        self.assertEqual(report["source_table"], [self.source_table, "small_source"])
+        self.assertEqual(report["sync_type"], ["incremental", "full"])
+        self.assertEqual(report["rows_copied"], [self.table2.num_rows, self.table2.num_rows])
+        self.assertEqual(report["status"], ["success", "success"])
+
+    def test_sync_tables_metadata(self):
+        self.source_db.copy(self.table2, "other_source")
+        counts = []
+
+        def num_rows(table):
+            # Record which connection slots are free while the rows are counted
+            counts.append(
+                (self.db_sync._source_slots._value, self.db_sync._destination_slots._value)
+            )
+            return table.data.num_rows
+
+        with mock.patch.object(FakeTable, "num_rows", property(num_rows)):
+            report = self.db_sync.sync_tables(
+                [(self.source_table, self.destination_table), ("other_source", "other")],
+                max_source_connections=1,
+                max_destination_connections=1,
+            )
+
+        self.assertEqual(report["status"], ["success", "success"])
+        # The syncs are ordered by the estimates, so the rows are only counted to verify
+        # each sync, while holding a slot for each database
+        self.assertEqual(counts, [(0, 0)] * 4)
+
+    def test_sync_tables_failure(self):
+        self.source_db.copy(self.table2, "other_source")
+        self.destination_db.setup_table("failing_destination", Table(), failures=1)
+
+        tables = [
+            (self.source_table, self.destination_table),
+            ("other_source", "failing_destination"),
+        ]
+        report = self.db_sync.sync_tables(tables, raise_on_error=False)
+        self.assertEqual(report["status"], ["success", "failed"])
+        self.assertEqual(report["error"], [None, "Canned error"])
+        self.assert_matching_tables()
+
+        self.destination_db.setup_table("failing_destination", Table(), failures=1)
+        self.assertRaises(RuntimeError, self.db_sync.sync_tables, tables)
+
 
 # These tests interact directly with the Postgres database. In order to run, set the
 # env to LIVE_TEST='TRUE'.
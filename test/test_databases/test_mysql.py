@@ -1,5 +1,8 @@
+import csv
+import datetime
 import os
 import unittest
+from unittest import mock
 
 from parsons import MySQL, Table
 from parsons.databases.mysql.create_table import MySQLCreateTable
@@ -39,6 +42,32 @@ class TestMySQLLive(unittest.TestCase):
 
         assert_matching_tables(Table([{"name": "me", "user_name": "myuser"}]), r)
 
+    def test_query_stream(self):
+        sql = "CREATE TABLE test (name VARCHAR(255), user_name VARCHAR(255));"
+        self.mysql.query(sql)
+
+        sql = "INSERT INTO test (name, user_name) VALUES ('me', 'myuser'), ('you', 'youruser');"
+        self.mysql.query(sql)
+
+        batches = list(self.mysql.query_stream("select * from test order by name", batch_size=1))
+        self.assertEqual([tbl.num_rows for tbl in batches], [1, 1])
+        self.assertEqual([tbl.first for tbl in batches], ["me", "you"])
+
+    def test_copy(self):
+        tbl = Table(
+            [
+                ["id", "name", "note"],
+                [1, "O'Brady", None],
+                [2, 'say "hi"', "back\\slash"],
+                [3, "new\nline", ""],
+            ]
+        )
+
+        for method in ["load_data", "executemany"]:
+            self.mysql.copy(tbl, "test", if_exists="drop", method=method)
+            r = self.mysql.query("select * from test order by id")
+            assert_matching_tables(tbl, r)
+
 
 # These tests interact directly with the MySQL database. To run, set env variable "LIVE_TEST=True"
 @unittest.skipIf(not os.environ.get("LIVE_TEST"), "Skipping because not running live test")
@@ -130,6 +159,28 @@ class TestMySQL(unittest.TestCase):  # noqa: F811
             ]
         )
 
+    def test_query_stream(self):
+        rows = [(i, f"name_{i}") for i in range(5)]
+
+        cursor = mock.MagicMock()
+        cursor.column_names = ("id", "name")
+        cursor.fetchmany.side_effect = lambda size: [rows.pop(0) for _ in rows[:size]]
+        conn = mock.MagicMock()
+        conn.cursor.return_value = cursor
+
+        with mock.patch.object(self.mysql, "connection") as connection:
+            connection.return_value.__enter__.return_value = conn
+            tbls = list(self.mysql.query_stream("select * from t", batch_size=2))
+
+        self.assertEqual([tbl.num_rows for tbl in tbls], [2, 2, 1])
+        self.assertEqual(tbls[0].columns, ["id", "name"])
+        self.assertEqual([row["id"] for tbl in tbls for row in tbl], list(range(5)))
+
+        # An unbuffered cursor is used, and closed at the end
+        conn.cursor.assert_called_once_with(buffered=False)
+        conn.consume_results.assert_called_once()
+        cursor.close.assert_called_once()
+
     def test_data_type(self):
         # Test bool
         self.assertEqual(self.mysql.data_type(False, ""), "bool")
@@ -166,3 +217,56 @@ class TestMySQL(unittest.TestCase):  # noqa: F811
     def test_create_statement(self):
         stmt = "CREATE TABLE test_table ( \n id smallint \n,name varchar(10) \n,score float \n);"
         self.assertEqual(self.mysql.create_statement(self.tbl, "test_table"), stmt)
+
+    def test_copy_invalid_method(self):
+        self.assertRaises(ValueError, self.mysql.copy, self.tbl, "test", method="bulk")
+
+    def test_load_data(self):
+        tbl = Table(
+            [
+                ["id", "name", "note"],
+                [1, "O'Brady", None],
+                [2, 'say "hi"', "back\\slash"],
+                [True, "\\N", datetime.date(2024, 1, 2)],
+            ]
+        )
+        cursor = mock.MagicMock(rowcount=3)
+        connection = mock.MagicMock()
+        connection.cursor.return_value = cursor
+
+        # Keep the load file around to check its contents
+        with mock.patch("parsons.databases.mysql.mysql.files.close_temp_file"):
+            self.assertEqual(self.mysql._load_data(tbl, "test", connection), 3)
+
+        sql = cursor.execute.call_args[0][0]
+        self.assertIn("LOAD DATA LOCAL INFILE", sql)
+        self.assertIn("INTO TABLE test", sql)
+        self.assertIn("(id,name,note);", sql)
+
+        local_path = sql.split("'")[1]
+        with open(local_path, newline="") as f:
+            rows = list(csv.reader(f))
+
+        self.assertEqual(
+            rows,
+            [
+                ["1", "O'Brady", "\\N"],
+                ["2", 'say "hi"', "back\\\\slash"],
+                ["1", "\\\\N", "2024-01-02"],
+            ],
+        )
+
+    def test_insert_rows(self):
+        tbl = Table([["id", "name"], [1, "O'Brady"], [2, None], [3]])
+        cursor = mock.MagicMock()
+        connection = mock.MagicMock()
+        connection.cursor.return_value = cursor
+
+        self.assertEqual(self.mysql._insert_rows(tbl, "test", connection, chunk_size=2), 3)
+
+        sql = cursor.executemany.call_args_list[0][0][0]
+        self.assertIn("(id,name)", sql)
+        self.assertIn("VALUES (%s, %s)", sql)
+
+        batches = [c[0][1] for c in cursor.executemany.call_args_list]
+        self.assertEqual(batches, [[(1, "O'Brady"), (2, None)], [(3, None)]])
@@ -0,0 +1,238 @@
+import threading
+import unittest
+from unittest import mock
+
+import psycopg2
+
+from parsons import Postgres
+from parsons.databases.pool import ConnectionPool
+
+
+class FakeConnection:
+    def __init__(self, healthy=True):
+        self.healthy = healthy
+        self.closed = False
+        self.commits = 0
+        self.rollbacks = 0
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = True
+
+
+class TestConnectionPool(unittest.TestCase):
+    def setUp(self):
+        self.opened = []
+        self.pool = ConnectionPool(self.connect, size=2)
+
+    def connect(self):
+        conn = FakeConnection()
+        self.opened.append(conn)
+        return conn
+
+    def test_reuses_released_connection(self):
+        conn = self.pool.acquire()
+        self.pool.release(conn)
+
+        self.assertIs(self.pool.acquire(), conn)
+        self.assertEqual(len(self.opened), 1)
+        self.assertFalse(conn.closed)
+
+    def test_opens_new_connection_when_none_idle(self):
+        first = self.pool.acquire()
+        second = self.pool.acquire()
+
+        self.assertIsNot(first, second)
+        self.assertEqual(len(self.opened), 2)
+
+    def test_closes_connections_beyond_size(self):
+        conns = [self.pool.acquire() for _ in range(3)]
+        for conn in conns:
+            self.pool.release(conn)
+
+        self.assertEqual([conn.closed for conn in conns], [False, False, True])
+
+    def test_idle_timeout(self):
+        self.pool.idle_timeout = 60
+        conn = self.pool.acquire()
+
+        with mock.patch("parsons.databases.pool.time.monotonic", return_value=1000):
+            self.pool.release(conn)
+
+        with mock.patch("parsons.databases.pool.time.monotonic", return_value=1061):
+            new_conn = self.pool.acquire()
+
+        self.assertIsNot(new_conn, conn)
+        self.assertTrue(conn.closed)
+
+    def test_health_check(self):
+        self.pool.health_check = lambda conn: conn.healthy
+        self.pool.health_check_interval = 30
+        conn = self.pool.acquire()
+
+        with mock.patch("parsons.databases.pool.time.monotonic", return_value=1000):
+            self.pool.release(conn)
+
+        # Recently used connections are not checked
+        conn.healthy = False
+        with mock.patch("parsons.databases.pool.time.monotonic", return_value=1010):
+            self.assertIs(self.pool.acquire(), conn)
+
+        with mock.patch("parsons.databases.pool.time.monotonic", return_value=1000):
+            self.pool.release(conn)
+
+        with mock.patch("parsons.databases.pool.time.monotonic", return_value=1031):
+            new_conn = self.pool.acquire()
+
+        self.assertIsNot(new_conn, conn)
+        self.assertTrue(conn.closed)
+
+    def test_close(self):
+        in_use = self.pool.acquire()
+        idle = self.pool.acquire()
+        self.pool.release(idle)
+
+        self.pool.close()
+        self.assertTrue(idle.closed)
+        self.assertFalse(in_use.closed)
+
+        self.pool.release(in_use)
+        self.assertTrue(in_use.closed)
+
+    def test_threads(self):
+        def worker():
+            for _ in range(100):
+                self.pool.release(self.pool.acquire())
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertLessEqual(len(self.pool._idle), 2)
+        self.assertEqual(
+            len([conn for conn in self.opened if not conn.closed]), len(self.pool._idle)
+        )
+
+
+class TestPooledConnector(unittest.TestCase):
+    def setUp(self):
+        self.pg = Postgres(username="test", password="test", host="test", db="test", port=123)
+        self.opened = []
+
+        def connect():
+            conn = FakeConnection()
+            self.opened.append(conn)
+            return conn
+
+        patcher = mock.patch.object(self.pg, "_connect", side_effect=connect)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_without_pool(self):
+        with self.pg.connection() as first:
+            pass
+        with self.pg.connection() as second:
+            pass
+
+        self.assertIsNot(first, second)
+        self.assertTrue(first.closed)
+        self.assertEqual(first.commits, 1)
+
+    def test_with_pool(self):
+        self.pg.enable_connection_pool(size=1)
+
+        with self.pg.connection() as first:
+            pass
+        with self.pg.connection() as second:
+            pass
+
+        self.assertIs(first, second)
+        self.assertFalse(first.closed)
+        self.assertEqual(first.commits, 2)
+
+        self.pg.close_connection_pool()
+        self.assertTrue(first.closed)
+
+    def test_error_discards_pooled_connection(self):
+        self.pg.enable_connection_pool()
+
+        with self.assertRaises(psycopg2.Error):
+            with self.pg.connection() as conn:
+                raise psycopg2.Error()
+
+        self.assertEqual(conn.rollbacks, 1)
+        self.assertTrue(conn.closed)
+
+        with self.pg.connection() as new_conn:
+            pass
+
+        self.assertIsNot(new_conn, conn)
+
+    def test_pinned_connection(self):
+        with self.pg.pinned_connection() as pinned:
+            with self.pg.connection() as first:
+                pass
+            with self.pg.connection() as second:
+                pass
+
+            with self.pg.pinned_connection() as nested:
+                pass
+
+            self.assertFalse(pinned.closed)
+
+        self.assertIs(first, pinned)
+        self.assertIs(second, pinned)
+        self.assertIs(nested, pinned)
+        self.assertEqual(len(self.opened), 1)
+        self.assertEqual(pinned.commits, 3)
+        self.assertTrue(pinned.closed)
+
+    def test_pinned_connection_is_per_thread(self):
+        conns = []
+
+        def worker():
+            with self.pg.connection() as conn:
+                conns.append(conn)
+
+        with self.pg.pinned_connection() as pinned:
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+
+        self.assertIsNot(conns[0], pinned)
+
+    def test_pinned_connection_error(self):
+        self.pg.enable_connection_pool()
+
+        with self.assertRaises(psycopg2.Error):
+            with self.pg.pinned_connection() as pinned:
+                with self.pg.connection():
+                    raise psycopg2.Error()
+
+        self.assertEqual(pinned.rollbacks, 1)
+        self.assertTrue(pinned.closed)
+
+        with self.pg.connection() as conn:
+            pass
+
+        self.assertIsNot(conn, pinned)
+
+    def test_autocommit_is_reset(self):
+        self.pg.enable_connection_pool()
+
+        with self.pg.connection() as conn:
+            conn.autocommit = True
+
+        self.assertFalse(conn.autocommit)
+
+        with self.pg.connection() as new_conn:
+            pass
+
+        self.assertIs(new_conn, conn)
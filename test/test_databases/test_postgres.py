@@ -1,5 +1,7 @@
 import os
 import unittest
+from contextlib import contextmanager
+from unittest import mock
 
 from parsons import Postgres, Table
 from test.utils import assert_matching_tables
@@ -149,6 +151,57 @@ class TestPostgresCreateStatement(unittest.TestCase):
 # These tests interact directly with the Postgres database
 
 
+def mock_stream_cursor(rows, columns):
+    # A cursor that returns ``rows`` from fetchmany, like a server-side cursor
+    cursor = mock.MagicMock()
+    cursor.description = [(column,) for column in columns]
+    remaining = list(rows)
+
+    def fetchmany(size):
+        batch = remaining[:size]
+        del remaining[:size]
+        return batch
+
+    cursor.fetchmany.side_effect = fetchmany
+    return cursor
+
+
+class TestPostgresQueryStream(unittest.TestCase):
+    def setUp(self):
+        self.pg = Postgres(username="test", password="test", host="test", db="test", port=123)
+
+        rows = [(i, f"name_{i}") for i in range(5)]
+        self.cursor = mock_stream_cursor(rows, ["id", "name"])
+        self.conn = mock.MagicMock()
+        self.conn.cursor.return_value = self.cursor
+
+        @contextmanager
+        def connection():
+            yield self.conn
+
+        self.pg.connection = connection
+
+    def test_query_stream(self):
+        tbls = list(self.pg.query_stream("select * from t", batch_size=2))
+
+        self.assertEqual([tbl.num_rows for tbl in tbls], [2, 2, 1])
+        self.assertEqual(tbls[0].columns, ["id", "name"])
+        self.assertEqual([row["id"] for tbl in tbls for row in tbl], list(range(5)))
+
+        # A named (server-side) cursor is used, and closed at the end
+        self.assertTrue(self.conn.cursor.call_args.kwargs["name"])
+        self.cursor.execute.assert_called_once_with("select * from t", None)
+        self.cursor.close.assert_called_once()
+
+    def test_query_stream_stopped_early(self):
+        stream = self.pg.query_stream("select * from t", batch_size=2)
+        self.assertEqual(next(stream).num_rows, 2)
+        stream.close()
+
+        self.assertEqual(self.cursor.fetchmany.call_count, 1)
+        self.cursor.close.assert_called_once()
+
+
 @unittest.skipIf(not os.environ.get("LIVE_TEST"), "Skipping because not running live test")
 class TestPostgresDB(unittest.TestCase):
     def setUp(self):
@@ -198,6 +251,15 @@ class TestPostgresDB(unittest.TestCase):
         r = self.pg.query(sql, parameters=names)
         self.assertEqual(r.num_rows, 2)
 
+    def test_query_stream(self):
+        table_name = f"{self.temp_schema}.test"
+        self.pg.copy(self.tbl, table_name, if_exists="append")
+
+        sql = f"select * from {table_name} where name <> %s order by id"
+        batches = list(self.pg.query_stream(sql, parameters=["Jim"], batch_size=1))
+        self.assertEqual([tbl.num_rows for tbl in batches], [1, 1])
+        self.assertEqual([tbl[0]["name"] for tbl in batches], ["John", "Sarah"])
+
     def test_copy(self):
         # Copy a table and ensure table exists
         self.pg.copy(self.tbl, f"{self.temp_schema}.test_copy", if_exists="drop")
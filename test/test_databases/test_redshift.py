@@ -1,7 +1,10 @@
+import gzip
 import os
 import re
 import unittest
+from unittest import mock
 
+import psycopg2
 from testfixtures import LogCapture
 
 from parsons import S3, Redshift, Table
@@ -362,6 +365,268 @@ class TestRedshift(unittest.TestCase):
         # Check that all of the expected options are there:
         [self.assertNotEqual(sql.find(o), -1) for o in expected_options]
 
+    def test_copy_statement_parquet(self):
+        sql = self.rs.copy_statement(
+            "test_schema.test",
+            "buck",
+            "folder/manifest",
+            manifest=True,
+            data_type="parquet",
+            aws_access_key_id="abc123",
+            aws_secret_access_key="abc123",
+        )
+
+        self.assertIn("from 's3://buck/folder/manifest'", sql)
+        self.assertIn("manifest", sql)
+        self.assertTrue(sql.endswith("format as parquet \n;"))
+
+        # The CSV options don't apply to Parquet
+        for option in ["ignoreheader", "maxerror", "csv", "gzip", "dateformat"]:
+            self.assertNotIn(option, sql)
+
+    def test_parquet_schema(self):
+        import pyarrow as pa
+
+        target = Table(
+            [
+                ["column_name", "data_type", "numeric_precision", "numeric_scale"],
+                ["id", "integer", 32, 0],
+                ["amount", "numeric", 12, 2],
+                ["name", "character varying", None, None],
+                ["created", "timestamp without time zone", None, None],
+            ]
+        )
+
+        with mock.patch.object(self.rs, "query_with_connection", return_value=target) as query:
+            schema = self.rs.parquet_schema("s.t", ["ID", "Amount", "Name", "Created"], None)
+            self.assertIn("table_schema = 's' and table_name = 't'", query.call_args[0][0])
+
+            self.assertEqual(schema.names, ["ID", "Amount", "Name", "Created"])
+            self.assertEqual(
+                schema.types,
+                [pa.int32(), pa.decimal128(12, 2), pa.string(), pa.timestamp("us")],
+            )
+
+            # Match columns by name when only some of the columns are copied
+            schema = self.rs.parquet_schema("s.t", ["Name", "ID", "other"], None, match_names=True)
+            self.assertEqual(schema.types, [pa.string(), pa.int32(), pa.string()])
+
+    def test_upsert_merge(self):
+        self.rs._connect = mock.MagicMock()
+        self.rs.table_exists = mock.MagicMock(return_value=True)
+        self.rs.alter_varchar_column_widths = mock.MagicMock()
+        self.rs.query = mock.MagicMock(
+            side_effect=lambda sql, parameters: (
+                Table([["table_id", "sortkey1", "sortkey_num"], [1, "id", 1]])
+                if "svv_table_info" in sql
+                else None
+            )
+        )
+        self.rs.query_with_connection = query = mock.MagicMock()
+
+        def copy(*args, **kwargs):
+            # The copy must use the connection that created the temp table
+            with self.rs.connection() as connection:
+                self.assertIs(connection, query.call_args.args[1])
+
+        self.rs.copy = mock.MagicMock(side_effect=copy)
+
+        self.rs.upsert(
+            self.tbl,
+            "s.t",
+            "ID",
+            distinct_check=False,
+            method="merge",
+            temp_staging_table=True,
+            vacuum="auto",
+        )
+
+        statements = [c.args[0] for c in query.call_args_list]
+        staging_tbl = self.rs.copy.call_args.args[1]
+
+        self.assertTrue(staging_tbl.startswith("t_stg_"))
+        self.assertEqual(self.rs.copy.call_args.kwargs["if_exists"], "append")
+        self.assertEqual(statements[0], f"CREATE TEMP TABLE {staging_tbl} (LIKE s.t);")
+        self.assertIn("MERGE INTO s.t", statements[1])
+        self.assertIn(f"ON {staging_tbl}.ID = t.ID", statements[1])
+        self.assertIn(f"DROP TABLE IF EXISTS {staging_tbl};", statements[2])
+        self.assertEqual(statements[3], "VACUUM RECLUSTER s.t;")
+
+    @mock.patch("parsons.databases.redshift.redshift.S3")
+    def test_unload_to_table(self, mock_s3):
+        self.rs.s3_temp_bucket = "bucket"
+        self.rs.iam_role = "role"
+        self.rs.query = mock.MagicMock()
+
+        parts = {
+            "part_0001_part_00.parquet": [[2, "John"]],
+            "part_0000_part_00.parquet": [[1, "Jim"]],
+        }
+        paths = {key: Table([["id", "name"], *rows]).to_parquet() for key, rows in parts.items()}
+
+        def list_keys(bucket, prefix):
+            return {f"{prefix}{key}": {} for key in parts}
+
+        mock_s3.return_value.list_keys.side_effect = list_keys
+        mock_s3.return_value.get_files.side_effect = lambda bucket, keys: {
+            key: paths[key.split("/")[-1]] for key in keys
+        }
+
+        tbl = self.rs.unload_to_table("select * from t where name = 'Jim'")
+
+        statement = self.rs.query.call_args.args[0]
+        self.assertIn("UNLOAD ('select * from t where name = ''Jim''')", statement)
+        self.assertIn("FORMAT AS PARQUET", statement)
+
+        # The parts are read in order, and the temp folder is removed
+        assert_matching_tables(tbl, Table([["id", "name"], [1, "Jim"], [2, "John"]]))
+        removed = mock_s3.return_value.remove_files.call_args.args[1]
+        self.assertEqual(len(removed), 2)
+
+        # No rows
+        parts = {}
+        self.assertIsNone(self.rs.unload_to_table("select * from t"))
+
+    def test_upsert_error_cleanup(self):
+        self.rs._connect = mock.MagicMock()
+        self.rs.table_exists = mock.MagicMock(return_value=True)
+        self.rs.alter_varchar_column_widths = mock.MagicMock()
+        self.rs.copy = mock.MagicMock()
+
+        def query_with_connection(sql, connection, commit=True):
+            if "DELETE FROM" in sql:
+                raise psycopg2.errors.InternalError("delete failed")
+            if "DROP TABLE" in sql:
+                raise psycopg2.errors.InFailedSqlTransaction("transaction aborted")
+
+        self.rs.query_with_connection = mock.MagicMock(side_effect=query_with_connection)
+
+        # The original error is raised, rather than the failed drop's
+        with self.assertRaisesRegex(psycopg2.Error, "delete failed"):
+            self.rs.upsert(self.tbl, "t", "ID", distinct_check=False, vacuum=False)
+
+        # The transaction is rolled back before the drop, and no connection is pinned
+        # without a temp staging table
+        self.rs._connect.return_value.rollback.assert_called()
+        self.assertIsNone(getattr(self.rs._pinned, "connection", None))
+
+    def test_incremental_vacuum_type(self):
+        def vacuum_type(sortkey1, sortkey_num, interleaved=False):
+            def query(sql, parameters):
+                if "svv_table_info" in sql:
+                    self.assertEqual(parameters, ["public", "t"])
+                    return Table(
+                        [["table_id", "sortkey1", "sortkey_num"], [1, sortkey1, sortkey_num]]
+                    )
+                return Table([["?column?"], [1]]) if interleaved else None
+
+            with mock.patch.object(self.rs, "query", side_effect=query):
+                return self.rs._incremental_vacuum_type("t")
+
+        self.assertEqual(vacuum_type("id", 1), "RECLUSTER")
+        self.assertEqual(vacuum_type("id", 2, interleaved=True), "SORT ONLY")
+        self.assertEqual(vacuum_type("INTERLEAVED", 2), "SORT ONLY")
+        self.assertEqual(vacuum_type("AUTO(SORTKEY)", 0), "DELETE ONLY")
+        self.assertEqual(vacuum_type(None, 0), "DELETE ONLY")
+
+    def test_estimated_num_rows(self):
+        with mock.patch.object(self.rs, "query", return_value=Table([["tbl_rows"], [42]])):
+            self.assertEqual(self.rs.table("public.t").estimated_num_rows, 42)
+
+        # Tables that aren't listed have no estimate
+        with mock.patch.object(self.rs, "query", return_value=None):
+            self.assertIsNone(self.rs.table("public.t").estimated_num_rows)
+
+    def test_upsert_invalid_args(self):
+        self.assertRaises(ValueError, self.rs.upsert, self.tbl, "s.t", "ID", method="replace")
+        self.assertRaises(ValueError, self.rs.upsert, self.tbl, "s.t", "ID", vacuum="quick")
+
+    def test_query_stream(self):
+        rows = [(i, f"name_{i}") for i in range(5)]
+
+        cursor = mock.MagicMock()
+        cursor.description = [("id",), ("name",)]
+        cursor.fetchmany.side_effect = lambda size: [rows.pop(0) for _ in rows[:size]]
+        conn = mock.MagicMock()
+        conn.cursor.return_value = cursor
+
+        with mock.patch.object(self.rs, "connection") as connection:
+            connection.return_value.__enter__.return_value = conn
+            tbls = list(self.rs.query_stream("select * from t", batch_size=2))
+
+        self.assertEqual([tbl.num_rows for tbl in tbls], [2, 2, 1])
+        self.assertEqual([row["id"] for tbl in tbls for row in tbl], list(range(5)))
+
+        # A named (server-side) cursor is used, and closed at the end
+        self.assertTrue(conn.cursor.call_args.kwargs["name"])
+        cursor.close.assert_called_once()
+
+    def test_copy_invalid_slices(self):
+        self.assertRaises(ValueError, self.rs.copy, self.tbl, "s.t", slices="many")
+
+    def test_copy_sliced_empty_table(self):
+        self.rs._connect = mock.MagicMock()
+        self.rs._create_table_precheck = mock.MagicMock(return_value=False)
+        self.rs.temp_s3_copy = mock.MagicMock(return_value="key")
+        self.rs.temp_s3_delete = mock.MagicMock()
+        self.rs.query_with_connection = mock.MagicMock()
+        self.rs.s3_temp_bucket = "bucket"
+
+        self.rs.copy(
+            Table([["ID", "Name"]]),
+            "s.t",
+            slices=4,
+            aws_access_key_id="key",
+            aws_secret_access_key="secret",
+        )
+
+        # Staged as a single file, without a manifest
+        self.assertIsNone(self.rs.temp_s3_copy.call_args.kwargs["slices"])
+        sql = self.rs.query_with_connection.call_args.args[0]
+        self.assertIn("copy s.t", sql)
+        self.assertNotIn("manifest", sql)
+
+    @mock.patch("parsons.databases.redshift.rs_copy_table.S3")
+    def test_temp_s3_copy_sliced(self, mock_s3):
+        self.rs.s3_temp_bucket = "bucket"
+        self.rs.s3_temp_bucket_prefix = None
+
+        uploads = {}
+
+        def put_file(bucket, key, local_path):
+            with gzip.open(local_path, "rt") as f:
+                uploads[key] = f.read().splitlines()
+
+        mock_s3.return_value.put_file.side_effect = put_file
+
+        tbl = Table([["ID"]] + [[i] for i in range(10)])
+
+        with mock.patch.object(self.rs, "generate_manifest") as generate_manifest:
+            generate_manifest.return_value = {"entries": []}
+            key = self.rs.temp_s3_copy(tbl, slices=4)
+
+        folder = key.rsplit("/", 1)[0]
+        self.assertEqual(key, f"{folder}/manifest")
+
+        # Every part has a header and an even share of the rows
+        self.assertEqual(sorted(uploads), [f"{folder}/part_{i:04d}.csv.gz" for i in range(4)])
+        self.assertEqual([len(part) for _, part in sorted(uploads.items())], [4, 4, 4, 2])
+        self.assertTrue(all(part[0] == "ID" for part in uploads.values()))
+        self.assertEqual(
+            sorted(int(row) for part in uploads.values() for row in part[1:]), list(range(10))
+        )
+
+        self.assertEqual(generate_manifest.call_args.kwargs["prefix"], f"{folder}/part_")
+        self.assertEqual(generate_manifest.call_args.kwargs["manifest_key"], key)
+
+        # Deleting the manifest removes every file of the copy
+        mock_s3.return_value.list_keys.return_value = {k: {} for k in [*uploads, key]}
+        self.rs.temp_s3_delete(key)
+
+        removed = mock_s3.return_value.remove_files.call_args.args[1]
+        self.assertEqual(sorted(removed), sorted([*uploads, key]))
+        mock_s3.return_value.list_keys.assert_called_once_with("bucket", prefix=f"{folder}/")
+
 
 # These tests interact directly with the Redshift database
 
@@ -427,6 +692,15 @@ class TestRedshiftDB(unittest.TestCase):
         r = self.rs.query(sql, parameters=names)
         self.assertEqual(r.num_rows, 2)
 
+    def test_query_stream(self):
+        table_name = f"{self.temp_schema}.test"
+        self.tbl.to_redshift(table_name, if_exists="append")
+
+        sql = f"select * from {table_name} where name <> %s order by id"
+        batches = list(self.rs.query_stream(sql, parameters=["Jim"], batch_size=1))
+        self.assertEqual([tbl.num_rows for tbl in batches], [1, 1])
+        self.assertEqual([tbl[0]["name"] for tbl in batches], ["John", "Sarah"])
+
     def test_schema_exists(self):
         self.assertTrue(self.rs.schema_exists(self.temp_schema))
         self.assertFalse(self.rs.schema_exists("nonsense"))
@@ -491,6 +765,32 @@ class TestRedshiftDB(unittest.TestCase):
             self.assertTrue("DIST" in desired_log.msg)
             self.assertFalse("SORT" in desired_log.msg)
 
+    def test_copy_sliced(self):
+        self.rs.copy(self.tbl, f"{self.temp_schema}.test_copy", if_exists="drop", slices=2)
+        rows = self.rs.query(f"select count(*) from {self.temp_schema}.test_copy")
+        self.assertEqual(rows[0]["count"], 3)
+
+        self.rs.copy(self.tbl, f"{self.temp_schema}.test_copy", if_exists="append", slices="auto")
+        rows = self.rs.query(f"select count(*) from {self.temp_schema}.test_copy")
+        self.assertEqual(rows[0]["count"], 6)
+
+    def test_upsert_merge(self):
+        self.rs.copy(self.tbl, f"{self.temp_schema}.test_copy", sortkey="id")
+
+        upsert_tbl = Table([["id", "name"], [1, "Jane"], [5, "Bob"]])
+        self.rs.upsert(
+            upsert_tbl,
+            f"{self.temp_schema}.test_copy",
+            "ID",
+            method="merge",
+            temp_staging_table=True,
+            vacuum="auto",
+        )
+
+        expected_tbl = Table([["id", "name"], [1, "Jane"], [2, "John"], [3, "Sarah"], [5, "Bob"]])
+        updated_tbl = self.rs.query(f"select * from {self.temp_schema}.test_copy order by id;")
+        assert_matching_tables(expected_tbl, updated_tbl)
+
     def test_upsert(self):
         # Create a target table when no target table exists
         self.rs.upsert(self.tbl, f"{self.temp_schema}.test_copy", "ID")
@@ -578,6 +878,16 @@ class TestRedshiftDB(unittest.TestCase):
         # Check that files are there
         self.assertTrue(self.s3.key_exists(self.temp_s3_bucket, "unload_test"))
 
+    def test_unload_to_table(self):
+        self.rs.copy(self.tbl, f"{self.temp_schema}.test_copy", if_exists="drop")
+
+        tbl = self.rs.unload_to_table(f"select * from {self.temp_schema}.test_copy")
+        assert_matching_tables(self.tbl, tbl.sort("id"), ignore_headers=True)
+
+        # Nothing is left in the temp bucket
+        keys = self.s3.list_keys(self.temp_s3_bucket, prefix="Parsons_RedshiftCopyTable/")
+        self.assertEqual(keys, {})
+
     def test_unload_json_format(self):
         # Setup
         self.rs.copy(self.tbl, f"{self.temp_schema}.test_copy", if_exists="drop")
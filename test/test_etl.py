@@ -1,13 +1,18 @@
+import datetime
 import os
 import shutil
 import tempfile
 import unittest
+from decimal import Decimal
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
 import petl
+import pytest
 
 from parsons import Table
+from parsons.etl.arrow import ArrowView, ParquetView, petl_to_arrow
+from parsons.etl.spill import SpillView, SpillWriter, spill
 from parsons.utilities import zip_archive
 from test.utils import assert_matching_tables
 
@@ -88,6 +93,37 @@ class TestParsonsTable(unittest.TestCase):
 
         assert_matching_tables(self.tbl, tbl_materialized)
 
+    def test_num_rows_cached(self):
+        tbl = Table(self.lst)
+        self.assertEqual(tbl.num_rows, 5)
+
+        # Transformations that can't change the row count keep the cached count
+        tbl.add_column("d", 1)
+        tbl.rename_column("a", "z")
+        tbl.convert_column("b", str)
+        tbl.move_column("d", 0)
+        tbl.remove_column("c")
+        self.assertEqual(tbl._num_rows, 5)
+
+        # Transformations that might change the row count clear it
+        tbl.remove_null_rows("z", 1)
+        self.assertIsNone(tbl._num_rows)
+        self.assertEqual(tbl.num_rows, 4)
+        self.assertEqual(len(tbl), 4)
+
+        # Reassigning the table directly also clears it
+        tbl.table = petl.head(tbl.table, 1)
+        self.assertEqual(tbl.num_rows, 1)
+
+    def test_num_rows_materialized(self):
+        tbl = Table(self.lst)
+        tbl.materialize()
+        self.assertEqual(tbl._num_rows, 5)
+
+        tbl = Table(self.lst)
+        tbl.materialize_to_file()
+        self.assertEqual(tbl._num_rows, 5)
+
     def test_empty_column(self):
         # Test that returns True on an empty column and False on a populated one.
 
@@ -638,6 +674,31 @@ class TestParsonsTable(unittest.TestCase):
         # Assert last table is 99
         self.assertEqual(99, chunks[4].num_rows)
 
+    def test_chunk_to_file(self):
+        test_table = Table(petl.randomtable(3, 250, seed=42))
+        chunks = test_table.chunk(100, to_file=True)
+
+        self.assertEqual([100, 100, 50], [c.num_rows for c in chunks])
+        assert_matching_tables(test_table, Table(petl.cat(*[c.table for c in chunks])))
+
+    def test_iter_chunks_reads_source_once(self):
+        class CountingView(petl.Table):
+            iterations = 0
+
+            def __iter__(self):
+                CountingView.iterations += 1
+                yield ("a", "b")
+                yield from ((i, i * 2) for i in range(10))
+
+        chunks = Table(CountingView()).iter_chunks(3)
+        CountingView.iterations = 0
+
+        self.assertEqual([3, 3, 3, 1], [c.num_rows for c in chunks])
+        self.assertEqual(CountingView.iterations, 1)
+
+    def test_iter_chunks_empty(self):
+        self.assertEqual(list(Table([["a", "b"]]).iter_chunks(10)), [])
+
     def test_match_columns(self):
         raw = [
             {"first name": "Mary", "LASTNAME": "Nichols", "Middle__Name": "D"},
@@ -977,3 +1038,183 @@ class TestParsonsTable(unittest.TestCase):
         tbl_expected = Table([["a", "b"], [7, 8], [9, 10]])
         tbl.tail(2)
         assert_matching_tables(tbl_expected, tbl)
+
+
+class TestArrowTable(unittest.TestCase):
+    def setUp(self):
+        pytest.importorskip("pyarrow")
+
+        self.lst = [
+            ["a", "b", "c"],
+            [2, "x", 1.5],
+            [1, "y", None],
+            [2, "x", 3.5],
+            [None, "z", 0.5],
+        ]
+        self.tbl = Table(self.lst)
+        self.arrow_tbl = Table(self.lst)
+        self.arrow_tbl.materialize(format="arrow")
+
+    def test_materialize(self):
+        self.assertIsInstance(self.arrow_tbl.table, ArrowView)
+        self.assertEqual(self.arrow_tbl._num_rows, 4)
+        assert_matching_tables(self.tbl, self.arrow_tbl)
+
+    def test_materialize_invalid_format(self):
+        self.assertRaises(ValueError, self.tbl.materialize, format="parquet")
+
+    def test_to_from_arrow(self):
+        arrow_table = self.tbl.to_arrow()
+        self.assertEqual(arrow_table.column_names, ["a", "b", "c"])
+        self.assertEqual(arrow_table.num_rows, 4)
+
+        assert_matching_tables(self.tbl, Table.from_arrow(arrow_table))
+
+    def test_to_parquet(self):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        path = self.tbl.to_parquet()
+        assert_matching_tables(self.tbl, Table.from_arrow(pq.read_table(path)))
+
+        # Columns with no values are written as strings
+        path = Table([["a", "b"], [1, None]]).to_parquet()
+        self.assertEqual(pq.read_schema(path).field("b").type, pa.string())
+
+    def test_to_parquet_mixed_types(self):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        # Mixed types in a row group are written as strings
+        path = Table([{"a": 1}, {"a": ""}]).to_parquet()
+        self.assertEqual(pq.read_table(path).to_pylist(), [{"a": "1"}, {"a": ""}])
+
+        # A later row group that doesn't fit the first one's types
+        tbl = Table([["a", "b"], [1, 1.5], [2, 2], ["x", 3]])
+        path = tbl.to_parquet(row_group_size=2)
+        self.assertEqual(pq.read_schema(path), pa.schema([("a", pa.string()), ("b", pa.float64())]))
+        self.assertEqual(pq.ParquetFile(path).num_row_groups, 2)
+        self.assertEqual(pq.read_table(path)["a"].to_pylist(), ["1", "2", "x"])
+
+    def test_parquet_view(self):
+        paths = [self.tbl.to_parquet(row_group_size=1), Table(self.lst[:2]).to_parquet()]
+
+        tbl = Table(ParquetView(paths, batch_size=2))
+        self.assertEqual(tbl._num_rows, 5)
+        assert_matching_tables(Table(self.lst + self.lst[1:2]), tbl)
+
+    def test_to_parquet_schema(self):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        schema = pa.schema([("a", pa.int16()), ("b", pa.string()), ("c", pa.float32())])
+
+        # Mixed and string values are cast, and empty strings become null
+        tbl = Table([["a", "b", "c"], ["1", "x", ""], [2, None, "2.5"], [3]])
+        for source in [tbl, Table.from_arrow(pa.table({"a": ["1", "2", "3"]}))]:
+            path = source.to_parquet(schema=schema, row_group_size=2)
+            self.assertEqual(pq.read_schema(path), schema)
+            self.assertEqual(pq.ParquetFile(path).num_row_groups, 2)
+
+        result = pq.read_table(tbl.to_parquet(schema=schema)).to_pylist()
+        self.assertEqual(
+            result,
+            [
+                {"a": 1, "b": "x", "c": None},
+                {"a": 2, "b": None, "c": 2.5},
+                {"a": 3, "b": None, "c": None},
+            ],
+        )
+
+    def test_to_arrow_batches(self):
+        # A column that is null in the first batch is promoted to the type of later batches
+        tbl = Table([["a", "b"], [None, 1], [None, 2], ["x", 3]])
+        arrow_table = petl_to_arrow(tbl.table, batch_size=2)
+        self.assertEqual(arrow_table.column("a").to_pylist(), [None, None, "x"])
+
+    def test_cut(self):
+        assert_matching_tables(self.tbl.cut("c", "a"), self.arrow_tbl.cut("c", "a"))
+
+    def test_select_rows(self):
+        import pyarrow.compute as pc
+
+        selected = self.arrow_tbl.select_rows(pc.field("a") == 2, pc.field("c") > 2)
+        self.assertIsInstance(selected.table, ArrowView)
+        assert_matching_tables(Table([["a", "b", "c"], [2, "x", 3.5]]), selected)
+
+        # Row functions still work
+        assert_matching_tables(
+            self.tbl.select_rows(lambda row: row.a == 1),
+            self.arrow_tbl.select_rows(lambda row: row.a == 1),
+        )
+
+    def test_sort(self):
+        for columns, reverse in [(None, False), ("a", False), (["b", "c"], True)]:
+            expected = Table(self.lst).sort(columns, reverse=reverse)
+            tbl = Table.from_arrow(self.tbl.to_arrow()).sort(columns, reverse=reverse)
+            self.assertIsInstance(tbl.table, ArrowView)
+            assert_matching_tables(expected, tbl)
+
+    def test_deduplicate(self):
+        for keys in [None, "a", ["a", "b"], "b"]:
+            expected = Table(self.lst).deduplicate(keys)
+            tbl = Table.from_arrow(self.tbl.to_arrow()).deduplicate(keys)
+            self.assertIsInstance(tbl.table, ArrowView)
+            assert_matching_tables(expected, tbl)
+
+    def test_iter_chunks(self):
+        chunks = list(self.arrow_tbl.iter_chunks(3))
+        self.assertEqual([3, 1], [c.num_rows for c in chunks])
+        self.assertIsInstance(chunks[0].table, ArrowView)
+        assert_matching_tables(self.tbl, Table(petl.cat(*[c.table for c in chunks])))
+
+    def test_fill_column(self):
+        self.arrow_tbl.fill_column("b", "filled")
+        self.assertIsInstance(self.arrow_tbl.table, ArrowView)
+        self.assertEqual(self.arrow_tbl["b"], ["filled"] * 4)
+
+    def test_convert_column(self):
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        self.arrow_tbl.convert_column("b", pc.utf8_upper)
+        self.arrow_tbl.convert_column(["a", "c"], pa.string())
+        self.assertIsInstance(self.arrow_tbl.table, ArrowView)
+        self.assertEqual(self.arrow_tbl["b"], ["X", "Y", "X", "Z"])
+        self.assertEqual(self.arrow_tbl["a"], ["2", "1", "2", None])
+
+        # Other converters fall back to petl
+        self.arrow_tbl.convert_column("b", lambda v: v.lower())
+        self.assertEqual(self.arrow_tbl["b"], ["x", "y", "x", "z"])
+
+
+class TestSpill(unittest.TestCase):
+    def test_spill_round_trip(self):
+        rows = [
+            ["id", "name", "joined", "score"],
+            [1, "Bob", datetime.date(2020, 1, 1), Decimal("1.50")],
+            [2, None, datetime.date(2021, 6, 30), Decimal("-2")],
+        ]
+        view = spill(petl.wrap(rows), block_size=1)
+
+        self.assertEqual(view.num_rows, 2)
+        self.assertEqual([list(row) for row in view], rows)
+
+    def test_spill_writer_blocks(self):
+        file_path = os.path.join(tempfile.mkdtemp(), "spill")
+
+        with SpillWriter(file_path, ["a", "b"]) as writer:
+            writer.write_rows([(1, 2), (3, 4)])
+            writer.write_rows([])
+            writer.write_rows([[5, 6]])
+
+        tbl = Table(SpillView(file_path, num_rows=writer.num_rows))
+        self.assertEqual(tbl._num_rows, 3)
+        assert_matching_tables(Table([["a", "b"], [1, 2], [3, 4], [5, 6]]), tbl)
+
+    def test_spill_view_invalid_file(self):
+        file_path = os.path.join(tempfile.mkdtemp(), "not_spill")
+        with open(file_path, "w") as f:
+            f.write("a,b\n1,2\n")
+
+        self.assertRaises(ValueError, list, SpillView(file_path))
@@ -1,6 +1,10 @@
 import os
 import unittest
+import urllib.parse
+from unittest import mock
 
+import google.cloud.exceptions
+import requests
 from google.cloud import storage
 
 from parsons import GoogleCloudStorage, Table
@@ -11,6 +15,81 @@ TEMP_BUCKET_NAME = "parsons_test"
 TEMP_FILE_NAME = "tmp_file_01.txt"
 
 
+def batch_response(status_code):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = b'{"error": {"message": "error"}}'
+    response.request = requests.Request("DELETE", "https://storage.googleapis.com").prepare()
+    return response
+
+
+class TestGoogleCloudStorageDeleteBlobs(unittest.TestCase):
+    def setUp(self):
+        self.cloud = GoogleCloudStorage.__new__(GoogleCloudStorage)
+        self.cloud.client = client = mock.MagicMock()
+        self.batches = []
+        self.single_deletes = []
+        self.batch = None
+
+        def delete(path, **kwargs):
+            # Deferred when sent in a batch, otherwise fails right away like a request
+            name = urllib.parse.unquote(path.split("/o/")[1])
+            if self.batch is not None:
+                self.batch.append(name)
+                return
+
+            self.single_deletes.append(name)
+            status = self.statuses.get(name, 204)
+            if status >= 400:
+                raise google.cloud.exceptions.from_http_response(batch_response(status))
+
+        def batch():
+            # Raises the first error of the deletes sent in the batch, like the GCS client
+            fake = mock.MagicMock()
+
+            def enter():
+                self.batch = []
+
+            def exit(*args):
+                names, self.batch = self.batch, None
+                self.batches.append(len(names))
+                errors = [self.statuses[n] for n in names if self.statuses.get(n, 204) >= 400]
+                if errors:
+                    raise google.cloud.exceptions.from_http_response(batch_response(errors[0]))
+
+            fake.__enter__.side_effect = enter
+            fake.__exit__.side_effect = exit
+            return fake
+
+        client._delete_resource.side_effect = delete
+        client.batch.side_effect = batch
+
+    def test_delete_blobs(self):
+        self.statuses = {}
+        self.cloud.delete_blobs("bucket", [f"blob_{i}" for i in range(250)])
+
+        # Up to 100 deletes per batch
+        self.assertEqual(self.batches, [100, 100, 50])
+        self.assertEqual(self.single_deletes, [])
+
+    def test_delete_blobs_missing(self):
+        self.statuses = {"blob_3": 404}
+        self.cloud.delete_blobs("bucket", [f"blob_{i}" for i in range(250)])
+
+        # Only the batch with the missing blob is sent again, one delete at a time
+        self.assertEqual(self.batches, [100, 100, 50])
+        self.assertEqual(self.single_deletes, [f"blob_{i}" for i in range(100)])
+
+    def test_delete_blobs_errors(self):
+        self.statuses = {"blob_3": 404, "blob_5": 403}
+
+        with self.assertRaises(google.cloud.exceptions.Forbidden):
+            self.cloud.delete_blobs("bucket", [f"blob_{i}" for i in range(250)])
+
+        # No more batches are sent after a failure
+        self.assertEqual(self.batches, [100])
+
+
 @unittest.skipIf(not os.environ.get("LIVE_TEST"), "Skipping because not running live test")
 class TestGoogleStorageBuckets(unittest.TestCase):
     def setUp(self):
@@ -104,3 +183,33 @@ class TestGoogleStorageBuckets(unittest.TestCase):
         url = self.cloud.get_url(TEMP_BUCKET_NAME, file_name)
         download_tbl = Table.from_csv(url)
         assert_matching_tables(input_tbl, download_tbl)
+
+    def test_delete_blobs(self):
+        file_names = [f"delete_me_{i}.txt" for i in range(3)]
+
+        tmp_file_path = files.string_to_temp_file("A little string", suffix=".txt")
+        for file_name in file_names:
+            self.cloud.put_blob(TEMP_BUCKET_NAME, file_name, tmp_file_path)
+
+        # Blobs that don't exist are skipped
+        self.cloud.delete_blobs(TEMP_BUCKET_NAME, file_names + ["FAKE_BLOB"])
+
+        self.assertEqual(self.cloud.list_blobs(TEMP_BUCKET_NAME, prefix="delete_me_"), [])
+
+    def test_copy_blobs(self):
+        copied = self.cloud.copy_blobs(
+            TEMP_BUCKET_NAME, TEMP_BUCKET_NAME, prefix=TEMP_FILE_NAME, destination_prefix="copy_"
+        )
+        self.assertEqual(copied, [TEMP_FILE_NAME])
+
+        path = self.cloud.download_blob(TEMP_BUCKET_NAME, "copy_")
+        with open(path, "r") as f:
+            self.assertEqual(f.read(), "A little string")
+
+        # Blobs that were already copied are skipped
+        copied = self.cloud.copy_blobs(
+            TEMP_BUCKET_NAME, TEMP_BUCKET_NAME, prefix=TEMP_FILE_NAME, destination_prefix="copy_"
+        )
+        self.assertEqual(copied, [])
+
+        self.cloud.delete_blob(TEMP_BUCKET_NAME, "copy_")
@@ -133,6 +133,24 @@ class TestS3(unittest.TestCase):
         result_tbl = Table.from_csv(path)
         assert_matching_tables(self.tbl, result_tbl)
 
+    def test_put_and_get_files(self):
+        tbls = {
+            f"{self.test_incoming_prefix}/batch_{i}.csv": Table([["id"], [i]]) for i in range(5)
+        }
+
+        self.s3.put_files(self.test_bucket, {key: tbl.to_csv() for key, tbl in tbls.items()})
+        paths = self.s3.get_files(self.test_bucket, list(tbls))
+
+        self.assertEqual(list(paths), list(tbls))
+        for key, path in paths.items():
+            assert_matching_tables(tbls[key], Table.from_csv(path))
+
+    def test_remove_files(self):
+        self.s3.remove_files(self.test_bucket, [self.test_key, self.test_key_2])
+
+        self.assertFalse(self.s3.key_exists(self.test_bucket, self.test_key))
+        self.assertFalse(self.s3.key_exists(self.test_bucket, self.test_key_2))
+
     def test_get_url(self):
         # Test that you can download from URL
         url = self.s3.get_url(self.test_bucket, self.test_key)
@@ -180,6 +198,22 @@ class TestS3(unittest.TestCase):
         assert_matching_tables(self.tbl_2, result_tbl_2)
         self.assertFalse(self.s3.key_exists(self.test_bucket, self.test_key_2))
 
+    def test_transfer_bucket_prefix(self):
+        keys = [f"{self.test_incoming_prefix}/batch_{i}.csv" for i in range(5)]
+        self.s3.put_files(self.test_bucket, {key: self.tbl.to_csv() for key in keys})
+
+        self.s3.transfer_bucket(
+            self.test_bucket,
+            f"{self.test_incoming_prefix}/",
+            self.test_bucket,
+            f"{self.test_dest_prefix}/",
+            remove_original=True,
+        )
+
+        moved = self.s3.list_keys(self.test_bucket, prefix=f"{self.test_dest_prefix}/")
+        self.assertEqual(len(moved), 5)
+        self.assertFalse(self.s3.key_exists(self.test_bucket, f"{self.test_incoming_prefix}/"))
+
     def test_get_buckets_with_subname(self):
         buckets_with_subname_true = self.s3.get_buckets_type(self.test_bucket_subname)
         self.assertTrue(self.test_bucket in buckets_with_subname_true)
@@ -0,0 +1,121 @@
+import gzip
+import io
+import json
+import unittest
+from unittest import mock
+
+import petl
+from botocore.client import ClientError
+
+from parsons import Table
+from parsons.aws.s3_stream import S3RangeReader, S3Source
+from parsons.utilities import files
+from test.utils import assert_matching_tables
+
+
+class FakeS3Client:
+    """Serves ranged get_object requests from a dict of objects."""
+
+    def __init__(self, objects):
+        self.objects = objects
+        self.requests = []
+
+    def get_object(self, Bucket, Key, Range):
+        self.requests.append((Key, Range))
+        data = self.objects[Key]
+
+        start, end = (int(i) for i in Range[len("bytes=") :].split("-"))
+        if start >= len(data):
+            raise ClientError({"Error": {"Code": "InvalidRange"}}, "GetObject")
+
+        body = data[start : end + 1]
+        return {
+            "Body": io.BytesIO(body),
+            "ContentRange": f"bytes {start}-{start + len(body) - 1}/{len(data)}",
+        }
+
+
+class TestS3Stream(unittest.TestCase):
+    def setUp(self):
+        self.tbl = Table([["id", "name"]] + [[str(i), f"name {i}"] for i in range(100)])
+        with open(self.tbl.to_csv(), "rb") as f:
+            self.csv = f.read()
+
+    def test_range_reader(self):
+        client = FakeS3Client({"data.csv": self.csv})
+
+        with S3RangeReader(client, "bucket", "data.csv", chunk_size=100) as reader:
+            self.assertEqual(reader.read(), self.csv)
+
+        self.assertEqual(len(client.requests), -(-len(self.csv) // 100))
+        self.assertEqual(client.requests[1], ("data.csv", "bytes=100-199"))
+
+    def test_range_reader_empty(self):
+        client = FakeS3Client({"empty.csv": b""})
+
+        with S3RangeReader(client, "bucket", "empty.csv") as reader:
+            self.assertEqual(reader.read(), b"")
+
+    def test_source_gzip(self):
+        client = FakeS3Client({"data.csv.gz": gzip.compress(self.csv)})
+        source = S3Source(client, "bucket", "data.csv.gz", chunk_size=64)
+
+        assert_matching_tables(self.tbl, Table(petl.fromcsv(source)))
+
+    def test_source_prefetches_next(self):
+        client = FakeS3Client({"a.csv": self.csv, "b.csv": self.csv})
+        second = S3Source(client, "bucket", "b.csv")
+        first = S3Source(client, "bucket", "a.csv", next_source=second)
+
+        with first.open("rb") as f:
+            f.read()
+
+        self.assertIsNotNone(second._prefetched)
+        with second.open("rb") as f:
+            self.assertEqual(f.read(), self.csv)
+
+        # The prefetched download was used, rather than starting a new one
+        self.assertEqual(client.requests.count(("b.csv", f"bytes=0-{8 * 1024 * 1024 - 1}")), 1)
+
+    def test_source_prefetch_cancelled(self):
+        client = FakeS3Client({"a.csv": self.csv, "b.csv": self.csv})
+        second = S3Source(client, "bucket", "b.csv")
+        first = S3Source(client, "bucket", "a.csv", next_source=second, chunk_size=100)
+
+        # Only the header is read, so the second source is never opened
+        with first.open("rb") as f:
+            f.readline()
+            prefetched = second._prefetched
+
+        self.assertIsNone(second._prefetched)
+        self.assertTrue(prefetched.closed)
+
+    @mock.patch("parsons.aws.S3")
+    def test_from_s3_csv_stream_manifest(self, mock_s3):
+        keys = [f"part_{i}.csv" for i in range(5)]
+        client = FakeS3Client({key: self.csv for key in keys})
+        mock_s3.return_value.client = client
+
+        manifest = {"entries": [{"url": f"s3://bucket/{key}"} for key in keys]}
+        mock_s3.return_value.get_file.return_value = files.string_to_temp_file(
+            json.dumps(manifest), suffix=".json"
+        )
+
+        tbl = Table.from_s3_csv("bucket", "manifest", from_manifest=True, stream=True)
+
+        # Only the first key, and the next one it prefetches, are requested
+        self.assertEqual(tbl[0], {"id": "0", "name": "name 0"})
+        self.assertLessEqual(len({key for key, _ in client.requests}), 2)
+
+        # Each key's header is skipped
+        self.assertEqual(tbl.num_rows, 500)
+        self.assertEqual(tbl.columns, ["id", "name"])
+
+    @mock.patch("parsons.aws.S3")
+    def test_from_s3_csv_stream(self, mock_s3):
+        mock_s3.return_value.client = FakeS3Client({"data.csv.gz": gzip.compress(self.csv)})
+
+        tbl = Table.from_s3_csv("bucket", "data.csv.gz", stream=True)
+
+        assert_matching_tables(self.tbl, tbl)
+        mock_s3.return_value.get_file.assert_not_called()
@@ -1,4 +1,6 @@
+import csv
 import datetime
+import io
 import os
 import shutil
 import tempfile
@@ -9,7 +11,7 @@ from unittest import mock
 import pytest
 
 from parsons import Table
-from parsons.utilities import check_env, files, json_format, sql_helpers
+from parsons.utilities import check_env, csv_stream, files, json_format, sql_helpers
 from parsons.utilities.datetime import date_to_timestamp, parse_date
 
 
@@ -131,6 +133,25 @@ def test_remove_empty_keys():
     assert json_format.remove_empty_keys(test_dict) == {"b": 2}
 
 
+def test_csv_stream():
+    rows = [
+        (i, "a,b" if i % 2 else None, 'quote"d', datetime.date(2020, 1, 1)) for i in range(2500)
+    ]
+
+    expected = io.StringIO()
+    csv.writer(expected).writerows(rows)
+
+    # Read in small pieces, as a database driver would
+    stream = csv_stream.CSVStream(rows)
+    chunks = iter(lambda: stream.read(1000), "")
+    assert "".join(chunks) == expected.getvalue()
+    assert stream.num_rows == 2500
+
+    # Read everything at once
+    assert csv_stream.CSVStream(rows).read() == expected.getvalue()
+    assert csv_stream.CSVStream([]).read(10) == ""
+
+
 def test_redact_credentials():
     # Test with quotes, escape characters, and line breaks
     test_str = """COPY schema.tablename
@@ -0,0 +1,153 @@
+import unittest
+from unittest import mock
+
+import requests_mock
+from requests.exceptions import HTTPError
+
+from parsons.utilities.api_connector import APIConnector
+
+URI = "https://api.test.com/v1/"
+
+
+class TestAPIConnector(unittest.TestCase):
+    def setUp(self):
+        self.connector = APIConnector(URI, headers={"x-api-key": "abc"}, pool_maxsize=4)
+
+    def test_session_is_reused(self):
+        self.assertIs(self.connector.session, self.connector.session)
+
+    def test_session_adapter(self):
+        adapter = self.connector.session.get_adapter(URI)
+        self.assertEqual(adapter._pool_maxsize, 4)
+
+        headers = self.connector.session.headers
+        self.assertEqual(headers["Accept-Encoding"], "gzip, deflate")
+        self.assertEqual(headers["Connection"], "keep-alive")
+
+    @requests_mock.Mocker()
+    def test_get_request(self, m):
+        m.get(URI + "things", json={"id": 1})
+
+        self.assertEqual(self.connector.get_request("things"), {"id": 1})
+
+        request_headers = m.last_request.headers
+        self.assertEqual(request_headers["x-api-key"], "abc")
+        self.assertEqual(request_headers["Accept-Encoding"], "gzip, deflate")
+
+    @requests_mock.Mocker()
+    def test_headers_updated_after_init(self, m):
+        m.get(URI + "things", json={})
+
+        self.connector.headers = {"x-api-key": "def"}
+        self.connector.get_request("things")
+
+        self.assertEqual(m.last_request.headers["x-api-key"], "def")
+
+
+@mock.patch("parsons.utilities.api_connector.time.sleep")
+class TestAPIConnectorRetries(unittest.TestCase):
+    def setUp(self):
+        self.connector = APIConnector(URI, max_retries=2)
+
+    @requests_mock.Mocker()
+    def test_retry_after(self, sleep, m):
+        m.get(
+            URI + "things",
+            [
+                {"status_code": 429, "headers": {"Retry-After": "7"}},
+                {"status_code": 200, "json": {"id": 1}},
+            ],
+        )
+
+        self.assertEqual(self.connector.get_request("things"), {"id": 1})
+        self.assertEqual(m.call_count, 2)
+        self.assertAlmostEqual(sleep.call_args[0][0], 7, places=1)
+
+    @requests_mock.Mocker()
+    def test_retries_exhausted(self, sleep, m):
+        m.get(URI + "things", status_code=503)
+
+        with self.assertRaises(HTTPError):
+            self.connector.get_request("things")
+        self.assertEqual(m.call_count, 3)
+
+    @requests_mock.Mocker()
+    def test_post_not_retried_on_server_error(self, sleep, m):
+        m.post(URI + "things", status_code=503)
+
+        with self.assertRaises(HTTPError):
+            self.connector.post_request("things", json={})
+        self.assertEqual(m.call_count, 1)
+
+    @requests_mock.Mocker()
+    def test_post_retried_when_rate_limited(self, sleep, m):
+        m.post(URI + "things", [{"status_code": 429}, {"status_code": 201, "json": {}}])
+
+        self.assertEqual(self.connector.post_request("things", json={}), {})
+        self.assertEqual(m.call_count, 2)
+
+    @requests_mock.Mocker()
+    def test_retries_disabled(self, sleep, m):
+        m.get(URI + "things", status_code=429)
+
+        self.connector.max_retries = 0
+        with self.assertRaises(HTTPError):
+            self.connector.get_request("things")
+        self.assertEqual(m.call_count, 1)
+        sleep.assert_not_called()
+
+    @requests_mock.Mocker()
+    def test_pause_when_rate_limit_used_up(self, sleep, m):
+        m.get(
+            URI + "things",
+            json={},
+            headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "30"},
+        )
+
+        self.connector.get_request("things")
+        sleep.assert_not_called()
+
+        # The next request waits for the rate limit to reset
+        self.connector.get_request("things")
+        self.assertAlmostEqual(sleep.call_args[0][0], 30, places=1)
+
+    @requests_mock.Mocker()
+    def test_not_retried_when_wait_too_long(self, sleep, m):
+        m.get(URI + "things", status_code=429, headers={"Retry-After": "3600"})
+
+        with self.assertRaises(HTTPError):
+            self.connector.get_request("things")
+        self.assertEqual(m.call_count, 1)
+        sleep.assert_not_called()
+
+    @requests_mock.Mocker()
+    def test_no_pause_for_retry_after_on_success(self, sleep, m):
+        m.get(URI + "things", json={}, headers={"Retry-After": "30"})
+
+        self.connector.get_request("things")
+        self.connector.get_request("things")
+        sleep.assert_not_called()
+
+    @requests_mock.Mocker()
+    def test_pause_capped(self, sleep, m):
+        m.get(
+            URI + "things",
+            json={},
+            headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "3600"},
+        )
+
+        with self.assertLogs("parsons.utilities.api_connector", level="WARNING"):
+            self.connector.get_request("things")
+        self.connector.get_request("things")
+        self.assertAlmostEqual(sleep.call_args[0][0], 300, places=1)
+
+    @requests_mock.Mocker()
+    def test_rate_limit(self, sleep, m):
+        m.get(URI + "things", json={})
+
+        connector = APIConnector(URI, rate_limit=2)
+        for _ in range(3):
+            connector.get_request("things")
+
+        # The first two requests fit in the burst, the third waits for a token
+        self.assertEqual(sleep.call_count, 1)
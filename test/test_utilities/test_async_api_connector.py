@@ -0,0 +1,141 @@
+import asyncio
+import json
+import unittest
+from unittest import mock
+
+import httpx
+from requests.exceptions import HTTPError
+
+from parsons import Table
+from parsons.utilities.async_api_connector import AsyncAPIConnector
+
+URI = "https://api.test.com/v1/"
+
+
+def thing_handler(request):
+    thing_id = request.url.path.rsplit("/", 1)[1]
+    if thing_id == "missing":
+        return httpx.Response(404, json={"error": "not found"})
+    return httpx.Response(200, json={"id": thing_id, "key": request.headers.get("x-api-key")})
+
+
+class FakeFile:
+    """A file-like body that can only be read once, and that httpx can stream."""
+
+    def __init__(self, content):
+        self.content = content
+
+    def read(self):
+        content, self.content = self.content, b""
+        return content
+
+    async def __aiter__(self):
+        yield self.read()
+
+
+class TestAsyncAPIConnector(unittest.TestCase):
+    def setUp(self):
+        self.connector = AsyncAPIConnector(URI, headers={"x-api-key": "abc"})
+
+    def mock_transport(self, handler):
+        self.connector._session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    def run_request(self, coro):
+        async def run():
+            async with self.connector:
+                return await coro
+
+        return asyncio.run(run())
+
+    def test_get_request(self):
+        self.mock_transport(thing_handler)
+
+        result = self.run_request(self.connector.get_request("things/1"))
+        self.assertEqual(result, {"id": "1", "key": "abc"})
+
+    def test_get_request_error(self):
+        self.mock_transport(thing_handler)
+
+        with self.assertRaises(HTTPError) as cm:
+            self.run_request(self.connector.get_request("things/missing"))
+        self.assertIn("Not Found", str(cm.exception))
+
+    def test_post_request(self):
+        def handler(request):
+            return httpx.Response(201, json={"body": request.content.decode()})
+
+        self.mock_transport(handler)
+
+        result = self.run_request(self.connector.post_request("things", json={"a": 1}))
+        self.assertEqual(json.loads(result["body"]), {"a": 1})
+
+        self.mock_transport(handler)
+        result = self.run_request(self.connector.post_request("things", data="raw"))
+        self.assertEqual(result, {"body": "raw"})
+
+    @mock.patch("parsons.utilities.async_api_connector.asyncio.sleep")
+    def test_retry_after(self, sleep):
+        responses = [
+            httpx.Response(429, headers={"Retry-After": "3"}),
+            httpx.Response(200, json={"id": 1}),
+        ]
+        self.mock_transport(lambda request: responses.pop(0))
+
+        self.assertEqual(self.run_request(self.connector.get_request("things/1")), {"id": 1})
+        self.assertAlmostEqual(sleep.call_args[0][0], 3, places=1)
+
+    @mock.patch("parsons.utilities.async_api_connector.asyncio.sleep")
+    def test_file_upload_not_retried(self, sleep):
+        requests = []
+
+        async def handler(request):
+            requests.append(await request.aread())
+            return httpx.Response(429)
+
+        self.mock_transport(handler)
+
+        with self.assertRaises(HTTPError):
+            self.run_request(self.connector.post_request("things", data=FakeFile(b"raw")))
+        self.assertEqual(len(requests), 1)
+        sleep.assert_not_called()
+
+    def test_gather_table(self):
+        self.mock_transport(thing_handler)
+
+        async def get_thing(thing_id):
+            return await self.connector.get_request(f"things/{thing_id}")
+
+        tbl = Table([{"thing_id": i} for i in range(20)])
+        result = self.connector.gather(get_thing, tbl, max_concurrency=5)
+
+        self.assertEqual(result.num_rows, 20)
+        self.assertEqual(result["id"], [str(i) for i in range(20)])
+
+    def test_gather_max_concurrency(self):
+        running = []
+        max_running = []
+
+        async def work(value):
+            running.append(value)
+            max_running.append(len(running))
+            await asyncio.sleep(0.01)
+            running.remove(value)
+            return {"value": value}
+
+        result = self.connector.gather(work, list(range(10)), max_concurrency=3)
+
+        self.assertEqual(result["value"], list(range(10)))
+        self.assertEqual(max(max_running), 3)
+
+    def test_gather_errors(self):
+        self.mock_transport(thing_handler)
+
+        async def get_thing(thing_id):
+            return await self.connector.get_request(f"things/{thing_id}")
+
+        with self.assertRaises(HTTPError):
+            self.connector.gather(get_thing, ["1", "missing", "2"])
+
+        self.mock_transport(thing_handler)
+        result = self.connector.gather(get_thing, ["1", "missing", "2"], raise_on_error=False)
+        self.assertEqual(result["id"], ["1", "2"])
@@ -0,0 +1,44 @@
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import requests_mock
+
+from parsons.utilities.oauth_api_connector import OAuth2APIConnector
+
+URI = "https://api.test.com/v1/"
+TOKEN_URL = "https://auth.test.com/token"
+
+
+class TestOAuth2APIConnector(unittest.TestCase):
+    @requests_mock.Mocker()
+    def test_token_refreshed_once(self, m):
+        def refresh(request, context):
+            # Give the other threads time to find the token expired too
+            time.sleep(0.1)
+            return {"access_token": "new", "refresh_token": "r", "expires_in": 3600}
+
+        m.post(
+            TOKEN_URL,
+            [
+                {"json": {"access_token": "old", "refresh_token": "r", "expires_in": -10}},
+                {"json": refresh},
+            ],
+        )
+        m.get(URI + "things", json={})
+
+        connector = OAuth2APIConnector(URI, "id", "secret", TOKEN_URL, TOKEN_URL)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda _: connector.get_request("things"), range(4)))
+
+        # The first request fetched the token, the second refreshed it
+        token_requests = [r for r in m.request_history if r.url == TOKEN_URL]
+        self.assertEqual(len(token_requests), 2)
+        self.assertEqual(connector.token["access_token"], "new")
+        self.assertTrue(
+            all(
+                r.headers["Authorization"] == "Bearer new"
+                for r in m.request_history
+                if r.url != TOKEN_URL
+            )
+        )
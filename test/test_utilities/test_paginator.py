@@ -0,0 +1,218 @@
+import unittest
+
+import requests_mock
+
+from parsons.utilities.api_connector import APIConnector
+from parsons.utilities.paginator import (
+    CursorPaginator,
+    NextLinkPaginator,
+    OffsetPaginator,
+    PageNumberPaginator,
+    Paginator,
+    get_path,
+)
+
+URI = "https://api.test.com/v1/"
+
+RECORDS = [{"id": i, "name": f"name_{i}"} for i in range(7)]
+
+
+def page_callback(request, context):
+    # Three records per page, by page number
+    page = int(request.qs["page"][0])
+    return {"data": RECORDS[(page - 1) * 3 : page * 3], "total_pages": 3}
+
+
+class TestPaginator(unittest.TestCase):
+    def setUp(self):
+        self.connector = APIConnector(URI)
+
+    def test_get_path(self):
+        self.assertEqual(get_path({"links": {"next": "url"}}, "links.next"), "url")
+        self.assertIsNone(get_path({"links": None}, "links.next"))
+
+    @requests_mock.Mocker()
+    def test_page_number(self, m):
+        m.get(URI + "things", json=page_callback)
+
+        tbl = PageNumberPaginator(self.connector, "things", data_key="data").to_table()
+
+        self.assertEqual(tbl.columns, ["id", "name"])
+        self.assertEqual(tbl["id"], list(range(7)))
+        # Stops at the first empty page
+        self.assertEqual(m.call_count, 4)
+
+    @requests_mock.Mocker()
+    def test_page_number_total_pages(self, m):
+        m.get(URI + "things", json=page_callback)
+
+        paginator = PageNumberPaginator(
+            self.connector, "things", data_key="data", total_pages_key="total_pages"
+        )
+
+        self.assertEqual(sum(len(page) for page in paginator.pages()), 7)
+        self.assertEqual(m.call_count, 3)
+
+    @requests_mock.Mocker()
+    def test_offset(self, m):
+        def callback(request, context):
+            offset, limit = int(request.qs["offset"][0]), int(request.qs["limit"][0])
+            return {"results": RECORDS[offset : offset + limit], "count": 7}
+
+        m.get(URI + "things", json=callback)
+
+        paginator = OffsetPaginator(
+            self.connector, "things", page_size=3, data_key="results", total_key="count"
+        )
+
+        self.assertEqual(paginator.to_table()["id"], list(range(7)))
+        self.assertEqual(m.call_count, 3)
+
+    @requests_mock.Mocker()
+    def test_cursor(self, m):
+        m.get(URI + "things", json={"data": RECORDS[:4], "meta": {"cursor": "abc"}})
+        m.get(URI + "things?cursor=abc", json={"data": RECORDS[4:], "meta": {"cursor": None}})
+
+        paginator = CursorPaginator(
+            self.connector, "things", data_key="data", cursor_key="meta.cursor"
+        )
+
+        self.assertEqual(paginator.to_table()["id"], list(range(7)))
+        self.assertEqual(m.call_count, 2)
+
+    @requests_mock.Mocker()
+    def test_next_link(self, m):
+        m.get(URI + "things", json={"data": RECORDS[:4], "next": URI + "things?page=2"})
+        m.get(URI + "things?page=2", json={"data": RECORDS[4:], "next": None})
+
+        tbl = NextLinkPaginator(self.connector, "things", data_key="data").to_table()
+
+        self.assertEqual(tbl["id"], list(range(7)))
+        self.assertEqual(m.call_count, 2)
+
+    @requests_mock.Mocker()
+    def test_limit(self, m):
+        m.get(URI + "things", json=page_callback)
+
+        tbl = PageNumberPaginator(self.connector, "things", data_key="data", limit=4).to_table()
+
+        self.assertEqual(tbl["id"], list(range(4)))
+        # No more pages are requested once the limit is reached
+        self.assertEqual(m.call_count, 2)
+
+    @requests_mock.Mocker()
+    def test_table_is_lazy(self, m):
+        m.get(URI + "things", json=page_callback)
+
+        tbl = PageNumberPaginator(self.connector, "things", data_key="data").to_table(
+            header=["id", "name"]
+        )
+
+        # Only the first page is requested when the table is created
+        self.assertEqual(m.call_count, 1)
+
+        # Reading the header doesn't request any more pages
+        self.assertEqual(tbl.columns, ["id", "name"])
+        self.assertEqual(m.call_count, 1)
+
+        self.assertEqual(tbl.num_rows, 7)
+        self.assertEqual(m.call_count, 4)
+
+        # Once read, the table is read from disk
+        self.assertEqual(tbl["name"], [record["name"] for record in RECORDS])
+        self.assertEqual(m.call_count, 4)
+
+    @requests_mock.Mocker()
+    def test_header(self, m):
+        m.get(URI + "things", json=page_callback)
+
+        tbl = PageNumberPaginator(self.connector, "things", data_key="data").to_table(
+            header=["name", "missing"]
+        )
+
+        self.assertEqual(tbl.columns, ["name", "missing"])
+        self.assertEqual(tbl[0], {"name": "name_0", "missing": None})
+
+    @requests_mock.Mocker()
+    def test_fields_on_later_pages(self, m):
+        m.get(URI + "things", json={"data": [{"a": 1}], "next": URI + "things?page=2"})
+        m.get(URI + "things?page=2", json={"data": [{"a": 2, "b": "x"}], "next": None})
+
+        tbl = NextLinkPaginator(self.connector, "things", data_key="data").to_table()
+
+        self.assertEqual(tbl.columns, ["a", "b"])
+        self.assertEqual(tbl["b"], [None, "x"])
+        self.assertEqual(m.call_count, 2)
+
+    def test_next_request_required(self):
+        class Incomplete(Paginator):
+            pass
+
+        with self.assertRaises(TypeError):
+            Incomplete(self.connector, "things")
+
+    @requests_mock.Mocker()
+    def test_empty(self, m):
+        m.get(URI + "things", json={"data": []})
+
+        tbl = PageNumberPaginator(self.connector, "things", data_key="data").to_table()
+
+        self.assertEqual(tbl.num_rows, 0)
+        self.assertEqual(m.call_count, 1)
+
+
+class TestConcurrentPageNumberPaginator(unittest.TestCase):
+    def setUp(self):
+        self.connector = APIConnector(URI)
+
+    def paginator(self, **kwargs):
+        return PageNumberPaginator(
+            self.connector,
+            "things",
+            data_key="data",
+            total_pages_key="total_pages",
+            max_workers=3,
+            **kwargs,
+        )
+
+    @requests_mock.Mocker()
+    def test_pages_in_order(self, m):
+        records = [{"id": i} for i in range(50)]
+
+        def callback(request, context):
+            page = int(request.qs["page"][0])
+            return {"data": records[(page - 1) * 2 : page * 2], "total_pages": 25}
+
+        m.get(URI + "things", json=callback)
+
+        self.assertEqual(self.paginator().to_table()["id"], list(range(50)))
+        # No empty page is requested after the last one
+        self.assertEqual(m.call_count, 25)
+
+    @requests_mock.Mocker()
+    def test_limit(self, m):
+        m.get(URI + "things", json=page_callback)
+
+        tbl = self.paginator(page_size=3, limit=4).to_table()
+
+        self.assertEqual(tbl["id"], list(range(4)))
+        self.assertEqual(m.call_count, 2)
+
+    @requests_mock.Mocker()
+    def test_no_total(self, m):
+        # Falls back to requesting one page at a time
+        def callback(request, context):
+            return {"data": page_callback(request, context)["data"]}
+
+        m.get(URI + "things", json=callback)
+
+        self.assertEqual(self.paginator().to_table()["id"], list(range(7)))
+        self.assertEqual(m.call_count, 4)
+
+    @requests_mock.Mocker()
+    def test_fetch_pages(self, m):
+        m.get(URI + "things", json=page_callback)
+
+        pages = list(self.paginator().fetch_pages([3, 1]))
+
+        self.assertEqual(pages, [RECORDS[6:], RECORDS[:3]])
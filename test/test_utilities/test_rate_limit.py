@@ -0,0 +1,81 @@
+import time
+import unittest
+from email.utils import formatdate
+from unittest import mock
+
+from parsons.utilities.rate_limit import (
+    TokenBucket,
+    parse_rate_limit_reset,
+    parse_retry_after,
+    retry_delay,
+)
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst(self):
+        bucket = TokenBucket(rate=1, capacity=3)
+
+        self.assertEqual([bucket.reserve() for _ in range(3)], [0, 0, 0])
+
+    def test_waits_queue_up(self):
+        bucket = TokenBucket(rate=10, capacity=1)
+
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertAlmostEqual(bucket.reserve(), 0.1, places=2)
+        self.assertAlmostEqual(bucket.reserve(), 0.2, places=2)
+
+    def test_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestParseRetryAfter(unittest.TestCase):
+    def test_retry_after_seconds(self):
+        self.assertEqual(parse_retry_after({"Retry-After": "5"}), 5)
+
+    def test_retry_after_date(self):
+        retry_at = formatdate(time.time() + 60, usegmt=True)
+        self.assertAlmostEqual(parse_retry_after({"Retry-After": retry_at}), 60, delta=2)
+
+    def test_no_headers(self):
+        self.assertIsNone(parse_retry_after({}))
+
+
+class TestParseRateLimitReset(unittest.TestCase):
+    def test_rate_limit_reset(self):
+        headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "20"}
+        self.assertEqual(parse_rate_limit_reset(headers), 20)
+
+        headers["X-RateLimit-Reset"] = str(time.time() + 40)
+        self.assertAlmostEqual(parse_rate_limit_reset(headers), 40, delta=2)
+
+    def test_rate_limit_remaining(self):
+        headers = {"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "20"}
+        self.assertIsNone(parse_rate_limit_reset(headers))
+
+    def test_retry_after_ignored(self):
+        self.assertIsNone(parse_rate_limit_reset({"Retry-After": "5"}))
+
+
+class TestRetryDelay(unittest.TestCase):
+    def test_uses_retry_after(self):
+        self.assertEqual(retry_delay({"Retry-After": "5"}, attempt=3, backoff_factor=1), 5)
+
+    def test_uses_rate_limit_reset(self):
+        headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "20"}
+        self.assertEqual(retry_delay(headers, attempt=0, backoff_factor=1, status_code=502), 20)
+
+    @mock.patch("parsons.utilities.rate_limit.random.uniform", side_effect=lambda a, b: b)
+    def test_retry_after_ignored_for_other_errors(self, uniform):
+        headers = {"Retry-After": "5"}
+        self.assertEqual(retry_delay(headers, attempt=0, backoff_factor=1, status_code=502), 1)
+
+    @mock.patch("parsons.utilities.rate_limit.random.uniform", side_effect=lambda a, b: b)
+    def test_exponential_backoff(self, uniform):
+        self.assertEqual([retry_delay({}, attempt, 2) for attempt in range(3)], [2, 4, 8])
+
+    def test_max_backoff(self):
+        self.assertLessEqual(retry_delay({}, attempt=20, backoff_factor=1), 300)
+
+    def test_wait_longer_than_max(self):
+        self.assertIsNone(retry_delay({"Retry-After": "100000"}, attempt=0, backoff_factor=1))
@@ -73,6 +73,25 @@ class TestZoom(unittest.TestCase):
         m.get(ZOOM_URI + "users", json=user_json)
         assert_matching_tables(self.zoom.get_users(), tbl)
 
+    @requests_mock.Mocker()
+    def test_get_users_pages(self, m):
+        def callback(request, context):
+            page = int(request.qs.get("page_number", [1])[0])
+            return {
+                "page_count": 3,
+                "page_number": page,
+                "page_size": 1,
+                "total_records": 3,
+                "users": [{"id": f"user_{page}"}],
+            }
+
+        m.post(ZOOM_AUTH_CALLBACK, json={"access_token": "fakeAccessToken"})
+        m.get(ZOOM_URI + "users", json=callback)
+
+        tbl = self.zoom.get_users()
+        self.assertEqual(tbl["id"], ["user_1", "user_2", "user_3"])
+        self.assertEqual(m.call_count, 3)
+
     @requests_mock.Mocker()
     def test_get_meeting_participants(self, m):
         participants = {